@@ -573,6 +573,29 @@ class AnalyticsManager:
             
             st.markdown(f"<p style='color: {scenario_color}; font-weight: bold; font-size: 1.2rem;'>🚀 Peak ROI: {metrics['mainnet']['presale_fiyat_artisi']:.1f}x ({scenario.upper()})</p>", unsafe_allow_html=True)
     
+    def display_scenario_comparison(self, metrics_by_scenario: Dict[str, Dict]):
+        """🔀 Senaryo karşılaştırma tablosu - bear / base / bull yan yana"""
+        rows = [
+            ('Launch Market Cap', 'launch_mcap', lambda v: f"${v/1e6:.1f}M"),
+            ('Peak Market Cap', 'max_mcap', lambda v: f"${v/1e6:.1f}M"),
+            ('Peak Price', 'max_tahmin_fiyat', lambda v: f"${v:.6f}"),
+            ('Peak Time (Month)', 'max_fiyat_zamani_ay', lambda v: f"{v:.1f}"),
+            ('Final Price', 'final_token_fiyati', lambda v: f"${v:.6f}"),
+            ('Presale ROI', 'presale_fiyat_artisi', lambda v: f"{v:.1f}x"),
+            ('Final Maturity Progress', 'final_maturity_progress', lambda v: f"{v:.1f}%"),
+            ('Max Staking Rate', 'max_staking_orani', lambda v: f"{v*100:.1f}%"),
+            ('Average Market APY', 'ortalama_market_apy', lambda v: f"{v:.1f}%"),
+            ('Total Burned', 'toplam_burned_token', lambda v: f"{v/1e6:.1f}M NXID"),
+            ('Avg User Peak ROI', 'ortalama_kullanici_zirve_roi', lambda v: f"{v:.1f}x"),
+            ('Avg User Final ROI', 'ortalama_kullanici_final_roi', lambda v: f"{v:.1f}x"),
+        ]
+        table = pd.DataFrame({
+            scenario.upper(): [fmt(metrics['mainnet'][key]) if key in metrics.get('mainnet', {}) else '-'
+                               for _, key, fmt in rows]
+            for scenario, metrics in metrics_by_scenario.items()
+        }, index=[label for label, _, _ in rows])
+        st.dataframe(table, use_container_width=True)
+    
     def _display_mainnet_tax_burn_analytics_v6(self, metrics: Dict):
         """🔥 Tax & Burn Analytics """
         st.markdown("### 🔥 Mainnet Tax & Burn Analysis ")
@@ -0,0 +1,249 @@
+"""
+NXID Run Artifact Store
+=======================
+Tamamlanan simülasyonlar diskte içerik adresli olarak saklanır:
+
+    data/runs/<anahtar[:2]>/<anahtar>/
+        manifest.json        - anahtar, senaryo, engine sürümü, dosya listesi
+        config.json          - kanonik config
+        <frame>.parquet      - presale / weekly / vesting / mainnet DataFrame'leri
+        metrics.json         - calculate_enhanced_metrics çıktısı
+        extras.pkl           - monte_carlo / roi_surface / weekly_tracking / population nesneleri
+
+anahtar = sha256(config_hash + senaryo + ENGINE_VERSION). Yazma geçici bir
+klasöre yapılır ve tek bir os.rename ile yayınlanır - aynı volume'u okuyan
+ikinci bir replika yarım yazılmış bir run görmez. Toplam boyut max_bytes'ı
+aşınca en eski erişilen run'lar silinir (LRU, erişim = manifest mtime).
+
+Grafikler saklanmaz: lazy grafik haritası yüklenen frame'lerden kurulur,
+figürler ise figure_cache ile yeniden kullanılır.
+
+Parquet motoru (pyarrow) yoksa DataFrame'ler sıkıştırılmış pickle olarak
+yazılır; format manifest'te kayıtlıdır.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+import uuid
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+from config import EnhancedNXIDConfig
+from models import ENGINE_VERSION
+
+DEFAULT_ROOT = os.path.join(os.environ.get('NXID_DATA_DIR', 'data'), 'runs')
+DEFAULT_MAX_BYTES = int(os.environ.get('NXID_RUN_CACHE_BYTES', 1024 ** 3))
+
+FRAME_KEYS = ('presale_df', 'weekly_token_df', 'vesting_df', 'mainnet_df')
+EXTRA_KEYS = ('monte_carlo', 'roi_surface', 'weekly_tracking', 'population')
+MANIFEST = 'manifest.json'
+TMP_PREFIX = '.tmp-'
+STALE_TMP_SECONDS = 60 * 60  # çöken yazıcıdan kalan geçici klasörler
+
+
+def _parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+FRAME_FORMAT = 'parquet' if _parquet_available() else 'pickle'
+
+
+def run_key(config: EnhancedNXIDConfig, scenario: str, engine_version: str = ENGINE_VERSION) -> str:
+    """İçerik adresi: config + senaryo + engine sürümü"""
+    payload = f"{config.config_hash()}|{scenario}|{engine_version}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"JSON'a çevrilemeyen tip: {type(value).__name__}")
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for folder, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(folder, name))
+            except OSError:
+                pass
+    return total
+
+
+class ArtifactStore:
+    """💾 Disk üzerinde, boyut sınırlı, içerik adresli run cache'i"""
+
+    def __init__(self, root: str = DEFAULT_ROOT, max_bytes: int = DEFAULT_MAX_BYTES,
+                 frame_format: str = FRAME_FORMAT):
+        if frame_format not in ('parquet', 'pickle'):
+            raise ValueError(f"Bilinmeyen frame formatı: {frame_format}")
+        self.root = root
+        self.max_bytes = max_bytes
+        self.frame_format = frame_format
+        self.lock = threading.Lock()
+
+    def run_dir(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def contains(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self.run_dir(key), MANIFEST))
+
+    # === YAZMA ===
+    def _write_frame(self, df: pd.DataFrame, path_base: str, frame_format: str) -> str:
+        if frame_format == 'parquet':
+            path = path_base + '.parquet'
+            df.to_parquet(path, compression='zstd', index=False)
+        else:
+            path = path_base + '.pkl.gz'
+            df.to_pickle(path, compression='gzip')
+        return os.path.basename(path)
+
+    def save(self, key: str, results: Dict, scenario: str) -> bool:
+        """Run'ı atomik olarak yayınla - anahtar zaten varsa (başka replika yazdı) False"""
+        if self.contains(key):
+            return False
+        os.makedirs(self.root, exist_ok=True)
+        tmp_dir = os.path.join(self.root, f"{TMP_PREFIX}{uuid.uuid4().hex}")
+        os.makedirs(tmp_dir)
+        try:
+            frames = {}
+            for name in FRAME_KEYS:
+                if results.get(name) is not None:
+                    frames[name] = self._write_frame(results[name], os.path.join(tmp_dir, name),
+                                                     self.frame_format)
+            with open(os.path.join(tmp_dir, 'metrics.json'), 'w', encoding='utf-8') as f:
+                json.dump(results['metrics'], f, default=_json_default, ensure_ascii=False)
+            with open(os.path.join(tmp_dir, 'extras.pkl'), 'wb') as f:
+                pickle.dump({name: results.get(name) for name in EXTRA_KEYS}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            config = results.get('config')
+            if config is not None:
+                with open(os.path.join(tmp_dir, 'config.json'), 'w', encoding='utf-8') as f:
+                    json.dump(config.canonical_dict(), f, indent=2, ensure_ascii=False)
+            manifest = {'key': key, 'scenario': scenario, 'engine_version': ENGINE_VERSION,
+                        'frame_format': self.frame_format, 'frames': frames,
+                        'computed_at': results.get('computed_at', time.time()),
+                        'saved_at': time.time()}
+            # Manifest en son yazılır: manifest'i olan run her zaman tamdır
+            with open(os.path.join(tmp_dir, MANIFEST), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+
+            final_dir = self.run_dir(key)
+            os.makedirs(os.path.dirname(final_dir), exist_ok=True)
+            try:
+                os.rename(tmp_dir, final_dir)
+            except OSError:
+                # Yarış: başka bir process aynı anahtarı önce yayınladı
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                return False
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        self.evict()
+        return True
+
+    # === OKUMA ===
+    def load(self, key: str, config: Optional[EnhancedNXIDConfig] = None) -> Optional[Dict]:
+        """Run'ı diskten oku (yoksa / bozuksa None) - erişim zamanı LRU için güncellenir"""
+        run_dir = self.run_dir(key)
+        manifest_path = os.path.join(run_dir, MANIFEST)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            results = {}
+            for name, filename in manifest['frames'].items():
+                path = os.path.join(run_dir, filename)
+                if manifest['frame_format'] == 'parquet':
+                    results[name] = pd.read_parquet(path)
+                else:
+                    results[name] = pd.read_pickle(path, compression='gzip')
+            with open(os.path.join(run_dir, 'metrics.json'), 'r', encoding='utf-8') as f:
+                results['metrics'] = json.load(f)
+            with open(os.path.join(run_dir, 'extras.pkl'), 'rb') as f:
+                results.update(pickle.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Bozuk / uyumsuz run - sil, yeniden hesaplansın
+            shutil.rmtree(run_dir, ignore_errors=True)
+            return None
+
+        if config is None and os.path.exists(os.path.join(run_dir, 'config.json')):
+            with open(os.path.join(run_dir, 'config.json'), 'r', encoding='utf-8') as f:
+                config = EnhancedNXIDConfig.from_dict(json.load(f))
+        results['config'] = config
+        results['scenario'] = manifest['scenario']
+        results['computed_at'] = manifest['computed_at']
+        try:
+            os.utime(manifest_path)
+        except OSError:
+            pass
+        return results
+
+    # === LRU TAHLİYE ===
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """(son erişim, boyut, klasör) - en eski erişilen önce"""
+        found = []
+        if not os.path.isdir(self.root):
+            return found
+        for shard in os.listdir(self.root):
+            shard_dir = os.path.join(self.root, shard)
+            if shard.startswith(TMP_PREFIX) or not os.path.isdir(shard_dir):
+                continue
+            for key in os.listdir(shard_dir):
+                run_dir = os.path.join(shard_dir, key)
+                try:
+                    accessed = os.path.getmtime(os.path.join(run_dir, MANIFEST))
+                except OSError:
+                    continue
+                found.append((accessed, _dir_size(run_dir), run_dir))
+        return sorted(found)
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Toplam boyut sınırın altına inene kadar en eski run'ları sil - silinen sayısı"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        removed = 0
+        with self.lock:
+            self._remove_stale_tmp()
+            entries = self.entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, run_dir in entries:
+                if total <= max_bytes:
+                    break
+                shutil.rmtree(run_dir, ignore_errors=True)
+                total -= size
+                removed += 1
+        return removed
+
+    def _remove_stale_tmp(self):
+        if not os.path.isdir(self.root):
+            return
+        cutoff = time.time() - STALE_TMP_SECONDS
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.startswith(TMP_PREFIX):
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        shutil.rmtree(path, ignore_errors=True)
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict[str, float]:
+        entries = self.entries()
+        return {'runs': len(entries), 'bytes': sum(size for _, size, _ in entries),
+                'max_bytes': self.max_bytes, 'frame_format': self.frame_format}
+
+
+DEFAULT_STORE = ArtifactStore()
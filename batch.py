@@ -0,0 +1,297 @@
+"""
+NXID Config Batch Engine
+========================
+N config tek bir NumPy "parametre ekseni" üzerinde birlikte simüle edilir:
+presale ve mainnet durumları (APY, ödül havuzu, mcap_ma, price_ma,
+staking_ma, cumulative_staked...) uzunluğu N olan array'lerdir ve tek bir
+Python gün döngüsü tüm config'leri ilerletir.
+
+Her config kendi seed akışını kullanır (EnhancedTokenomicsModel.make_rng),
+bu yüzden bir config'in sonucu batch'teki diğer config'lerden bağımsızdır
+ve tek başına çalıştırılan modelle aynıdır. Farklı presale süreleri maske ile,
+farklı projeksiyon süreleri gruplama ile çözülür.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+from config import EnhancedNXIDConfig
+from mainnet_lanes import LaneRecorder, mainnet_lane_params, run_mainnet_lanes
+from montecarlo import MonteCarloRecorder, lane_metrics
+from models import EnhancedTokenomicsModel, presale_frame
+from vesting import vesting_params, vesting_table, vested_tokens
+
+PRESALE_SERIES = ('price', 'base_demand', 'price_effect', 'early_bonus', 'volatility', 'apy',
+                  'apy_effect', 'demand', 'sold', 'rewards_paid', 'remaining_pool')
+
+
+def config_array(configs: Sequence[EnhancedNXIDConfig], name: str, dtype=float) -> np.ndarray:
+    """Config alanı -> (N,) array"""
+    return np.array([getattr(cfg, name) for cfg in configs], dtype=dtype)
+
+
+@dataclass
+class PresaleBatch:
+    """N config'in presale serileri - (gün, config) array'leri, bitiş sonrası günler geçersiz"""
+    configs: List[EnhancedNXIDConfig]
+    n_days: np.ndarray                  # config başına gerçekleşen presale günü
+    ended: np.ndarray                   # token limiti ile erken bitti mi
+    series: Dict[str, np.ndarray]       # PRESALE_SERIES -> (max_gün, N)
+
+    @property
+    def size(self) -> int:
+        return len(self.configs)
+
+    @property
+    def final_price(self) -> np.ndarray:
+        return self.series['price'][self.n_days - 1, np.arange(self.size)]
+
+    @property
+    def total_sold(self) -> np.ndarray:
+        # Tek config motorundaki np.cumsum ile aynı sıralı toplam
+        return np.cumsum(self.series['sold'], axis=0)[self.n_days - 1, np.arange(self.size)]
+
+    @property
+    def total_raised(self) -> np.ndarray:
+        return np.cumsum(self.series['demand'], axis=0)[self.n_days - 1, np.arange(self.size)]
+
+    def frame(self, index: int) -> pd.DataFrame:
+        """Tek config'in presale DataFrame'i (simulate_presale_phase çıktısıyla aynı kolonlar)"""
+        span = slice(0, int(self.n_days[index]))
+        return presale_frame(self.configs[index],
+                             {name: values[span, index] for name, values in self.series.items()},
+                             bool(self.ended[index]))
+
+
+def simulate_presale_batch(configs: Sequence[EnhancedNXIDConfig]) -> PresaleBatch:
+    """🧮 Presale fazı N config için - APY / havuz yinelemesi (N,) array'leri ile tek döngü"""
+    configs = list(configs)
+    n_configs = len(configs)
+    presale_days = config_array(configs, 'presale_days', np.int64)
+    max_days = int(presale_days.max())
+    total_supply = config_array(configs, 'total_supply')
+    tokens_for_sale = total_supply * (config_array(configs, 'presale_allocation') / 100)
+    start_price = config_array(configs, 'start_price_usdt')
+
+    # === KAPALI FORM SERİLER (gün, config) ===
+    days = np.arange(max_days)[:, None]
+    price = start_price * ((1 + config_array(configs, 'daily_price_increase') / 100) ** days)
+    base_demand = config_array(configs, 'base_daily_demand_usdt') * (config_array(configs, 'demand_growth_rate') ** days)
+    price_effect = np.clip((1 / (price / start_price)) ** config_array(configs, 'price_resistance_factor'), 0.3, 2.0)
+    early_bonus = np.where(days < 30, config_array(configs, 'early_bird_bonus'), 1.0)
+    volatility = np.ones((max_days, n_configs))
+    for index, cfg in enumerate(configs):
+        rng = EnhancedTokenomicsModel(cfg).make_rng('presale')
+        volatility[:presale_days[index], index] = np.clip(
+            1 + rng.normal(0, cfg.demand_volatility * 0.5, presale_days[index]), 0.98, 1.02)
+    demand_ex_apy = base_demand * price_effect * early_bonus * volatility
+
+    # === SIRALI APY / HAVUZ YİNELEMESİ - config ekseni vektörel ===
+    max_apy = config_array(configs, 'max_apy')
+    min_apy = config_array(configs, 'minimum_staking_apy')
+    apy_gain = config_array(configs, 'apy_demand_multiplier') - 1
+    max_boost = config_array(configs, 'max_apy_boost')
+
+    outputs = {name: np.zeros((max_days, n_configs))
+               for name in ('apy', 'apy_effect', 'demand', 'sold', 'rewards_paid', 'remaining_pool')}
+    pool = total_supply * (config_array(configs, 'presale_staking_pool') / 100)
+    principal = np.zeros(n_configs)
+    n_days = presale_days.copy()
+    ended = np.zeros(n_configs, dtype=bool)
+    running = np.ones(n_configs, dtype=bool)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for day in range(max_days):
+            running &= day < presale_days
+            if not running.any():
+                break
+            day_remaining = np.maximum(1, presale_days - day)
+
+            dynamic_apy = np.maximum(np.minimum(pool / day_remaining / principal * 365 * 100, max_apy), min_apy)
+            current_apy = np.where((principal > 0) & (pool > 0), dynamic_apy, max_apy if day == 0 else min_apy)
+
+            effect = np.minimum(1 + (current_apy / max_apy * apy_gain), max_boost)
+            day_demand = demand_ex_apy[day] * effect
+            day_price = price[day]
+            day_sold = day_demand / day_price
+
+            remaining_sale_tokens = tokens_for_sale - principal
+            ended_today = running & (day_sold > remaining_sale_tokens)
+            day_sold = np.where(ended_today, np.maximum(0, remaining_sale_tokens), day_sold)
+            day_demand = np.where(ended_today, day_sold * day_price, day_demand)
+
+            new_principal = principal + day_sold
+            day_rewards = np.where((new_principal > 0) & (pool > 0),
+                                   np.minimum(new_principal * (current_apy / 100 / 365), pool), 0.0)
+
+            principal = np.where(running, new_principal, principal)
+            pool = np.where(running, pool - day_rewards, pool)
+            for name, value in (('apy', current_apy), ('apy_effect', effect), ('demand', day_demand),
+                                ('sold', day_sold), ('rewards_paid', day_rewards), ('remaining_pool', pool)):
+                outputs[name][day] = np.where(running, value, 0.0)
+
+            n_days = np.where(ended_today, day + 1, n_days)
+            ended |= ended_today
+            running &= ~ended_today
+
+    series = {'price': price, 'base_demand': base_demand, 'price_effect': price_effect,
+              'early_bonus': early_bonus, 'volatility': volatility, **outputs}
+    return PresaleBatch(configs=configs, n_days=n_days, ended=ended,
+                        series={name: series[name] for name in PRESALE_SERIES})
+
+
+def vesting_circulating_batch(configs: Sequence[EnhancedNXIDConfig], fallback: np.ndarray) -> np.ndarray:
+    """(N, max_ay) aylık dolaşım arzı - kısa projeksiyonlar son değerle uzatılır
+
+    Mainnet'in int(ay) indeksi listenin sonunda sabitlendiği için uzatma tek
+    config davranışıyla aynıdır; vesting projeksiyonu olmayan config fallback
+    (presale'de satılan token) kullanır.
+    """
+    months_count = config_array(configs, 'vesting_analysis_months', np.int64)
+    max_months = max(1, int(months_count.max()))
+    params = np.stack([vesting_params(vesting_table(cfg.get_vesting_allocations())) for cfg in configs])
+    total_supply = config_array(configs, 'total_supply')[:, None, None]
+    vested = vested_tokens(params[:, 0], params[:, 1], params[:, 2], params[:, 3], params[:, 4],
+                           np.arange(max_months), total_supply)
+    # Tahsisler soldan sağa toplanır - vesting_schedule_frame ile birebir
+    circulating = np.zeros(vested.shape[:2])
+    for allocation in range(vested.shape[-1]):
+        circulating = circulating + vested[..., allocation]
+    index = np.minimum(np.arange(max_months), np.maximum(months_count, 1)[:, None] - 1)
+    circulating = np.take_along_axis(circulating, index, axis=1)
+    return np.where(months_count[:, None] > 0, circulating, np.asarray(fallback, dtype=float)[:, None])
+
+
+class _BatchCirculating:
+    """gün -> (L,) vesting dolaşım arzı; config başına basamak ya da günlük interpolasyon"""
+
+    def __init__(self, monthly: np.ndarray, interpolate: np.ndarray):
+        self.monthly = np.ascontiguousarray(monthly.T)   # (ay, L) - gün başına tek satır okunur
+        self.interpolate = interpolate
+        self.last = self.monthly.shape[0] - 1
+
+    def __call__(self, day: int) -> np.ndarray:
+        months = day / 30.44
+        month = min(self.last, int(months))
+        step = self.monthly[month]
+        if not self.interpolate.any():
+            return step
+        fraction = months - month
+        # np.interp ile aynı: slope * (x - xp[j]) + fp[j], tam ay noktalarında fp[j]
+        following = self.monthly[min(self.last, month + 1)]
+        interpolated = step if fraction == 0 else (following - step) * fraction + step
+        return np.where(self.interpolate, interpolated, step)
+
+
+class _StreamNoise:
+    """Config başına bağımsız mainnet akışı - block_days günlük bloklar halinde çekilir"""
+
+    def __init__(self, configs: Sequence[EnhancedNXIDConfig], paths_per_config: int, block_days: int = 64):
+        self.rngs = [EnhancedTokenomicsModel(cfg).make_rng('mainnet') for cfg in configs]
+        self.paths = paths_per_config
+        self.block_days = block_days
+        self.block_start = 0
+        self.block = np.empty((0, len(self.rngs) * paths_per_config))
+
+    def __call__(self, day: int) -> np.ndarray:
+        if day >= self.block_start + len(self.block):
+            self.block_start = day
+            block = np.empty((self.block_days, len(self.rngs), self.paths))
+            for index, rng in enumerate(self.rngs):
+                block[:, index] = rng.standard_normal((self.block_days, self.paths))
+            self.block = block.reshape(self.block_days, -1)
+        return self.block[day - self.block_start]
+
+
+def stack_lane_params(param_list: Sequence[Dict], repeat: int = 1) -> Dict:
+    """Config başına lane parametreleri -> lane ekseni array'leri (tüm config'lerde aynıysa skaler kalır)"""
+    stacked = {}
+    for name in param_list[0]:
+        values = [params[name] for params in param_list]
+        first = np.asarray(values[0])
+        if all(np.array_equal(first, value) for value in values[1:]):
+            stacked[name] = values[0]
+            continue
+        try:
+            array = np.array(values)
+        except ValueError:
+            raise ValueError(f"Batch'te '{name}' uzunlukları farklı - aynı projeksiyon süresi gerekli")
+        stacked[name] = np.repeat(array, repeat, axis=0)
+    return stacked
+
+
+def simulate_mainnet_batch(configs: Sequence[EnhancedNXIDConfig], presale: PresaleBatch,
+                           scenario: Union[str, Sequence[str]] = "base", recorder: Optional[LaneRecorder] = None,
+                           paths_per_config: int = 1) -> LaneRecorder:
+    """🚀 Mainnet fazı N config (× paths_per_config yol) için tek gün döngüsü
+
+    Lane sırası: config 0'ın yolları, config 1'in yolları, ... Tüm config'lerin
+    projeksiyon süresi aynı olmalı (simulate_batch gruplar). scenario tek isim
+    ya da config başına bir isim olabilir (senaryo kütüphanesi, bkz. scenarios.py).
+    """
+    configs = list(configs)
+    scenarios = [scenario] * len(configs) if isinstance(scenario, str) else list(scenario)
+    if len(scenarios) != len(configs):
+        raise ValueError("simulate_mainnet_batch: config başına bir senaryo gerekli")
+    projection_days = {int(cfg.projection_months * 30.44) for cfg in configs}
+    if len(projection_days) != 1:
+        raise ValueError("simulate_mainnet_batch: tüm config'lerin projection_months değeri aynı olmalı")
+    n_days = projection_days.pop()
+    n_lanes = len(configs) * paths_per_config
+
+    params = stack_lane_params([mainnet_lane_params(cfg, name) for cfg, name in zip(configs, scenarios)],
+                               paths_per_config)
+    monthly = vesting_circulating_batch(configs, presale.total_sold)
+    interpolate = config_array(configs, 'vesting_daily_interpolation', bool)
+    circulating = _BatchCirculating(np.repeat(monthly, paths_per_config, axis=0),
+                                    np.repeat(interpolate, paths_per_config))
+    final_price = np.repeat(presale.final_price, paths_per_config)
+
+    return run_mainnet_lanes(params, final_price, circulating, n_days, n_lanes,
+                             _StreamNoise(configs, paths_per_config), recorder or MonteCarloRecorder(()))
+
+
+@dataclass
+class BatchResult:
+    """simulate_batch çıktısı - config başına headline metrikler"""
+    configs: List[EnhancedNXIDConfig]
+    scenario: str
+    presale: PresaleBatch
+    metrics: pd.DataFrame
+
+    def config_metrics(self, index: int) -> Dict:
+        """index'inci config'in metrikleri - Python tipleriyle (metrics.iloc satırı int kolonları float'a çevirir)"""
+        return {name: column.iloc[index].item() for name, column in self.metrics.items()}
+
+
+def simulate_batch(configs: Sequence[EnhancedNXIDConfig], scenario: str = "base") -> BatchResult:
+    """🧪 Presale + vesting + mainnet - N config tek seferde, satır başına headline metrikler
+
+    Projeksiyon süresi farklı config'ler ayrı gruplarda (her grup tek gün döngüsü) çalışır.
+    """
+    configs = list(configs)
+    presale = simulate_presale_batch(configs)
+    final_price = presale.final_price
+
+    groups: Dict[int, List[int]] = {}
+    for index, cfg in enumerate(configs):
+        groups.setdefault(int(cfg.projection_months * 30.44), []).append(index)
+
+    frames = []
+    for indices in groups.values():
+        group_presale = PresaleBatch(configs=[configs[i] for i in indices], n_days=presale.n_days[indices],
+                                     ended=presale.ended[indices],
+                                     series={name: values[:, indices] for name, values in presale.series.items()})
+        recorder = simulate_mainnet_batch(group_presale.configs, group_presale, scenario)
+        frame = lane_metrics(recorder, config_array(group_presale.configs, 'maturity_target_mcap'),
+                             final_price[indices])
+        frame.index = indices
+        frames.append(frame)
+
+    metrics = pd.concat(frames).sort_index()
+    metrics.insert(0, 'satilan_token', presale.total_sold)
+    metrics.insert(0, 'toplam_toplanan_usdt', presale.total_raised)
+    metrics.insert(0, 'final_presale_fiyati', final_price)
+    metrics.insert(0, 'presale_gun_sayisi', presale.n_days.astype(np.int64))  # tek run'daki gibi int
+    return BatchResult(configs=configs, scenario=scenario, presale=presale, metrics=metrics)
@@ -0,0 +1,62 @@
+"""
+NXID Config Batch Benchmark
+===========================
+N config: tek tek model çalıştırma vs parametre eksenli batch motoru
+
+    python benchmarks/bench_batch.py
+    python benchmarks/bench_batch.py --configs 100 1000 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from batch import simulate_batch
+from config import EnhancedNXIDConfig
+from models import EnhancedTokenomicsModel
+
+
+def random_configs(n: int, seed: int = 1):
+    rng = np.random.default_rng(seed)
+    return [EnhancedNXIDConfig(mainnet_tax_rate=float(rng.uniform(0, 10)),
+                               base_staking_apy=float(rng.uniform(40, 200)),
+                               presale_days=int(rng.integers(90, 270)),
+                               price_velocity_window=int(rng.integers(5, 60)))
+            for _ in range(n)]
+
+
+def run_sequential(configs, scenario):
+    for config in configs:
+        model = EnhancedTokenomicsModel(config)
+        presale_df = model.simulate_presale_phase()
+        vesting_df = model.calculate_individual_vesting_schedules()
+        model.simulate_mainnet_phase(presale_df, vesting_df, scenario)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Config batch benchmark")
+    parser.add_argument("--configs", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--scenario", default="base")
+    args = parser.parse_args()
+
+    print(f"{'configs':>8} {'tek tek s':>10} {'batch s':>9} {'hızlanma':>9}")
+    for n in args.configs:
+        configs = random_configs(n)
+        sample = configs[:min(n, 50)]
+        start = time.perf_counter()
+        run_sequential(sample, args.scenario)
+        sequential = (time.perf_counter() - start) * n / len(sample)   # 50 config'ten ölçeklenir
+        start = time.perf_counter()
+        simulate_batch(configs, args.scenario)
+        batched = time.perf_counter() - start
+        print(f"{n:>8} {sequential:>10.2f} {batched:>9.2f} {sequential / batched:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
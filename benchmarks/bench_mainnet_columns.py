@@ -0,0 +1,114 @@
+"""
+NXID Mainnet Columnar Buffer Benchmark
+======================================
+simulate_mainnet_phase gecikme ve tepe bellek ölçümü - 48 / 120 / 240 ay
+
+Kolonlu motor (önceden ayrılmış NumPy buffer) ile eski gün başına dict
+stratejisinin çıktı oluşturma maliyeti karşılaştırılır. --ref ile git'teki
+eski bir models.py sürümü de aynı koşullarda ölçülebilir:
+
+    python benchmarks/bench_mainnet_columns.py
+    python benchmarks/bench_mainnet_columns.py --ref HEAD~1
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import importlib.util
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import EnhancedNXIDConfig
+from models import EnhancedTokenomicsModel, MAINNET_COLUMNS
+
+HORIZONS = (48, 120, 240)
+
+
+def load_models_from_ref(ref: str):
+    """git ref'teki models.py'yi ayrı bir modül olarak yükle"""
+    source = subprocess.check_output(["git", "show", f"{ref}:models.py"], cwd=ROOT)
+    tmp_dir = tempfile.mkdtemp(prefix="nxid_bench_")
+    path = os.path.join(tmp_dir, "models_ref.py")
+    with open(path, "wb") as f:
+        f.write(source)
+    spec = importlib.util.spec_from_file_location("models_ref", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.EnhancedTokenomicsModel
+
+
+def measure(fn, repeats: int):
+    """En iyi süre (s) ve tepe bellek (byte)"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def row_dict_assembly(columns: dict, n_days: int):
+    """Eski strateji: her gün için dict oluştur, sonunda DataFrame'e çevir"""
+    rows = []
+    for day in range(n_days):
+        rows.append({name: values[day] for name, values in columns.items()})
+    return pd.DataFrame(rows)
+
+
+def run(repeats: int, ref: str = None):
+    ref_model_cls = load_models_from_ref(ref) if ref else None
+
+    header = f"{'months':>6} {'days':>6} {'columnar ms':>12} {'peak MB':>9} {'row-dict ms':>12} {'peak MB':>9}"
+    if ref_model_cls:
+        header += f" {ref + ' ms':>14} {'peak MB':>9}"
+    print(header)
+
+    for months in HORIZONS:
+        config = EnhancedNXIDConfig(projection_months=months)
+        model = EnhancedTokenomicsModel(config)
+        presale_df = model.simulate_presale_phase()
+        vesting_df = model.calculate_individual_vesting_schedules()
+
+        def columnar():
+            EnhancedTokenomicsModel(config).simulate_mainnet_phase(presale_df, vesting_df, "base")
+
+        mainnet_df = EnhancedTokenomicsModel(config).simulate_mainnet_phase(presale_df, vesting_df, "base")
+        columns = {name: mainnet_df[name].tolist() for name in MAINNET_COLUMNS}
+        n_days = len(mainnet_df)
+
+        col_time, col_peak = measure(columnar, repeats)
+        row_time, row_peak = measure(lambda: row_dict_assembly(columns, n_days), repeats)
+        line = (f"{months:>6} {n_days:>6} {col_time * 1e3:>12.1f} {col_peak / 1e6:>9.2f} "
+                f"{row_time * 1e3:>12.1f} {row_peak / 1e6:>9.2f}")
+
+        if ref_model_cls:
+            ref_time, ref_peak = measure(
+                lambda: ref_model_cls(config).simulate_mainnet_phase(presale_df, vesting_df, "base"), repeats)
+            line += f" {ref_time * 1e3:>14.1f} {ref_peak / 1e6:>9.2f}"
+        print(line)
+
+    print("\ncolumnar = tüm mainnet simülasyonu (kolonlu buffer ile)")
+    print("row-dict = sadece eski dict-per-gün çıktı oluşturma maliyeti (simülasyon hariç)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mainnet kolonlu buffer benchmark")
+    parser.add_argument("--repeats", type=int, default=3, help="Tekrar sayısı (en iyi süre raporlanır)")
+    parser.add_argument("--ref", default=None, help="Karşılaştırma için git ref (örn. HEAD~1)")
+    args = parser.parse_args()
+    run(args.repeats, args.ref)
+
+
+if __name__ == "__main__":
+    main()
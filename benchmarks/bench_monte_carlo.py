@@ -0,0 +1,58 @@
+"""
+NXID Mainnet Monte Carlo Benchmark
+==================================
+Yol ekseni vektörel Monte Carlo süresi ve tepe bellek - 100 / 1.000 / 10.000 yol
+
+    python benchmarks/bench_monte_carlo.py
+    python benchmarks/bench_monte_carlo.py --paths 1000 10000 --months 120
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import EnhancedNXIDConfig
+from models import EnhancedTokenomicsModel
+from montecarlo import run_mainnet_monte_carlo
+
+
+def run(paths, months: int, scenario: str):
+    config = EnhancedNXIDConfig(projection_months=months)
+    model = EnhancedTokenomicsModel(config)
+    presale_df = model.simulate_presale_phase()
+    vesting_df = model.calculate_individual_vesting_schedules()
+
+    start = time.perf_counter()
+    model.simulate_mainnet_phase(presale_df, vesting_df, scenario)
+    single = time.perf_counter() - start
+    print(f"tek deterministik yol: {single * 1e3:.1f} ms ({months} ay)")
+
+    print(f"{'paths':>7} {'seconds':>9} {'ms/path':>9} {'peak MB':>9}")
+    for n_paths in paths:
+        start = time.perf_counter()
+        run_mainnet_monte_carlo(config, presale_df, vesting_df, scenario, n_paths=n_paths, seed=1)
+        elapsed = time.perf_counter() - start
+        # Bellek ayrı bir çalıştırmada ölçülür (tracemalloc süreyi şişirir)
+        tracemalloc.start()
+        run_mainnet_monte_carlo(config, presale_df, vesting_df, scenario, n_paths=n_paths, seed=1)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{n_paths:>7} {elapsed:>9.2f} {elapsed / n_paths * 1e3:>9.3f} {peak / 1e6:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mainnet Monte Carlo benchmark")
+    parser.add_argument("--paths", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--months", type=int, default=48)
+    parser.add_argument("--scenario", default="base", choices=["base", "bear", "bull"])
+    args = parser.parse_args()
+    run(args.paths, args.months, args.scenario)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+NXID Simulation Service Load Test
+=================================
+Servis aynı process'te (ayrı thread) başlatılır; 1 / 4 / 16 eşzamanlı istemci
+her biri sırayla POST /simulate gönderir.
+
+- unique: her istek farklı config (tamamı hesaplanır - pool throughput'u)
+- repeat: az sayıda config tekrar tekrar (dedupe + cache)
+
+    python benchmarks/bench_service.py
+    python benchmarks/bench_service.py --clients 1 4 16 --requests 64 --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from service import create_server
+
+
+def post(url: str, payload: dict) -> int:
+    request = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'),
+                                     headers={'Content-Type': 'application/json'}, method='POST')
+    while True:
+        try:
+            with urllib.request.urlopen(request, timeout=300) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            if e.code != 503:
+                return e.code
+            time.sleep(float(e.headers.get('Retry-After', 1)) * 0.1)
+
+
+def run_load(url: str, payloads, clients: int):
+    latencies = []
+    lock = threading.Lock()
+    cursor = iter(range(len(payloads)))
+
+    def client():
+        while True:
+            with lock:
+                index = next(cursor, None)
+            if index is None:
+                return
+            start = time.perf_counter()
+            status = post(url, payloads[index])
+            with lock:
+                latencies.append((time.perf_counter() - start, status))
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    times = np.array([latency for latency, _ in latencies])
+    errors = sum(status != 200 for _, status in latencies)
+    return len(payloads) / elapsed, np.percentile(times, 50), np.percentile(times, 95), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation service load test")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=48)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    server = create_server("127.0.0.1", 0, max_workers=args.workers)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/simulate"
+    print(f"worker: {server.service.max_workers}, istek/tur: {args.requests}")
+
+    rng = np.random.default_rng(7)
+    print(f"{'mod':>7} {'istemci':>8} {'istek/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'hata':>5}")
+    for mode in ("unique", "repeat"):
+        for clients in args.clients:
+            if mode == "unique":
+                payloads = [{'config': {'mainnet_tax_rate': float(rng.uniform(0, 10))}, 'scenario': 'base',
+                             'series': True} for _ in range(args.requests)]
+            else:
+                taxes = rng.uniform(0, 10, 4)
+                payloads = [{'config': {'mainnet_tax_rate': float(taxes[i % 4])}, 'scenario': 'base',
+                             'series': True} for i in range(args.requests)]
+            throughput, p50, p95, errors = run_load(url, payloads, clients)
+            print(f"{mode:>7} {clients:>8} {throughput:>9.1f} {p50 * 1000:>8.1f} {p95 * 1000:>8.1f} {errors:>5}")
+
+    print(json.dumps(server.service.stats()))
+    server.shutdown()
+    server.service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
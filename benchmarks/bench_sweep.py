@@ -0,0 +1,53 @@
+"""
+NXID Parameter Sweep Benchmark
+==============================
+Process pool üzerinde latin hypercube taraması - nokta / saat hızı
+
+    python benchmarks/bench_sweep.py
+    python benchmarks/bench_sweep.py --points 2000 --workers 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sweep import config_samples, run_sweep
+
+RANGES = {
+    'mainnet_tax_rate': (0.0, 10.0),
+    'base_staking_apy': (40.0, 200.0),
+    'presale_days': (90, 270),
+    'maturity_damping_strength': (0.1, 0.9),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parameter sweep benchmark")
+    parser.add_argument("--points", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    args = parser.parse_args()
+
+    points = config_samples(RANGES, args.points, seed=1)
+    last = [0.0]
+
+    def progress(done, total):
+        now = time.perf_counter()
+        if now - last[0] > 2 or done == total:
+            last[0] = now
+            print(f"  {done:>6}/{total}", flush=True)
+
+    start = time.perf_counter()
+    sweep_df = run_sweep(points, max_workers=args.workers, chunk_size=args.chunk_size, progress=progress)
+    elapsed = time.perf_counter() - start
+    failed = int(sweep_df['hata'].notna().sum())
+    print(f"{args.points} nokta, {elapsed:.1f}s -> {args.points / elapsed * 3600:,.0f} nokta/saat "
+          f"({failed} hatalı, {os.cpu_count()} CPU)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+NXID Headless CLI
+=================
+Streamlit / Plotly olmadan simülasyon - cron, CI ve batch pipeline'lar için.
+
+    python cli.py run --config nxid_enhanced_config_v6.json --scenario base bear bull --out out/
+    python cli.py run --set mainnet_tax_rate=5 --set projection_months=120 --population --out out/
+    python cli.py montecarlo --paths 5000 --seed 7 --scenario bull --out out/
+    python cli.py sweep --grid '{"mainnet_tax_rate": [1, 3, 5]}' --workers 4 --out out/
+    python cli.py sweep --sample base_staking_apy=40:200 --sample presale_days=90:270 --points 500 --out out/
+    python cli.py library --out out/
+
+Çıktılar: zaman serileri csv / parquet, metrikler JSON. Exit kodu: 0 başarılı,
+1 geçersiz config / simülasyon hatası, 2 hatalı argüman.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+import pandas as pd
+from config import EnhancedNXIDConfig
+
+logger = logging.getLogger("nxid.cli")
+
+FRAME_FILES = (('presale', 'presale'), ('weekly', 'weekly_tokens'), ('vesting', 'vesting'), ('mainnet', 'mainnet'))
+
+
+class CLIArgumentError(ValueError):
+    """Hatalı komut argümanı - exit 2 (simülasyon hataları exit 1)"""
+
+
+def parse_overrides(items: Sequence[str]) -> Dict:
+    """'alan=değer' listesi -> override dict (değer JSON ise listeler / bool'lar da olur)"""
+    from sweep import config_field_types
+
+    field_types = config_field_types()
+    known = set(EnhancedNXIDConfig.__dataclass_fields__)
+    overrides = {}
+    for item in items:
+        name, separator, raw = item.partition('=')
+        if not separator or name not in known:
+            raise ValueError(f"Geçersiz override: {item!r} (alan=değer, bilinen config alanı)")
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            value = raw
+        kind = field_types.get(name)
+        if kind in (int, float) and not isinstance(value, bool):
+            value = kind(value)
+        elif kind is bool and isinstance(value, str):
+            value = value.lower() in ('1', 'true', 'yes', 'evet')
+        overrides[name] = value
+    return overrides
+
+
+def load_config(path: Optional[str], overrides: Sequence[str]) -> EnhancedNXIDConfig:
+    """Config JSON'u (yoksa default) + --set override'ları"""
+    data = EnhancedNXIDConfig().to_dict()
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            data.update(json.load(f))
+    data.update(parse_overrides(overrides))
+    return EnhancedNXIDConfig.from_dict(data)
+
+
+def config_errors(config: EnhancedNXIDConfig) -> List[str]:
+    errors = []
+    if not config.validate_distribution():
+        errors.append("token dağılımı toplamı %100 değil")
+    if not config.validate_tax_distribution():
+        errors.append("tax dağılımı toplamı %100 değil")
+    if not config.validate_enhanced_parameters():
+        errors.append("enhanced parametreler geçersiz")
+    return errors
+
+
+def write_frame(df: pd.DataFrame, path_base: str, fmt: str) -> str:
+    path = f"{path_base}.{fmt}"
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+    return path
+
+
+def _json_default(value):
+    if hasattr(value, 'item'):
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"JSON'a çevrilemeyen tip: {type(value).__name__}")
+
+
+def write_json(data, path: str) -> str:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+    return path
+
+
+# === KOMUTLAR ===
+def cmd_run(args, config: EnhancedNXIDConfig) -> int:
+    """Senaryolar: presale / weekly / vesting bir kez, mainnet senaryo başına"""
+    from pipeline import SimulationPipeline
+    from sweep import flatten_metrics
+
+    stages = ['presale', 'weekly', 'vesting', 'mainnet', 'metrics']
+    if args.population:
+        stages.append('population')
+    runs = SimulationPipeline().run_scenarios(config, tuple(args.scenario), stages=tuple(stages),
+                                              max_workers=args.workers)
+    summary = []
+    failed = False
+    for scenario, run in runs.items():
+        folder = os.path.join(args.out, scenario)
+        os.makedirs(folder, exist_ok=True)
+        for stage, filename in FRAME_FILES:
+            print(write_frame(run[stage], os.path.join(folder, filename), args.format))
+        metrics = run['metrics']
+        if 'error' in metrics:
+            logger.error(f"{scenario}: metrik hesaplama hatası: {metrics['error']}")
+            failed = True
+        if args.population:
+            population = run['population']
+            metrics = {**metrics, 'populasyon': population.metrics}
+            print(write_frame(population.roi_bands, os.path.join(folder, 'population_roi_bands'), args.format))
+        print(write_json(metrics, os.path.join(folder, 'metrics.json')))
+        summary.append({'senaryo': scenario, **flatten_metrics(metrics)})
+    print(write_frame(pd.DataFrame(summary), os.path.join(args.out, 'summary'), args.format))
+    return 1 if failed else 0
+
+
+def cmd_montecarlo(args, config: EnhancedNXIDConfig) -> int:
+    """Monte Carlo bantları + yol başına metrikler"""
+    from pipeline import SimulationPipeline
+    from montecarlo import run_mainnet_monte_carlo
+
+    shared = SimulationPipeline().run(config, stages=('presale', 'vesting'))
+    for scenario in args.scenario:
+        result = run_mainnet_monte_carlo(config, shared['presale'], shared['vesting'], scenario,
+                                         n_paths=args.paths or config.monte_carlo_paths,
+                                         seed=args.seed if args.seed is not None else config.monte_carlo_seed)
+        folder = os.path.join(args.out, scenario)
+        os.makedirs(folder, exist_ok=True)
+        for name, band in result.bands.items():
+            print(write_frame(band, os.path.join(folder, f'monte_carlo_{name}'), args.format))
+        print(write_frame(result.path_metrics, os.path.join(folder, 'monte_carlo_paths'), args.format))
+        print(write_frame(result.summary.reset_index(), os.path.join(folder, 'monte_carlo_summary'), args.format))
+        logger.info(f"{scenario}: {result.n_paths:,} yol {result.elapsed_seconds:.2f}s")
+    return 0
+
+
+def cmd_sweep(args, config: EnhancedNXIDConfig) -> int:
+    """Grid (--grid) ya da Latin hypercube (--sample) parametre taraması"""
+    from sweep import config_grid, config_samples, run_sweep
+
+    if bool(args.grid) == bool(args.sample):
+        raise CLIArgumentError("sweep: --grid ya da --sample (biri) gerekli")
+    if args.grid:
+        grid = args.grid
+        if os.path.exists(grid):
+            with open(grid, 'r', encoding='utf-8') as f:
+                grid = f.read()
+        try:
+            grid = json.loads(grid)
+        except json.JSONDecodeError as e:
+            raise CLIArgumentError(f"sweep: --grid geçerli JSON değil: {e}")
+        try:
+            points = config_grid(grid)
+        except ValueError as e:
+            raise CLIArgumentError(str(e))
+    else:
+        ranges = {}
+        for item in args.sample:
+            name, _, bounds = item.partition('=')
+            low, _, high = bounds.partition(':')
+            try:
+                ranges[name] = (float(low), float(high))
+            except ValueError:
+                raise CLIArgumentError(f"Geçersiz --sample: {item!r} (alan=alt:üst)")
+        try:
+            points = config_samples(ranges, args.points, seed=args.seed)
+        except ValueError as e:
+            raise CLIArgumentError(str(e))
+
+    def progress(done, total):
+        logger.info(f"sweep {done}/{total}")
+
+    sweep_df = run_sweep(points, base_config=config, scenario=args.scenario[0], max_workers=args.workers,
+                         progress=progress if args.verbose else None)
+    print(write_frame(sweep_df, os.path.join(args.out, 'sweep'), args.format))
+    failed = int(sweep_df['hata'].notna().sum())
+    logger.info(f"{len(sweep_df)} nokta, {failed} hatalı, {sweep_df.attrs['elapsed_seconds']:.1f}s")
+    return 0
+
+
+def cmd_library(args, config: EnhancedNXIDConfig) -> int:
+    """Senaryo kütüphanesi (yerleşik + custom_scenarios) tek batch'te"""
+    from scenarios import simulate_scenario_library
+
+    names = args.scenario if args.scenario_given else None
+    metrics = simulate_scenario_library(config, names)
+    print(write_frame(metrics.reset_index(), os.path.join(args.out, 'scenario_library'), args.format))
+    return 0
+
+
+COMMANDS = {'run': cmd_run, 'montecarlo': cmd_montecarlo, 'sweep': cmd_sweep, 'library': cmd_library}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--config', help="Config JSON dosyası (yoksa default config)")
+    common.add_argument('--set', action='append', default=[], metavar='ALAN=DEĞER',
+                        help="Config override (tekrarlanabilir, değer JSON olabilir)")
+    common.add_argument('--scenario', nargs='+', default=None, help="Senaryo(lar) - varsayılan: base")
+    common.add_argument('--out', default='nxid_output', help="Çıktı klasörü")
+    common.add_argument('--format', choices=('csv', 'parquet'), default='csv', help="Tablo formatı")
+    common.add_argument('--workers', type=int, default=None, help="Process sayısı (0 = sıralı)")
+    common.add_argument('--seed', type=int, default=None, help="Monte Carlo / örnekleme seed'i")
+    common.add_argument('-v', '--verbose', action='store_true', help="INFO log'ları")
+
+    parser = argparse.ArgumentParser(prog='nxid', description="NXID tokenomics - headless simülasyon")
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', parents=[common], help="Senaryo simülasyonu + zaman serileri")
+    run.add_argument('--population', action='store_true', help="Yatırımcı popülasyonu metrikleri")
+    montecarlo = commands.add_parser('montecarlo', parents=[common], help="Monte Carlo bantları")
+    montecarlo.add_argument('--paths', type=int, default=None, help="Yol sayısı (varsayılan: config)")
+    sweep = commands.add_parser('sweep', parents=[common], help="Parametre taraması")
+    sweep.add_argument('--grid', help="Grid JSON'u ya da dosyası: {\"alan\": [değerler]}")
+    sweep.add_argument('--sample', action='append', default=[], metavar='ALAN=ALT:ÜST',
+                       help="Latin hypercube aralığı (tekrarlanabilir)")
+    sweep.add_argument('--points', type=int, default=100, help="--sample nokta sayısı")
+    commands.add_parser('library', parents=[common], help="Senaryo kütüphanesi batch")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s', stream=sys.stderr)
+    args.scenario_given = args.scenario is not None
+    args.scenario = args.scenario or ['base']
+
+    try:
+        config = load_config(args.config, args.set)
+    except (OSError, ValueError, TypeError) as e:
+        parser.error(str(e))
+    errors = config_errors(config)
+    if errors:
+        logger.error("Geçersiz config: " + "; ".join(errors))
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+    start = time.perf_counter()
+    try:
+        status = COMMANDS[args.command](args, config)
+    except CLIArgumentError as e:
+        parser.error(str(e))
+    except Exception:
+        logger.exception(f"{args.command} başarısız")
+        return 1
+    logger.info(f"{args.command} tamamlandı: {time.perf_counter() - start:.2f}s")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""
+NXID Presale Cohort Engine
+==========================
+Giriş kohortları (haftalık, günlük, ...) için basit faiz staking kazancı
+ve presale_günü × mainnet_günü yatırımcı ROI yüzeyi.
+
+Basit faizde ana para sabittir, bu yüzden s gününde giren kohortun toplam
+ödülü = ana_para * Σ_{d ≥ s} günlük_oran[d] * havuz_sağlığı[d].
+Günlük faktörün sondan kümülatif toplamı (suffix cumsum) bir kez alınır,
+her kohort O(1) olur - kohort sayısı sınırı gerekmez.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Optional, Sequence
+from config import EnhancedNXIDConfig
+
+
+def pool_health_factor(presale_df: pd.DataFrame, config: EnhancedNXIDConfig) -> np.ndarray:
+    """Günlük havuz sağlığı çarpanı: havuz boşsa 0, değilse max(0.1, kalan / başlangıç)"""
+    if 'kalan_odul_havuzu' not in presale_df.columns:
+        return np.ones(len(presale_df))
+    remaining_pool = presale_df['kalan_odul_havuzu'].to_numpy(dtype=float)
+    initial_pool = config.total_supply * (config.presale_staking_pool / 100)
+    return np.where(remaining_pool <= 0, 0.0, np.maximum(0.1, remaining_pool / initial_pool))
+
+
+def daily_reward_rate(presale_df: pd.DataFrame, config: EnhancedNXIDConfig,
+                      apply_pool_health: bool = True) -> np.ndarray:
+    """Token başına günlük ödül oranı (APY / 100 / 365, opsiyonel havuz sağlığı ile)"""
+    rate = presale_df['guncel_apy'].to_numpy(dtype=float) / 100 / 365
+    if apply_pool_health:
+        rate = rate * pool_health_factor(presale_df, config)
+    return rate
+
+
+def suffix_reward_sum(rate: np.ndarray) -> np.ndarray:
+    """S[s] = Σ_{d ≥ s} rate[d] - s gününde giren 1 token'ın presale sonuna kadarki ödülü"""
+    return np.cumsum(rate[::-1])[::-1]
+
+
+def cohort_start_days(n_days: int, cohort_days: int = 7,
+                      max_cohorts: Optional[int] = None) -> np.ndarray:
+    """Kohort giriş günleri (0 tabanlı): 0, k, 2k, ... - sadece tam kohort periyotları"""
+    cohort_days = max(1, int(cohort_days))
+    n_cohorts = n_days // cohort_days
+    if max_cohorts is not None:
+        n_cohorts = min(n_cohorts, max_cohorts)
+    return np.arange(n_cohorts) * cohort_days
+
+
+def cohort_token_analysis(presale_df: pd.DataFrame, config: EnhancedNXIDConfig,
+                          cohort_days: int = 7, investment_amount: Optional[float] = None,
+                          max_cohorts: Optional[int] = None) -> pd.DataFrame:
+    """Sabit yatırımlı giriş kohortları - generate_weekly_token_analysis kolonlarıyla"""
+    if investment_amount is None:
+        investment_amount = config.weekly_investment_amount
+
+    n_days = len(presale_df)
+    start_days = cohort_start_days(n_days, cohort_days, max_cohorts)
+    if len(start_days) == 0:
+        return pd.DataFrame()
+
+    price = presale_df['fiyat_usdt'].to_numpy(dtype=float)[start_days]
+    apy = presale_df['guncel_apy'].to_numpy(dtype=float)[start_days]
+    rewards_per_token = suffix_reward_sum(daily_reward_rate(presale_df, config))[start_days]
+
+    tokens_bought = investment_amount / price
+    staking_rewards = tokens_bought * rewards_per_token
+    gain_percentage = np.where(tokens_bought > 0, staking_rewards / np.where(tokens_bought > 0, tokens_bought, 1) * 100, 0.0)
+
+    return pd.DataFrame({
+        'hafta': np.arange(1, len(start_days) + 1),
+        'yatirim_gunu': start_days + 1,
+        'hafta_fiyati': price,
+        'hafta_apy': apy,
+        'yatirim_miktari_usdt': np.full(len(start_days), float(investment_amount)),
+        'alinan_token': tokens_bought,
+        'ana_para_tokens': tokens_bought,
+        'staking_kazanci': staking_rewards,
+        'toplam_token': tokens_bought + staking_rewards,
+        'token_kazanc_yuzdesi': gain_percentage,
+        'gun_sayisi': n_days - start_days,
+        'faiz_tipi': 'SIMPLE'
+    })
+
+
+@dataclass
+class CohortInterestTracking:
+    """Kohort × presale günü basit faiz takibi - satır i kohortu, kolon j presale günü (j + 1)
+
+    Giriş gününden önceki hücreler NaN. Tüm diziler günlük oranın kümülatif
+    toplamından tek seferde gelir; hafta seçimi sadece satır dilimler.
+    """
+    weeks: np.ndarray               # kohort numarası (1 tabanlı, weekly_df['hafta'])
+    start_days: np.ndarray          # giriş günü (0 tabanlı presale günü)
+    week_apy: np.ndarray
+    principal: np.ndarray           # ana para token (sabit - basit faiz)
+    days: np.ndarray                # presale günü ekseni (1 tabanlı)
+    daily_interest: np.ndarray      # (kohort, gün)
+    cumulative_interest: np.ndarray
+    total_balance: np.ndarray
+    interest_percentage: np.ndarray
+
+    def select(self, weeks: Optional[Sequence[int]] = None, limit: Optional[int] = None) -> np.ndarray:
+        """Gösterilecek kohort satırları - weeks verilirse o haftalar, yoksa ilk limit kohort"""
+        if weeks is not None:
+            return np.flatnonzero(np.isin(self.weeks, weeks))
+        return np.arange(len(self.weeks) if limit is None else min(limit, len(self.weeks)))
+
+    def cohort(self, row: int) -> dict:
+        """Tek kohortun giriş gününden itibaren serileri (view, kopya yok)"""
+        start = int(self.start_days[row])
+        return {'days': self.days[start:],
+                'daily_interest': self.daily_interest[row, start:],
+                'cumulative_interest': self.cumulative_interest[row, start:],
+                'total_balance': self.total_balance[row, start:],
+                'interest_percentage': self.interest_percentage[row, start:]}
+
+
+def cohort_interest_tracking(presale_df: pd.DataFrame, weekly_df: pd.DataFrame, config: EnhancedNXIDConfig,
+                             apply_pool_health: bool = False) -> CohortInterestTracking:
+    """Haftalık kohortların gün gün faiz / bakiye matrisi (generate_weekly_token_analysis çıktısından)
+
+    kümülatif[i, d] = ana_para[i] * (C[d] - C[s_i - 1]), C = cumsum(günlük_oran).
+    Varsayılan grafik kuralı: ham APY (havuz sağlığı çarpanı yok).
+    """
+    n_days = len(presale_df)
+    start_days = weekly_df['yatirim_gunu'].to_numpy(dtype=np.int64) - 1
+    principal = (weekly_df['yatirim_miktari_usdt'].to_numpy(dtype=float)
+                 / weekly_df['hafta_fiyati'].to_numpy(dtype=float))
+
+    rate = daily_reward_rate(presale_df, config, apply_pool_health)
+    cumulative_rate = np.concatenate(([0.0], np.cumsum(rate)))
+    active = np.arange(n_days)[None, :] >= start_days[:, None]
+
+    daily_interest = np.where(active, principal[:, None] * rate[None, :], np.nan)
+    cumulative_interest = np.where(
+        active, principal[:, None] * (cumulative_rate[None, 1:] - cumulative_rate[start_days][:, None]), np.nan)
+    safe_principal = np.where(principal > 0, principal, 1.0)
+    interest_percentage = np.where(principal[:, None] > 0, cumulative_interest / safe_principal[:, None] * 100,
+                                   np.where(active, 0.0, np.nan))
+
+    return CohortInterestTracking(
+        weeks=weekly_df['hafta'].to_numpy(dtype=np.int64),
+        start_days=start_days,
+        week_apy=weekly_df['hafta_apy'].to_numpy(dtype=float),
+        principal=principal,
+        days=np.arange(1, n_days + 1),
+        daily_interest=daily_interest,
+        cumulative_interest=cumulative_interest,
+        total_balance=principal[:, None] + cumulative_interest,
+        interest_percentage=interest_percentage
+    )
+
+
+@dataclass
+class ROISurface:
+    """Günlük giriş kohortu ROI matrisi - roi[i, j] = kohort i'nin mainnet günü j'deki ROI'si (x)
+
+    ROI = token_factor[kohort] * mainnet_fiyat[gün], bu yüzden kohortlar arası
+    sıralama her mainnet gününde aynıdır; yüzdelik sorguları matrise dokunmadan
+    bu ayrışımdan tam doğrulukla hesaplanır. roi sadece heatmap / nokta
+    sorguları içindir (float32, opsiyonel downsample).
+    """
+    presale_days: np.ndarray        # kohort giriş günleri (0 tabanlı presale günü)
+    mainnet_days: np.ndarray        # satır eksenindeki mainnet günleri (0 tabanlı)
+    mainnet_months: np.ndarray
+    token_factor: np.ndarray        # 1$ yatırımın presale sonu token bakiyesi (ana para + faiz)
+    mainnet_price: np.ndarray       # mainnet_days'deki token fiyatı
+    cohort_weight: np.ndarray       # kohortun presale USDT hacmi (ağırlıklı sorgular için)
+    roi: np.ndarray                 # (kohort, mainnet günü) float32
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.roi.nbytes)
+
+    def cohort_roi(self, presale_day: int) -> np.ndarray:
+        """Tek kohortun tüm mainnet günlerindeki ROI serisi"""
+        index = int(np.searchsorted(self.presale_days, presale_day))
+        return self.roi[min(index, len(self.presale_days) - 1)]
+
+    def percentiles(self, q: Sequence[float] = (5, 25, 50, 75, 95), weighted: bool = False) -> pd.DataFrame:
+        """Her mainnet günü için kohortlar arası ROI yüzdelikleri (weighted: USDT hacmi ağırlıklı)"""
+        factor_quantiles = _quantiles(self.token_factor, q,
+                                      self.cohort_weight if weighted else None)
+        data = {'gun': self.mainnet_days, 'ay': self.mainnet_months}
+        for p, value in zip(q, factor_quantiles):
+            data[f'p{p:g}'] = value * self.mainnet_price
+        return pd.DataFrame(data)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Heatmap için geniş tablo: index presale günü (1 tabanlı), kolonlar mainnet ayı"""
+        return pd.DataFrame(self.roi, index=self.presale_days + 1, columns=np.round(self.mainnet_months, 2))
+
+
+def _quantiles(values: np.ndarray, q: Sequence[float], weights: Optional[np.ndarray] = None) -> np.ndarray:
+    if weights is None:
+        return np.percentile(values, q)
+    order = np.argsort(values)
+    cumulative = np.cumsum(weights[order])
+    if cumulative[-1] <= 0:
+        return np.percentile(values, q)
+    positions = (cumulative - 0.5 * weights[order]) / cumulative[-1]
+    return np.interp(np.asarray(q, dtype=float) / 100, positions, values[order])
+
+
+def cohort_token_factor(presale_df: pd.DataFrame, config: EnhancedNXIDConfig,
+                        apply_pool_health: bool = True) -> np.ndarray:
+    """Her presale günü için 1$ yatırımın presale sonundaki token bakiyesi"""
+    price = presale_df['fiyat_usdt'].to_numpy(dtype=float)
+    rewards_per_token = suffix_reward_sum(daily_reward_rate(presale_df, config, apply_pool_health))
+    return (1 + rewards_per_token) / price
+
+
+def build_roi_surface(presale_df: pd.DataFrame, mainnet_df: pd.DataFrame, config: EnhancedNXIDConfig,
+                      cohort_stride: int = 1, day_stride: int = 1, dtype=np.float32,
+                      apply_pool_health: bool = True) -> ROISurface:
+    """💹 Her presale günü bir giriş kohortu - presale_günü × mainnet_günü ROI yüzeyi
+
+    Token bakiyesi generate_weekly_token_analysis ile aynı basit faiz + havuz
+    sağlığı kuralıyla hesaplanır; USD değeri = bakiye × mainnet fiyatı.
+    cohort_stride / day_stride ile matris downsample edilir (180 × 1461 float32 ≈ 1 MB).
+    """
+    cohort_index = np.arange(0, len(presale_df), max(1, int(cohort_stride)))
+    day_index = np.arange(0, len(mainnet_df), max(1, int(day_stride)))
+    if len(mainnet_df) and day_index[-1] != len(mainnet_df) - 1:
+        day_index = np.append(day_index, len(mainnet_df) - 1)  # son gün her zaman dahil
+
+    token_factor = cohort_token_factor(presale_df, config, apply_pool_health)[cohort_index]
+    mainnet_price = mainnet_df['token_fiyati'].to_numpy(dtype=float)[day_index]
+    weight = presale_df['gunluk_talep_usdt'].to_numpy(dtype=float)
+    if cohort_stride > 1:
+        # Downsample edilen kohort kendi periyodundaki tüm günlerin hacmini temsil eder
+        weight = np.add.reduceat(weight, cohort_index)
+    else:
+        weight = weight[cohort_index]
+
+    return ROISurface(
+        presale_days=cohort_index,
+        mainnet_days=mainnet_df['gun'].to_numpy()[day_index],
+        mainnet_months=mainnet_df['ay'].to_numpy(dtype=float)[day_index],
+        token_factor=token_factor,
+        mainnet_price=mainnet_price,
+        cohort_weight=weight,
+        roi=np.multiply.outer(token_factor.astype(dtype), mainnet_price.astype(dtype))
+    )
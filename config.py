@@ -4,12 +4,24 @@ NXID Enhanced Configuration Module
 Enhanced: Advanced Maturity Damping + Dynamic Staking + Real Circulating Supply + Price Velocity
 """
 
+import hashlib
 import json
+import logging
 import os
-import streamlit as st
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from typing import Dict, List, Tuple, Optional
 
+logger = logging.getLogger(__name__)
+
+# Sadece grafik çizimini etkileyen alanlar - simülasyon sonucunu değiştirmez,
+# config_hash'e (st.cache_data / artifact store / servis anahtarları) girmez
+PRESENTATION_FIELDS = frozenset({'chart_max_points', 'chart_downsample_method', 'chart_webgl_threshold'})
+
+# Presale motorları - eski pickle / dict config'lerde alan yoksa da aynı default kullanılır
+PRESALE_ENGINES = ("vectorized", "loop")
+DEFAULT_PRESALE_ENGINE = "vectorized"
+
+
 @dataclass
 class EnhancedNXIDConfig:
     """🔧 Enhanced NXID Tokenomics Configuration  - Advanced Maturity + Dynamic Systems"""
@@ -51,6 +63,7 @@ class EnhancedNXIDConfig:
     # === HAFTALIK SIMPLE FAİZ ANALİZİ ===
     weekly_analysis: bool = True            # Haftalık analiz aktif mi
     weekly_investment_amount: float = 1000.0  # Sabit haftalık yatırım miktarı ($)
+    cohort_days: int = 7                    # Giriş kohortu periyodu (gün) - 7 haftalık, 1 günlük
     
     # === YENİ: STARTING MCAP INPUT  ===
     starting_mcap_usdt: float = 8_000_000.0  # User input starting McAp
@@ -121,6 +134,7 @@ class EnhancedNXIDConfig:
     dao_vesting_months: int = 24             # DAO vesting
     marketing_cliff_months: int = 0          # Marketing cliff
     marketing_vesting_months: int = 12       # Marketing vesting
+    vesting_delay_months: int = 6            # Mainnet sonrası vesting başlangıç gecikmesi (ay)
     
     # === 16 ÇEYREK MAINNET SİSTEMİ ===
     bear_scenario_multipliers: List[float] = None  
@@ -128,6 +142,11 @@ class EnhancedNXIDConfig:
     bull_scenario_multipliers: List[float] = None  
     market_beta_per_quarter: List[float] = None
     
+    # === SENARYO KÜTÜPHANESİ ===
+    # Kullanıcı senaryoları: {'name', 'multipliers', 'betas' (opsiyonel), 'overflow': 'wrap'|'hold'}
+    # Çeyrek sayısı serbest - projeksiyon 16 çeyrekten uzun olabilir (bkz. scenarios.py)
+    custom_scenarios: List[Dict] = None
+    
     # === MAINNET TAX VE BURN SİSTEMİ ===
     mainnet_tax_period_months: int = 6       # Mainnet tax dönemi
     mainnet_tax_rate: float = 3.0            # Mainnet tax oranı %
@@ -147,10 +166,26 @@ class EnhancedNXIDConfig:
     enable_compounding: bool = False         # Compounding kapalı
     dynamic_apy_enabled: bool = True         # Dinamik APY aktif
     
-    # === ESKI UYUMLULUK ===
-    investor_count_simulation: int = 100
-    min_investment_usdt: float = 100.0
-    max_investment_usdt: float = 10000.0
+    # === SİMÜLASYON MOTORU ===
+    presale_engine: str = DEFAULT_PRESALE_ENGINE  # "vectorized" (array) | "loop" (referans gün gün döngü)
+    simulation_seed: int = 42                # Presale / mainnet volatilite akışlarının kök seed'i
+    vesting_daily_interpolation: bool = False  # Mainnet'te unlock eğrisi günlük interpolasyon (False = aylık basamak)
+    
+    # === MONTE CARLO ===
+    monte_carlo_enabled: bool = False        # Mainnet için yüzdelik bantları hesapla
+    monte_carlo_paths: int = 1000            # Bağımsız volatilite yolu sayısı
+    monte_carlo_seed: int = 2024             # Tekrarlanabilir bantlar için seed
+    
+    # === YATIRIMCI POPÜLASYONU ===
+    population_enabled: bool = True          # Yatırımcı bazlı dağılım metrikleri (Gini, ROI yüzdelikleri)
+    investor_count_simulation: int = 100     # Örneklenen yatırımcı sayısı (milyonlar desteklenir)
+    min_investment_usdt: float = 100.0       # Yatırım büyüklüğü alt sınırı (log-uniform)
+    max_investment_usdt: float = 10000.0     # Yatırım büyüklüğü üst sınırı
+    
+    # === GRAFİK PERFORMANSI ===
+    chart_max_points: int = 500              # Trace başına nokta bütçesi (uzun seriler downsample edilir)
+    chart_downsample_method: str = "lttb"    # "lttb" (şekil) | "minmax" (bucket başına tepe / dip) | "none"
+    chart_webgl_threshold: int = 5000        # Figür başına toplam nokta - üstünde Scattergl (0 = hiç)
     
     def __post_init__(self):
         """Default değerleri ayarla - 16 çeyrek için + Enhanced """
@@ -182,6 +217,8 @@ class EnhancedNXIDConfig:
                 0.95, 0.9, 0.95, 0.85, # Yıl 3 
                 0.9, 0.85, 0.9, 0.8    # Yıl 4
             ]
+        if self.custom_scenarios is None:
+            self.custom_scenarios = []
     
     def validate_distribution(self) -> bool:
         """Token dağıtımının %100'e eşit olduğunu doğrula"""
@@ -216,6 +253,25 @@ class EnhancedNXIDConfig:
         if not (0 <= self.maturity_damping_strength <= 1):
             return False
         
+        # Population validation
+        if self.investor_count_simulation < 1 or not (0 < self.min_investment_usdt <= self.max_investment_usdt):
+            return False
+        
+        # Chart downsampling validation
+        if (self.chart_downsample_method not in ("lttb", "minmax", "none") or self.chart_max_points < 10
+                or self.chart_webgl_threshold < 0):
+            return False
+        
+        # Custom scenario validation
+        builtin = {"bear", "base", "bull"}
+        names = [scenario.get('name') for scenario in self.custom_scenarios]
+        if len(set(names)) != len(names) or builtin & set(names):
+            return False
+        for scenario in self.custom_scenarios:
+            if (not scenario.get('name') or not scenario.get('multipliers')
+                    or scenario.get('betas') == [] or scenario.get('overflow', 'wrap') not in ('wrap', 'hold')):
+                return False
+        
         return True
     
     def get_maturity_params(self) -> dict:
@@ -258,10 +314,48 @@ class EnhancedNXIDConfig:
             "market_factor": self.market_demand_apy_factor
         }
     
+    def get_vesting_allocations(self) -> list:
+        """Vesting tablosu - her tahsis bir satır (vesting.py ile broadcast hesaplanır)"""
+        delay = self.vesting_delay_months
+        return [
+            {"name": "presale", "share_pct": self.presale_allocation, "instant": True},
+            {"name": "presale_staking", "share_pct": self.presale_staking_pool,
+             "cliff_months": self.presale_staking_cliff_months,
+             "vesting_months": self.presale_staking_vesting_months, "delay_months": delay},
+            {"name": "market_staking", "share_pct": self.market_staking_pool,
+             "cliff_months": self.market_staking_cliff_months,
+             "vesting_months": self.market_staking_vesting_months, "delay_months": delay},
+            {"name": "team", "share_pct": self.team_allocation,
+             "cliff_months": self.team_cliff_months,
+             "vesting_months": self.team_vesting_months, "delay_months": delay},
+            {"name": "dao", "share_pct": self.dao_treasury,
+             "cliff_months": self.dao_cliff_months,
+             "vesting_months": self.dao_vesting_months, "delay_months": delay},
+            {"name": "marketing", "share_pct": self.marketing,
+             "cliff_months": self.marketing_cliff_months,
+             "vesting_months": self.marketing_vesting_months, "delay_months": delay},
+            {"name": "liquidity", "share_pct": self.liquidity, "instant": True},
+        ]
+    
     def to_dict(self) -> dict:
         """Config'i dictionary'ye çevir"""
         return asdict(self)
     
+    def canonical_dict(self) -> dict:
+        """Hash için normalize dict - float alanlarda 5 ile 5.0 aynı değer, PRESENTATION_FIELDS hariç"""
+        data = {k: v for k, v in self.to_dict().items() if k not in PRESENTATION_FIELDS}
+        for f in fields(self):
+            if f.name not in data:
+                continue
+            if f.type in (float, 'float') and isinstance(data[f.name], int) and not isinstance(data[f.name], bool):
+                data[f.name] = float(data[f.name])
+        return data
+    
+    def config_hash(self) -> str:
+        """Kanonik config hash'i (sha256) - cache anahtarı olarak kullanılır"""
+        payload = json.dumps(self.canonical_dict(), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
     @classmethod
     def from_dict(cls, data: dict):
         """Dictionary'den config oluştur"""
@@ -276,7 +370,7 @@ class EnhancedNXIDConfig:
                 json.dump(self.to_dict(), f, indent=4, ensure_ascii=False)
             return True
         except Exception as e:
-            st.error(f"Config kaydetme hatası: {e}")
+            logger.error(f"Config kaydetme hatası: {e}")
             return False
     
     @classmethod
@@ -296,10 +390,10 @@ class EnhancedNXIDConfig:
                             data = json.load(f)
                         return cls.from_dict(data)
                 
-                st.info(f"Config dosyası bulunamadı ({filename}), default enhanced config  kullanılıyor.")
+                logger.info(f"Config dosyası bulunamadı ({filename}), default enhanced config  kullanılıyor.")
                 return cls()
         except Exception as e:
-            st.warning(f"Config yükleme hatası: {e}. Default enhanced config  kullanılıyor.")
+            logger.warning(f"Config yükleme hatası: {e}. Default enhanced config  kullanılıyor.")
             return cls()
     
     def get_system_info(self) -> dict:
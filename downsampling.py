@@ -0,0 +1,181 @@
+"""
+NXID Plot Downsampling
+======================
+Grafik serileri tarayıcıya gitmeden önce nokta bütçesine indirgenir. Uzun
+mainnet projeksiyonlarında (günlük seri, onlarca trace) figure JSON'u ve
+render süresi bir mertebe düşer; görsel şekil korunur.
+
+- "lttb":   Largest-Triangle-Three-Buckets - her bucket'tan komşu bucket'larla
+            en büyük üçgeni kuran nokta seçilir (çizgi şekli için en iyisi).
+            Önceki bucket'ın seçilen noktası yerine ortalaması çapa olarak
+            kullanılır; böylece tüm bucket'lar tek numpy geçişinde hesaplanır.
+- "minmax": Bucket başına min + max noktası (tepe / dip garantili, gürültülü seriler)
+- "none":   İndirgeme yok
+
+Her yöntemde ilk / son nokta ve global min / max (ör. max_tahmin_fiyat
+tepesi) her zaman korunur. Seçilen noktalar gerçek veri noktalarıdır
+(ortalama değil) - hover değerleri tablolarla birebir aynıdır.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax", "none")
+MIN_POINT_BUDGET = 10
+
+# Nokta başına değer taşıyabilen trace özellikleri - x / y ile aynı indeksle kesilmeli
+POINT_KEYS = ('customdata', 'text', 'hovertext', 'hovertemplate', 'ids', 'textposition')
+NESTED_POINT_KEYS = {
+    'marker': ('color', 'size', 'symbol', 'opacity'),
+    'line': ('color', 'width'),
+    'error_x': ('array', 'arrayminus'),
+    'error_y': ('array', 'arrayminus'),
+}
+
+
+def _as_float(values) -> np.ndarray:
+    return np.asarray(values, dtype=float).ravel()
+
+
+def _x_axis(x, n: int) -> np.ndarray:
+    """Sayısal x ekseni (tarih / kategori ise pozisyon)"""
+    if x is None:
+        return np.arange(n, dtype=float)
+    try:
+        x = _as_float(x)
+    except (TypeError, ValueError):
+        return np.arange(n, dtype=float)
+    return x if len(x) == n else np.arange(n, dtype=float)
+
+
+def _buckets(start: int, stop: int, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """[start, stop) aralığını n_buckets ardışık bucket'a böl -> (başlangıçlar, boyutlar)"""
+    edges = np.linspace(start, stop, n_buckets + 1).astype(np.int64)
+    edges = np.unique(edges)
+    return edges[:-1], np.diff(edges)
+
+
+def _first_per_bucket(mask: np.ndarray, bucket_of: np.ndarray) -> np.ndarray:
+    """Her bucket'ta mask'in ilk True olduğu pozisyon"""
+    positions = np.flatnonzero(mask)
+    _, first = np.unique(bucket_of[positions], return_index=True)
+    return positions[first]
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """LTTB ile seçilen n_out nokta indeksi (ilk ve son dahil, sıralı)"""
+    y = _as_float(y)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = _x_axis(x, n)
+    y_fill = np.nan_to_num(y, nan=0.0, posinf=0.0, neginf=0.0)
+
+    # İç noktalar n_out - 2 bucket'a; ilk ve son nokta kendi bucket'ı
+    starts, sizes = _buckets(1, n - 1, n_out - 2)
+    x_mean = np.add.reduceat(x[1:n - 1], starts - 1) / sizes
+    y_mean = np.add.reduceat(y_fill[1:n - 1], starts - 1) / sizes
+    anchor_x = np.concatenate(([x[0]], x_mean[:-1]))
+    anchor_y = np.concatenate(([y_fill[0]], y_mean[:-1]))
+    next_x = np.concatenate((x_mean[1:], [x[-1]]))
+    next_y = np.concatenate((y_mean[1:], [y_fill[-1]]))
+
+    bucket_of = np.repeat(np.arange(len(sizes)), sizes)
+    ax, ay = anchor_x[bucket_of], anchor_y[bucket_of]
+    cx, cy = next_x[bucket_of], next_y[bucket_of]
+    px, py = x[1:n - 1], y_fill[1:n - 1]
+    area = np.abs((ax - cx) * (py - ay) - (ax - px) * (cy - ay))
+
+    best = np.maximum.reduceat(area, starts - 1)
+    chosen = _first_per_bucket(area == best[bucket_of], bucket_of) + 1
+    return np.concatenate(([0], chosen, [n - 1]))
+
+
+def minmax_indices(y, n_out: int) -> np.ndarray:
+    """Bucket başına min ve max noktası (n_out // 2 bucket, sıralı)"""
+    y = _as_float(y)
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    starts, sizes = _buckets(0, n, n_out // 2)
+    bucket_of = np.repeat(np.arange(len(sizes)), sizes)
+    low = np.where(np.isnan(y), np.inf, y)
+    high = np.where(np.isnan(y), -np.inf, y)
+    lows = _first_per_bucket(low == np.minimum.reduceat(low, starts)[bucket_of], bucket_of)
+    highs = _first_per_bucket(high == np.maximum.reduceat(high, starts)[bucket_of], bucket_of)
+    return np.union1d(lows, highs)
+
+
+def downsample_indices(x, y, n_out: int, method: str = "lttb") -> Optional[np.ndarray]:
+    """Seri için korunacak indeksler - bütçe içindeyse None (indirgeme gerekmez)
+
+    İlk / son nokta ve global min / max her zaman dahildir.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Bilinmeyen downsample yöntemi: {method} ({' / '.join(DOWNSAMPLE_METHODS)})")
+    y = _as_float(y)
+    n = len(y)
+    if method == "none" or n <= n_out:
+        return None
+    n_out = max(int(n_out), MIN_POINT_BUDGET)
+    if method == "lttb":
+        index = lttb_indices(x, y, n_out)
+    else:
+        index = minmax_indices(y, n_out)
+    if np.isnan(y).all():
+        return index
+    extremes = [0, n - 1, int(np.nanargmax(y)), int(np.nanargmin(y))]
+    return np.union1d(index, extremes)
+
+
+def take(values, index: Optional[np.ndarray]):
+    """Array-benzeri seriyi indekslerle kes (index None ise aynen döner)"""
+    if index is None:
+        return values
+    if hasattr(values, 'to_numpy'):
+        values = values.to_numpy()
+    return np.asarray(values)[index]
+
+
+def _is_array(value) -> bool:
+    return hasattr(value, '__len__') and not isinstance(value, (str, bytes, dict))
+
+
+def _take_point_value(key: str, value, index: np.ndarray, n: int):
+    if not _is_array(value):
+        return value
+    if len(value) != n:
+        raise ValueError(f"{key}: {len(value)} değer, x ise {n} nokta - downsample hizalanamaz")
+    return take(value, index)
+
+
+def take_points(kwargs: dict, index: Optional[np.ndarray], n: int) -> dict:
+    """Trace özelliklerindeki nokta başına array'leri (customdata, marker.color...) indekslerle kes
+
+    Plotly customdata / text'i noktalarla pozisyona göre eşler; x / y kesilip
+    bunlar kesilmezse hover yanlış günün değerini gösterir. Uzunluğu n olmayan
+    array ValueError verir.
+    """
+    if index is None:
+        return kwargs
+    kwargs = dict(kwargs)
+    for key in POINT_KEYS:
+        if key in kwargs:
+            kwargs[key] = _take_point_value(key, kwargs[key], index, n)
+    for parent, keys in NESTED_POINT_KEYS.items():
+        nested = kwargs.get(parent)
+        if hasattr(nested, 'to_plotly_json'):
+            nested = nested.to_plotly_json()
+        if not isinstance(nested, dict):
+            continue
+        nested = dict(nested)
+        for key in keys:
+            if key in nested:
+                nested[key] = _take_point_value(f"{parent}.{key}", nested[key], index, n)
+        if parent == 'marker' and isinstance(nested.get('line'), dict):
+            nested['line'] = dict(nested['line'])
+            for key in NESTED_POINT_KEYS['line']:
+                if key in nested['line']:
+                    nested['line'][key] = _take_point_value(f"marker.line.{key}", nested['line'][key], index, n)
+        kwargs[parent] = nested
+    return kwargs
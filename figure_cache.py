@@ -0,0 +1,193 @@
+"""
+NXID Figure Cache
+=================
+Sidebar'da tek bir değer değişip simülasyon yeniden çalıştığında figürler
+sıfırdan kurulmaz. Builder'lar önce bir FigureRecorder'a çalışır: plotly
+figürü yerine çağrılar (make_subplots, update_layout, add_hline...) ve
+trace'ler kaydedilir - validation / layout maliyeti yok.
+
+Kayıt iki parçaya ayrılır:
+- yapı imzası: tüm layout çağrıları + trace özellikleri (isim, renk, eksen,
+  hovertemplate...) - data array'leri hariç
+- data parmak izleri: trace başına x / y / z array'lerinin hash'i
+
+Cache anahtarı (grafik adı, yapı imzası):
+- aynı imza, aynı data      -> cache'teki figür aynen döner
+- aynı imza, farklı data    -> cache'teki figür kopyalanır, sadece değişen
+                               trace'lerin array'leri batch_update ile değişir
+- yeni imza                 -> kayıt gerçek figüre oynatılır (tam kurulum)
+
+Layout'a giren her değer (başlıktaki hedef McAp, add_hline seviyesi...)
+imzanın parçası olduğu için patch'lenen figür tam kurulumla birebir aynıdır.
+Cache'teki figürler paylaşılır - salt okunur kullanılmalıdır.
+"""
+
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+import plotly.graph_objects as go
+from plotly.basedatatypes import BaseTraceType
+
+DATA_KEYS = ('x', 'y', 'z')
+DEFAULT_FIGURE_ENTRIES = 128
+
+
+class TraceSpec:
+    """Doğrulanmamış trace - type + özellikler; oynatılırken gerçek trace'e çevrilir"""
+    __slots__ = ('trace_type', 'props')
+
+    def __init__(self, trace_type: str, **props):
+        self.trace_type = trace_type
+        self.props = props
+
+    def build(self) -> BaseTraceType:
+        return getattr(go, self.trace_type)(**self.props)
+
+
+def _split_trace(trace) -> Tuple[str, Dict, Dict]:
+    """Trace -> (tip, data array'leri, diğer özellikler)"""
+    if isinstance(trace, TraceSpec):
+        trace_type, props = trace.trace_type, dict(trace.props)
+    else:
+        props = trace.to_plotly_json()
+        trace_type = props.pop('type', type(trace).__name__)
+    data = {key: props.pop(key) for key in DATA_KEYS if props.get(key) is not None}
+    return trace_type, data, props
+
+
+def _fingerprint(value) -> bytes:
+    array = np.asarray(value)
+    if array.dtype == object:
+        payload = pickle.dumps(list(value), protocol=4)
+    else:
+        payload = str((array.dtype.str, array.shape)).encode() + np.ascontiguousarray(array).tobytes()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class FigureRecorder:
+    """go.Figure yerine geçen kayıt nesnesi - builder'ın add_* / update_* çağrılarını tutar"""
+
+    def __init__(self, factory: Callable, *args, **kwargs):
+        self.factory = (factory, args, kwargs)
+        self.traces: List = list(kwargs.pop('data', None) or [])
+        self.calls: List[Tuple] = []
+        self.webgl = False
+
+    def add_trace(self, trace, *args, **kwargs):
+        self.traces.append(trace)
+        self.calls.append(('add_trace', (len(self.traces) - 1,) + args, kwargs))
+        return self
+
+    def __getattr__(self, name):
+        if not name.startswith(('add_', 'update_')):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return record
+
+    # === KAYIT ANALİZİ ===
+    def split(self) -> Tuple[Optional[str], List[Dict]]:
+        """(yapı imzası, trace başına data dict'i) - imza üretilemezse None"""
+        structure, data = [], []
+        for trace in self.traces:
+            trace_type, trace_data, props = _split_trace(trace)
+            structure.append((trace_type, sorted(trace_data), props))
+            data.append(trace_data)
+        factory, args, kwargs = self.factory
+        try:
+            payload = pickle.dumps((factory.__name__, args, kwargs, self.calls, structure, self.webgl), protocol=4)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None, data
+        return hashlib.sha256(payload).hexdigest(), data
+
+    def n_points(self, trace_types=('scatter', 'Scatter')) -> int:
+        total = 0
+        for trace in self.traces:
+            trace_type, trace_data, _ = _split_trace(trace)
+            if trace_type in trace_types and 'x' in trace_data:
+                total += len(trace_data['x'])
+        return total
+
+    def replay(self) -> go.Figure:
+        """Kaydı gerçek plotly figürüne oynat (tam kurulum)"""
+        factory, args, kwargs = self.factory
+        traces = [trace.build() if isinstance(trace, TraceSpec) else trace for trace in self.traces]
+        initial = len(traces) - sum(1 for name, _, _ in self.calls if name == 'add_trace')
+        if initial:
+            kwargs = {**kwargs, 'data': traces[:initial]}
+        fig = factory(*args, **kwargs)
+        for name, call_args, call_kwargs in self.calls:
+            if name == 'add_trace':
+                fig.add_trace(traces[call_args[0]], *call_args[1:], **call_kwargs)
+            else:
+                getattr(fig, name)(*call_args, **call_kwargs)
+        return fig
+
+
+class FigureCache:
+    """📈 (grafik adı, yapı imzası) -> figür + data parmak izleri; thread-safe LRU"""
+
+    def __init__(self, max_entries: int = DEFAULT_FIGURE_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple[str, str], Tuple[go.Figure, List[Dict]]]" = OrderedDict()
+        self.counters = {'reused': 0, 'patched': 0, 'built': 0, 'patched_traces': 0}
+        self.lock = threading.RLock()
+
+    def materialize(self, chart_id: str, recorder: FigureRecorder,
+                    finalize: Optional[Callable[[go.Figure], go.Figure]] = None) -> go.Figure:
+        """Kayıttan figür - cache'teki figür yeniden kullanılır / patch'lenir ya da kurulur
+
+        finalize: tam kurulumdan sonra uygulanan dönüşüm (ör. WebGL) - trace sırasını korumalı.
+        """
+        signature, data = recorder.split()
+        fingerprints = [{key: _fingerprint(value) for key, value in trace_data.items()} for trace_data in data]
+        key = (chart_id, signature)
+        with self.lock:
+            entry = self.entries.get(key) if signature is not None else None
+            if entry is not None:
+                self.entries.move_to_end(key)
+
+        if entry is not None:
+            cached_figure, cached_fingerprints = entry
+            changed = [i for i, fp in enumerate(fingerprints) if fp != cached_fingerprints[i]]
+            if not changed:
+                with self.lock:
+                    self.counters['reused'] += 1
+                return cached_figure
+            fig = go.Figure(cached_figure)
+            with fig.batch_update():
+                for i in changed:
+                    fig.data[i].update(data[i])
+            with self.lock:
+                self.counters['patched'] += 1
+                self.counters['patched_traces'] += len(changed)
+        else:
+            fig = recorder.replay()
+            if finalize is not None:
+                fig = finalize(fig)
+            with self.lock:
+                self.counters['built'] += 1
+
+        if signature is not None:
+            with self.lock:
+                self.entries[key] = (fig, fingerprints)
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        return fig
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {**self.counters, 'entries': len(self.entries), 'max_entries': self.max_entries}
+
+
+DEFAULT_FIGURE_CACHE = FigureCache()
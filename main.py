@@ -17,16 +17,23 @@ YENİ ÖZELLİKLER :
 
 import streamlit as st
 import pandas as pd
+import json
+import sys
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
 # Enhanced modülleri import et
 from config import EnhancedNXIDConfig
 from models import EnhancedTokenomicsModel
-from visualizations import EnhancedVisualizationManager
+from visualizations import WEEKLY_TRACKING_VIEWS, EnhancedVisualizationManager, LazyChartMap
 from sidebar import SidebarManager
 from analytics import AnalyticsManager
 from utils import load_enhanced_css, display_header
+from optimizer import OPTIMIZER_OBJECTIVES, SEARCH_GROUPS, optimize_config
+from pipeline import DEFAULT_PIPELINE
+from artifact_store import DEFAULT_STORE, run_key
+from scenarios import BUILTIN_SCENARIOS, scenario_definition
 
 # Enhanced sayfa yapılandırması
 st.set_page_config(
@@ -36,6 +43,120 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+SIMULATION_CACHE_TTL = 6 * 60 * 60     # saniye
+SIMULATION_CACHE_ENTRIES = 32
+# PyInstaller exe'sinde (run.py) spawn worker'ları exe'yi, yani Streamlit'i yeniden başlatır -
+# UI'dan process pool açılmaz (optimizer sıralı çalışır)
+SWEEP_WORKERS = 0 if getattr(sys, 'frozen', False) else None
+
+
+def simulation_stages(config: EnhancedNXIDConfig) -> tuple:
+    """Config'e göre çalıştırılacak pipeline aşamaları"""
+    stages = ['presale', 'weekly', 'vesting', 'mainnet', 'metrics']
+    if config.monte_carlo_enabled:
+        stages.append('monte_carlo')
+    if config.population_enabled:
+        stages.append('population')
+    return tuple(stages)
+
+
+def run_enhanced_simulation(config: EnhancedNXIDConfig, scenario: str) -> dict:
+    """🎯 Tam simülasyon + grafikler (UI yok) - session_state'e konan sonuç dict'i"""
+    model = EnhancedTokenomicsModel(config)
+    
+    # === PHASE 1-3.5 + 5: PRESALE → WEEKLY → VESTING → MAINNET → METRİKLER ===
+    # Aşama cache'i: sadece girdisi değişen aşamalar yeniden hesaplanır
+    pipeline_run = DEFAULT_PIPELINE.run(config, scenario, stages=simulation_stages(config))
+    presale_df = pipeline_run['presale']
+    weekly_token_df = pipeline_run['weekly']
+    vesting_df = pipeline_run['vesting']
+    mainnet_df = pipeline_run['mainnet']
+    monte_carlo = pipeline_run.outputs.get('monte_carlo')
+    population = pipeline_run.outputs.get('population')
+    
+    # Günlük kohort ROI yüzeyi - heatmap için mainnet ekseni haftalık downsample
+    roi_surface = model.calculate_cohort_roi_surface(presale_df, mainnet_df, day_stride=7)
+    # Haftalık kohort × gün faiz matrisi - hafta seçimi grafikte sadece satır dilimler
+    weekly_tracking = (model.generate_weekly_interest_tracking(presale_df, weekly_token_df)
+                       if not weekly_token_df.empty else None)
+    
+    results = {
+        'presale_df': presale_df,
+        'weekly_token_df': weekly_token_df,
+        'vesting_df': vesting_df,
+        'mainnet_df': mainnet_df,
+        'metrics': pipeline_run['metrics'],
+        'monte_carlo': monte_carlo,
+        'roi_surface': roi_surface,
+        'weekly_tracking': weekly_tracking,
+        'population': population,
+        'config': config,
+        'scenario': scenario,
+        'computed_at': time.time()
+    }
+    # === PHASE 4: ENHANCED GÖRSELLEŞTİRMELER (LAZY) ===
+    results['charts'] = simulation_charts(results)
+    return results
+
+
+def simulation_charts(results: dict) -> LazyChartMap:
+    """Sonuç dict'inden lazy grafik haritası - figürler bölüm render edilince üretilir"""
+    config, scenario = results['config'], results['scenario']
+    viz_manager = EnhancedVisualizationManager(config)
+    charts = viz_manager.create_enhanced_visualizations_v4(  # v4 fonksiyonunu kullan
+        results['presale_df'], results['weekly_token_df'], results['vesting_df'], results['mainnet_df'], scenario,
+        weekly_tracking=results.get('weekly_tracking')
+    )
+    if results.get('monte_carlo') is not None:
+        charts.register('monte_carlo', viz_manager.create_monte_carlo_bands_chart, results['monte_carlo'], scenario)
+    if results.get('roi_surface') is not None:
+        charts.register('cohort_roi_surface', viz_manager.create_cohort_roi_surface_chart,
+                        results['roi_surface'], scenario)
+    if results.get('population') is not None:
+        charts.register('investor_population', viz_manager.create_investor_population_chart,
+                        results['population'], scenario)
+    return charts
+
+
+@st.cache_data(ttl=SIMULATION_CACHE_TTL, max_entries=SIMULATION_CACHE_ENTRIES, show_spinner=False)
+def run_cached_simulation(config_key: str, scenario: str, _config: EnhancedNXIDConfig) -> dict:
+    """Session'lar arası paylaşılan sonuç cache'i - anahtar: kanonik config hash + senaryo
+
+    Bellekte yoksa önce disk artifact store'una bakılır (restart / diğer replikalar).
+    Grafikler lazy: cache'e figür değil builder'lar girer, figürler session'da memoize edilir.
+    """
+    key = run_key(_config, scenario)
+    results = DEFAULT_STORE.load(key, _config)
+    if results is not None:
+        results['charts'] = simulation_charts(results)
+    else:
+        results = run_enhanced_simulation(_config, scenario)
+        try:
+            DEFAULT_STORE.save(key, results, scenario)
+        except OSError:
+            pass  # salt okunur / dolu volume - run yine de bellekten servis edilir
+    return results
+
+
+@st.cache_data(ttl=SIMULATION_CACHE_TTL, max_entries=SIMULATION_CACHE_ENTRIES, show_spinner=False)
+def run_cached_comparison(config_key: str, _config: EnhancedNXIDConfig) -> dict:
+    """🔀 bear / base / bull - presale + vesting bir kez, mainnet senaryoları paralel
+
+    Thread pool: ortak presale / vesting frame'leri worker'lara pickle'lanmaz ve
+    Streamlit process'inden (exe'de Streamlit'i yeniden başlatan) process açılmaz.
+    """
+    start = time.perf_counter()
+    runs = DEFAULT_PIPELINE.run_scenarios(_config, ("bear", "base", "bull"), stages=simulation_stages(_config),
+                                          executor='thread')
+    mainnet_by_scenario = {scenario: run['mainnet'] for scenario, run in runs.items()}
+    return {
+        'metrics_by_scenario': {scenario: run['metrics'] for scenario, run in runs.items()},
+        'mainnet_by_scenario': mainnet_by_scenario,
+        'config_key': config_key,
+        'elapsed_seconds': time.perf_counter() - start
+    }
+
+
 def main():
     """🎯 Enhanced Ana uygulama fonksiyonu """
     
@@ -53,9 +174,11 @@ def main():
     col1, col2, col3 = st.columns(3)
     with col1:
         scenario = st.selectbox("Enhanced Mainnet Scenario", 
-                               ["base", "bear", "bull"], 
+                               ["base", "bear", "bull"] + [s['name'] for s in config.custom_scenarios], 
                                index=0,
-                               help="Bear: Downtrend, Base: Normal, Bull: Uptrend (Enhanced Advanced Model)")
+                               help="Bear: Downtrend, Base: Normal, Bull: Uptrend (Enhanced Advanced Model) + senaryo kütüphanesi")
+        compare_scenarios = st.checkbox("🔀 Compare Scenarios (bear / base / bull)", value=False,
+                                        help="Presale + vesting bir kez çalışır, üç mainnet senaryosu paralel hesaplanır")
     
     with col2:
         st.markdown("### 🚀 Enhanced Scenario Information")
@@ -63,6 +186,9 @@ def main():
             st.error("🐻 Enhanced Bear: Advanced damping + smooth downtrend")
         elif scenario == "bull":
             st.success("🐂 Enhanced Bull: Advanced acceleration + smooth uptrend")
+        elif scenario not in BUILTIN_SCENARIOS:
+            definition = scenario_definition(config, scenario)
+            st.info(f"📚 {definition.name}: {definition.n_quarters} çeyrek ({definition.overflow}) {definition.description}")
         else:
             st.info("📊 Enhanced Base: Balanced growth + advanced maturity")
     
@@ -76,72 +202,37 @@ def main():
         st.write("✅ Enhanced Dynamic APY")
         st.write("✅ 16 quarter advanced scenarios")
     
-    # Enhanced launch button
-    if st.button(f"🚀 Enhanced NXID Tokenomics  Launch - {scenario.upper()} Advanced Scenario", 
-                 type="primary", use_container_width=True) and config_valid:
+    # === CONFIG OPTIMIZER (OPSİYONEL) ===
+    display_optimizer_section(config, config_valid, scenario)
+    
+    # Enhanced launch button - ilk ziyarette (sonuç yokken) otomatik çalışır;
+    # cache sayesinde varsayılan config her ziyaretçi için anında yüklenir
+    launch = st.button(f"🚀 Enhanced NXID Tokenomics  Launch - {scenario.upper()} Advanced Scenario", 
+                       type="primary", use_container_width=True)
+    if (launch or 'enhanced_results_v6' not in st.session_state) and config_valid:
         
         with st.spinner(f"🎯 Enhanced Advanced Maturity + Dynamic + Price Velocity simulation  running - {scenario.upper()} scenario..."):
-            
-            # Enhanced model ve yöneticileri başlat
-            model = EnhancedTokenomicsModel(config)
-            viz_manager = EnhancedVisualizationManager(config)
-            analytics_manager = AnalyticsManager(config)
-            
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            # === PHASE 1: ENHANCED SIMPLE FAİZ PRESALE ===
-            status_text.text("🔥 Phase 1: Enhanced Simple Interest presale simulation - Dynamic APY...")
-            presale_df = model.simulate_presale_phase()
-            progress_bar.progress(20)
-            
-            # === PHASE 1.5: ENHANCED HAFTALIK SIMPLE FAİZ ===
-            status_text.text("📊 Phase 1.5: Enhanced weekly simple interest analysis...")
-            weekly_token_df = model.generate_weekly_token_analysis(presale_df)
-            progress_bar.progress(30)
-            
-            # === PHASE 2: ENHANCED VESTING (STAKING POOLS DAHİL) ===
-            status_text.text("📅 Phase 2: Enhanced vesting schedules - staking pools included...")
-            vesting_df = model.calculate_individual_vesting_schedules()
-            progress_bar.progress(45)
-            
-            # === PHASE 3: ENHANCED ADVANCED MAINNET  ===
-            status_text.text(f"🚀 Phase 3: Enhanced Advanced Mainnet + Maturity Damping - {scenario.upper()} scenario (16 quarters)...")
-            mainnet_df = model.simulate_mainnet_phase(presale_df, vesting_df, scenario)
-            progress_bar.progress(65)
-            
-            # === PHASE 4: ENHANCED GÖRSELLEŞTİRMELER  ===
-            status_text.text("🎨 Phase 4: Enhanced visualizations  - advanced charts...")
-            charts = viz_manager.create_enhanced_visualizations_v4(  # v4 fonksiyonunu kullan
-                presale_df, weekly_token_df, vesting_df, mainnet_df, scenario
-            )
-            progress_bar.progress(85)
-            
-            # === PHASE 5: ENHANCED METRİKLER  ===
-            status_text.text("📊 Phase 5: Enhanced metrics  + advanced maturity + dynamic systems...")
-            metrics = model.calculate_enhanced_metrics(
-                presale_df, weekly_token_df, vesting_df, mainnet_df
-            )
-            progress_bar.progress(100)
-            
-            status_text.text("🎯 Enhanced simulation  completed!")
+            requested_at = time.time()
+            config_key = config.config_hash()
+            if compare_scenarios:
+                # Karşılaştırma önce: seçili senaryonun aşamaları pipeline cache'inden gelir
+                st.session_state['scenario_comparison'] = run_cached_comparison(config_key, config)
+            results = run_cached_simulation(config_key, scenario, config)
+            cache_hit = results['computed_at'] < requested_at
+            # Hash'e girmeyen grafik ayarları (PRESENTATION_FIELDS) cache girdisindeki
+            # config'ten farklı olabilir - grafikler her zaman güncel config ile kurulur
+            results['config'] = config
+            results['charts'] = simulation_charts(results)
             
             # Enhanced sonuçları sakla
-            st.session_state['enhanced_results_v6'] = {
-                'presale_df': presale_df,
-                'weekly_token_df': weekly_token_df,
-                'vesting_df': vesting_df,
-                'mainnet_df': mainnet_df,
-                'charts': charts,
-                'metrics': metrics,
-                'config': config,
-                'scenario': scenario
-            }
+            st.session_state['enhanced_results_v6'] = results
             
             # Enhanced config'i otomatik kaydet
-            config.save_to_json("nxid_enhanced_config_v6.json")
+            if launch and not config.save_to_json("nxid_enhanced_config_v6.json"):
+                st.error("Config kaydetme hatası!")
         
-        st.success(f"🎯 Enhanced simulation  successfully completed! - {scenario.upper()} advanced scenario")
+        cache_note = " (cache)" if cache_hit else ""
+        st.success(f"🎯 Enhanced simulation  successfully completed!{cache_note} - {scenario.upper()} advanced scenario")
     
     elif not config_valid:
         st.error("❌ Fix configuration before running enhanced simulation")
@@ -153,6 +244,11 @@ def main():
         metrics = results['metrics']
         scenario = results['scenario']
         
+        # Model katmanı UI'dan bağımsız - hatalar metrics['error'] ile döner
+        if 'error' in metrics:
+            st.error(f"Enhanced metrik hesaplama hatası : {metrics['error']}")
+            st.stop()
+        
         # Enhanced Analytics yöneticisini başlat
         analytics_manager = AnalyticsManager(config)
         
@@ -169,6 +265,16 @@ def main():
         
         analytics_manager.display_executive_dashboard_v6(metrics, scenario)
         
+        # === SENARYO KARŞILAŞTIRMASI ===
+        comparison = st.session_state.get('scenario_comparison')
+        if compare_scenarios and comparison is not None and comparison['config_key'] == results['config'].config_hash():
+            st.markdown("## 🔀 Senaryo Karşılaştırması - BEAR / BASE / BULL")
+            st.info(f"🔀 **Karşılaştırma :** Presale ve vesting bir kez hesaplandı, üç mainnet senaryosu paralel çalıştı ({comparison['elapsed_seconds']:.2f}s).")
+            analytics_manager.display_scenario_comparison(comparison['metrics_by_scenario'])
+            viz_manager = EnhancedVisualizationManager(config)
+            st.plotly_chart(viz_manager.build_chart('scenario_comparison', viz_manager.create_scenario_comparison_chart,
+                                                    comparison['mainnet_by_scenario']), use_container_width=True)
+        
         # === ENHANCED BÜYÜK GÖRSELLEŞTİRMELER  ===
         st.markdown(f'''
         <h2 style="font-family: Orbitron, monospace; font-size: 2.2rem; font-weight: 700; 
@@ -214,8 +320,43 @@ def main():
             Gelişmiş kontrol paneli tek hafta seçimi veya değişiklikleri görüntüleme imkanı sunar.
             Gelişmiş model daha tutarlı sonuçlar sağlar.
             """)
+            weekly_df = results['weekly_token_df']
+            view_col, week_col = st.columns([3, 1])
+            with view_col:
+                week_view = st.radio("Gösterim", list(WEEKLY_TRACKING_VIEWS), horizontal=True,
+                                     format_func=WEEKLY_TRACKING_VIEWS.get, key='weekly_tracking_view')
+            selected_week = None
+            if week_view == 'single':
+                weeks = weekly_df['hafta'].tolist()
+                if st.session_state.get('weekly_selected_week') not in weeks:
+                    st.session_state['weekly_selected_week'] = weeks[0]
+                with week_col:
+                    selected_week = st.selectbox("Hafta", weeks, key='weekly_selected_week',
+                                                 format_func=lambda week: f"Hafta {week}")
+            # Seçim değişince sadece matris dilimlenir; aynı seçim figür cache'inden döner
+            charts.rebind('weekly_tokens', weekly_df, results['presale_df'], results.get('weekly_tracking'),
+                          week_view, selected_week)
             st.plotly_chart(charts['weekly_tokens'], use_container_width=True)
         
+        # 3e. Günlük kohort ROI yüzeyi
+        if 'cohort_roi_surface' in charts:
+            st.markdown("### 3e. Günlük Kohort Yatırımcı ROI Yüzeyi")
+            st.info("💹 **Kohort ROI :** Her presale günü ayrı bir giriş kohortu. Basit faiz staking ile presale sonu token bakiyesi × mainnet fiyatı / yatırım. Yeşil = kâr (>1x), kırmızı = zarar.")
+            st.plotly_chart(charts['cohort_roi_surface'], use_container_width=True)
+        
+        # 3f. Yatırımcı popülasyonu
+        population = results.get('population')
+        if population is not None and 'investor_population' in charts:
+            st.markdown(f"### 3f. Yatırımcı Popülasyonu - {population.n_investors:,} Yatırımcı")
+            st.info(f"👥 **Popülasyon :** ${config.min_investment_usdt:,.0f} - ${config.max_investment_usdt:,.0f} arası log-uniform yatırım, giriş günü presale günlük talebiyle orantılı ({population.elapsed_seconds:.2f}s).")
+            pop_metrics = population.metrics
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Gini Katsayısı", f"{pop_metrics['gini_katsayisi']:.3f}")
+            col2.metric("Top %1 / %10 Token Payı", f"{pop_metrics['top1_token_payi']*100:.1f}% / {pop_metrics['top10_token_payi']*100:.1f}%")
+            col3.metric("Medyan Final ROI", f"{pop_metrics['final_roi_p50']:.2f}x")
+            col4.metric("Kârdaki Yatırımcı", f"{pop_metrics['karda_yatirimci_orani']*100:.1f}%")
+            st.plotly_chart(charts['investor_population'], use_container_width=True)
+        
         # === 4. YENİ: MARKET CAP EVRİM ANALİZİ ===
         st.markdown(f"## 4. Market Cap Evrim Analizi  - {scenario.upper()}")
         st.info(f"🎯 **Market Cap Evrim Analizi :** Başlangıç McAp'tan hedef McAp'a doğru gelişimi, büyüme oranları ve hedef ilerlemesi analizi.")
@@ -233,6 +374,14 @@ def main():
         st.info(f"🎯 **Enhanced Market Analizi :** Hedef (${config.maturity_target_mcap/1e9:.1f}B) ile gelişmiş maturity damping sistemi, dinamik staking ve fiyat hızı etkisi.")
         st.plotly_chart(charts['mainnet_market'], use_container_width=True)
         
+        # === 6b. MONTE CARLO BANTLARI ===
+        monte_carlo = results.get('monte_carlo')
+        if monte_carlo is not None and 'monte_carlo' in charts:
+            st.markdown(f"## 6b. Monte Carlo Bantları - {monte_carlo.n_paths:,} Yol")
+            st.info(f"🎲 **Monte Carlo :** Mainnet {monte_carlo.n_paths:,} bağımsız volatilite yolu ile simüle edildi (seed {monte_carlo.seed}, {monte_carlo.elapsed_seconds:.1f}s). Koyu bant p25-p75, açık bant p5-p95, çizgi medyan.")
+            st.plotly_chart(charts['monte_carlo'], use_container_width=True)
+            st.dataframe(monte_carlo.summary, use_container_width=True)
+        
         # === 7. ENHANCED DYNAMIC STAKING WITH PRICE VELOCITY  ===
         st.markdown("## 7. Enhanced Dinamik Staking Sistemi  - Fiyat Hızı Etkisi")
         st.info(f"🎯 **Fiyat Hızı Staking :** Staking'in fiyat değişim hızına yanıt verdiği devrimci sistem. Hızlı fiyat artışları → insanlar unstake yapar (satış fırsatı). Hızlı fiyat düşüşleri → insanlar stake yapar (güvenlik + ödüller). {config.price_velocity_window} günlük hız penceresi ile %{config.price_velocity_smoothing:.0f} yumuşatma.")
@@ -337,5 +486,51 @@ def main():
         else:
             st.error(f"📉 **ENHANCED IMPROVEMENT NEEDED **: Average user {avg_user_peak_roi:.1f}x ROI - Review system parameters")
 
+
+def display_optimizer_section(config: EnhancedNXIDConfig, config_valid: bool, scenario: str):
+    """🧭 Config optimizer - performance score (veya seçilen metrikler) için arama"""
+    with st.expander("🧭 Config Optimizer - Performance Score Maksimizasyonu"):
+        st.info("🧭 **Optimizer :** Seçilen parametre gruplarını sidebar aralıklarında arar, her adayı validate_* kısıtlarına göre onarır ve paralel batch'ler halinde değerlendirir. Birden fazla hedefte Pareto kümesi gösterilir.")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            groups = st.multiselect("Parametre Grupları", list(SEARCH_GROUPS), default=list(SEARCH_GROUPS))
+        with col2:
+            objectives = st.multiselect(
+                "Hedefler", OPTIMIZER_OBJECTIVES, default=['score'],
+                help="score = calculate_performance_score_v6; '-' ile başlayanlar minimize edilir")
+        with col3:
+            population_size = st.number_input("Nesil Büyüklüğü", min_value=8, max_value=512, value=32, step=8)
+            max_generations = st.number_input("Maks. Nesil", min_value=1, max_value=200, value=15, step=1)
+
+        if st.button("🧭 Optimizer'ı Çalıştır", use_container_width=True, disabled=not (config_valid and groups and objectives)):
+            search_space = {name: bounds for group in groups for name, bounds in SEARCH_GROUPS[group].items()}
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+
+            def report(generation, evaluations, best):
+                progress_bar.progress(min(100, int((generation + 1) / max_generations * 100)))
+                status_text.text(f"🧭 Nesil {generation + 1}: {evaluations} değerlendirme - en iyi {best}")
+
+            cache = st.session_state.setdefault('optimizer_cache', {})
+            st.session_state['optimizer_result'] = optimize_config(
+                config, objectives=objectives, search_space=search_space, scenario=scenario,
+                population_size=int(population_size), max_generations=int(max_generations),
+                max_workers=SWEEP_WORKERS, cache=cache, progress=report)
+            progress_bar.progress(100)
+
+        result = st.session_state.get('optimizer_result')
+        if result is not None:
+            st.success(f"🧭 {result.n_evaluations} değerlendirme, {result.generations} nesil ({result.stop_reason}, {result.cache_hits} cache), {result.elapsed_seconds:.1f}s - en iyi: {result.best_values}")
+            st.dataframe(pd.DataFrame({'parametre': list(result.best_overrides),
+                                       'mevcut': [getattr(config, name) for name in result.best_overrides],
+                                       'önerilen': list(result.best_overrides.values())}),
+                         use_container_width=True)
+            if len(result.objectives) > 1:
+                st.markdown(f"**Pareto Kümesi ({len(result.pareto)} aday)**")
+                st.dataframe(result.pareto, use_container_width=True)
+            st.download_button("📥 En İyi Config (JSON)",
+                               data=json.dumps(result.best_config.to_dict(), indent=4, ensure_ascii=False),
+                               file_name="nxid_optimized_config.json", mime="application/json")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
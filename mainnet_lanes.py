@@ -0,0 +1,346 @@
+"""
+NXID Vectorized Mainnet Lane Engine
+===================================
+simulate_mainnet_phase ile aynı model - tek döngü, L adet paralel "lane"
+NumPy array'leri olarak birlikte ilerletilir. Lane'ler aynı config'in Monte
+Carlo yolları (skaler parametreler) ya da farklı config'ler (lane başına
+parametre array'leri, bkz. batch.py) olabilir.
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Sequence, Tuple
+from config import EnhancedNXIDConfig
+from scenarios import scenario_day_arrays
+
+
+class RollingMean:
+    """Sabit boyutlu ring buffer + running sum - pencere boyundan bağımsız O(1) ortalama
+
+    shape=() tek yol, shape=(L,) lane başına pencere. Running sum, kayan nokta
+    birikimini önlemek için her tam turda buffer'dan yeniden toplanır
+    (amortize O(1)). window (L,) array ise her lane kendi pencere boyunu
+    kullanır (config batch'leri); buffer en büyük pencere kadardır.
+    """
+
+    def __init__(self, window, shape: Tuple[int, ...] = ()):
+        windows = np.asarray(window)
+        self.windows = None
+        if windows.ndim:
+            self.windows = np.maximum(1, windows.astype(np.int64))
+            self.lanes = np.arange(self.windows.size)
+            window = self.windows.max()
+        self.window = max(1, int(window))
+        self.buffer = np.zeros((self.window,) + tuple(shape))
+        self.total = np.zeros(shape)
+        self.count = 0
+        self.position = 0
+
+    def push(self, value):
+        """Yeni değeri ekle, son min(count, window) değerin ortalamasını döndür"""
+        if self.windows is not None:
+            return self._push_ragged(value)
+        self.total = self.total + (value - self.buffer[self.position])
+        self.buffer[self.position] = value
+        self.position += 1
+        if self.position == self.window:
+            self.position = 0
+            self.total = self.buffer.sum(axis=0)
+        if self.count < self.window:
+            self.count += 1
+        return self.total / self.count
+
+    def _push_ragged(self, value):
+        # Lane'in penceresinden çıkan değer: window_i adım önce yazılan slot
+        leaving = self.buffer[(self.position - self.windows) % self.window, self.lanes]
+        leaving = np.where(self.count >= self.windows, leaving, 0.0)
+        self.total = self.total + (value - leaving)
+        self.buffer[self.position] = value
+        self.position += 1
+        if self.count < self.window:
+            self.count += 1
+        if self.position == self.window:
+            self.position = 0
+            recent = self.buffer[(-1 - np.arange(self.window)) % self.window]
+            self.total = np.where(np.arange(self.window)[:, None] < self.windows, recent, 0.0).sum(axis=0)
+        return self.total / np.minimum(self.count, self.windows)
+
+
+def daily_circulating_supply(vesting, months: np.ndarray, interpolate: bool = False,
+                             fallback: float = 0.0) -> np.ndarray:
+    """Vesting çıktısından gün bazlı dolaşım arzı array'i (mainnet döngüsü doğrudan indeksler)
+
+    vesting: vesting DataFrame'i ya da ay bazlı circulating_supply array'i.
+    interpolate=False: ay içinde sabit (referans davranış, int(ay) satırı).
+    interpolate=True: unlock eğrileri aylar arasında günlük doğrusal interpolasyon.
+    """
+    if isinstance(vesting, pd.DataFrame):
+        circulating = vesting['circulating_supply'].to_numpy(dtype=float)
+    else:
+        circulating = np.asarray(vesting, dtype=float)
+    if len(circulating) == 0:
+        return np.full(len(months), float(fallback))
+    if interpolate:
+        return np.interp(months, np.arange(len(circulating)), circulating)
+    return circulating[np.minimum(len(circulating) - 1, months.astype(np.int64))]
+
+
+class LaneRecorder(ABC):
+    """Her gün sonunda lane durumunu alan temel kaydedici - alt sınıflar record'u tanımlar"""
+
+    def start(self, n_days: int, n_lanes: int, days: np.ndarray, months: np.ndarray):
+        pass
+
+    @abstractmethod
+    def record(self, day: int, values: Dict[str, np.ndarray]):
+        """day gününün lane değerleri (kolon -> (n_lanes,) array)"""
+
+    def finish(self):
+        pass
+
+
+class ColumnRecorder(LaneRecorder):
+    """Seçilen kolonları (gün × lane) buffer'lara yazar - küçük lane sayıları için"""
+
+    def __init__(self, fields: Sequence[str], dtype=np.float64):
+        self.fields = list(fields)
+        self.dtype = dtype
+        self.columns: Dict[str, np.ndarray] = {}
+
+    def start(self, n_days, n_lanes, days, months):
+        buffer = np.empty((len(self.fields), n_days, n_lanes), dtype=self.dtype)
+        self.columns = dict(zip(self.fields, buffer))
+
+    def record(self, day, values):
+        for name, column in self.columns.items():
+            column[day] = values[name]
+
+
+def mainnet_lane_params(config: EnhancedNXIDConfig, scenario: str) -> Dict:
+    """Config -> lane motoru parametreleri (skaler; batch'te lane başına array olur)"""
+    cfg = config
+    maturity_params = cfg.get_maturity_params()
+    staking_params = cfg.get_staking_params()
+    apy_params = cfg.get_apy_params()
+    day_multiplier, day_beta = scenario_day_arrays(cfg, scenario, int(cfg.projection_months * 30.44))
+    return {
+        'starting_mcap': float(cfg.starting_mcap_usdt),
+        'day_multiplier': day_multiplier,
+        'day_beta': day_beta,
+        'fundamental_growth_rate': cfg.fundamental_growth_rate,
+        'tax_period_months': cfg.mainnet_tax_period_months,
+        'daily_routine_burn': (cfg.total_supply * cfg.annual_burn_rate) / 365,
+        'burn_duration_years': cfg.burn_duration_years,
+        'market_staking_pool': cfg.total_supply * (cfg.market_staking_pool / 100),
+        'maturity_enabled': bool(maturity_params['enabled']),
+        'target_mcap': maturity_params['target_mcap'],
+        'volatility_sigma': cfg.market_volatility * 0.3,
+        'speculative_ratio': cfg.speculative_ratio,
+        'mcap_smoothing': cfg.mcap_smoothing_factor * 2,
+        'price_smoothing': cfg.price_smoothing_factor * 2,
+        'tax_rate': cfg.mainnet_tax_rate / 100,
+        'tax_to_staking': cfg.tax_to_staking_percentage / 100,
+        'tax_to_burn': cfg.tax_to_burn_percentage / 100,
+        'include_staked': bool(cfg.include_staked_in_circulating),
+        'velocity_window': int(staking_params['velocity_window']),
+        'velocity_smoothing': staking_params['velocity_smoothing'],
+        'velocity_impact': staking_params['price_velocity_impact'],
+        'base_rate': staking_params['base_rate'],
+        'min_rate': staking_params['min_rate'],
+        'max_rate': staking_params['max_rate'],
+        'momentum': staking_params['momentum'],
+        'smoothness': staking_params['smoothness'],
+        'entry_speed': staking_params['entry_speed'],
+        'exit_speed': staking_params['exit_speed'],
+        'apy_duration_years': apy_params['duration_years'],
+        'base_apy': apy_params['base_apy'],
+        'min_apy': apy_params['min_apy'],
+        'max_apy': apy_params['max_apy'],
+        'pool_factor': apy_params['pool_factor'],
+        'saturation_factor': apy_params['saturation_factor'],
+        'market_factor': apy_params['market_factor'],
+    }
+
+
+def run_mainnet_lanes(params: Dict, final_presale_price, base_circulating, n_days: int, n_lanes: int,
+                      noise: Callable[[int], np.ndarray], recorder: LaneRecorder) -> LaneRecorder:
+    """Lane motoru çekirdeği - params değerleri skaler ya da (n_lanes,) array olabilir
+
+    base_circulating: gün -> vesting dolaşım arzı; (gün,) / (gün, lane) array ya da callable.
+    noise: gün -> (n_lanes,) standart normal şok (volatility_sigma ile ölçeklenir).
+    Batch kullanımında her lane ayrı bir config'tir (bkz. batch.py); skaler
+    parametrelerle Monte Carlo yolları aynı kodu paylaşır.
+    """
+    p = params
+    circulating_at = base_circulating if callable(base_circulating) else base_circulating.__getitem__
+    days = np.arange(n_days)
+    months_arr = days / 30.44
+
+    # === LANE DURUMU ===
+    zeros = np.zeros(n_lanes)
+    ones = np.ones(n_lanes)
+    starting_mcap = p['starting_mcap']
+    final_presale_price = np.broadcast_to(np.asarray(final_presale_price, dtype=float), (n_lanes,))
+    mcap_ma = zeros + starting_mcap
+    price_ma = final_presale_price.copy()
+    staking_ma = zeros + p['base_rate']
+    staking_momentum = staking_ma.copy()
+    cumulative_staked = zeros.copy()
+    distributed_staking_rewards = zeros.copy()
+    cumulative_tax_collected = zeros.copy()
+    cumulative_tax_to_staking = zeros.copy()
+    cumulative_tax_burned = zeros.copy()
+    cumulative_routine_burned = 0.0
+    previous_price = final_presale_price.copy()
+    smoothed_velocity = zeros.copy()
+
+    velocity_window = RollingMean(p['velocity_window'], (n_lanes,))
+
+    # Lane başına (veya ortak) gün başına senaryo çarpanı / beta: (..., gün)
+    day_multiplier = np.asarray(p['day_multiplier'], dtype=float)
+    day_beta = np.asarray(p['day_beta'], dtype=float)
+    maturity_enabled = p['maturity_enabled']
+    mcap_keep, mcap_take = 1 - p['mcap_smoothing'], p['mcap_smoothing']
+    price_keep, price_take = 1 - p['price_smoothing'], p['price_smoothing']
+    market_staking_pool = p['market_staking_pool']
+    duration_years = p['apy_duration_years']
+
+    recorder.start(n_days, n_lanes, days, months_arr)
+
+    for day in range(n_days):
+        months = months_arr[day]
+        years = day / 365.25
+        quarter_multiplier = day_multiplier[..., day]
+        current_beta = day_beta[..., day]
+        fundamental_growth = (1 + p['fundamental_growth_rate']) ** months
+        cumulative_routine_burned = cumulative_routine_burned + np.where(
+            years <= p['burn_duration_years'], p['daily_routine_burn'], 0.0)
+        pool_remaining_ratio = 1 - np.minimum(1.0, years / duration_years)
+        pool_apy_multiplier = 1 + (1 - pool_remaining_ratio) * p['pool_factor']
+        max_daily_rewards_from_pool = np.where(
+            (pool_remaining_ratio > 0) & (years < duration_years),
+            (market_staking_pool * pool_remaining_ratio) / (duration_years * 365), 0.0)
+
+        # === SIMPLIFIED MATURITY DAMPING ===
+        distance_ratio = mcap_ma / p['target_mcap']
+        maturity_effect = np.where(distance_ratio < 1.0,
+                                   1.0 + (1.0 - distance_ratio) * 0.5,
+                                   1.0 - np.minimum(distance_ratio - 1.0, 1.0) * 0.3)
+        maturity_effect = np.clip(maturity_effect, 0.7, 1.5)
+        distance_ratio = np.where(maturity_enabled, distance_ratio, ones)
+        maturity_effect = np.where(maturity_enabled, maturity_effect, ones)
+
+        volatility_effect = np.clip(
+            1 + (p['volatility_sigma'] * noise(day)) * current_beta * 0.5, 0.95, 1.05)
+        base_growth = (p['speculative_ratio'] * (quarter_multiplier * maturity_effect) +
+                       (1 - p['speculative_ratio']) * fundamental_growth)
+        mcap_ma = mcap_ma * mcap_keep + starting_mcap * base_growth * volatility_effect * mcap_take
+        current_mcap = mcap_ma
+
+        # === TAX + BURN ===
+        circulating_today = circulating_at(day)
+        tax_active = months <= p['tax_period_months']
+        if np.any(tax_active):
+            estimate = np.where(circulating_today > 0, current_mcap / np.where(circulating_today > 0, circulating_today, 1),
+                                final_presale_price)
+            daily_tax_tokens = np.where(tax_active & (current_mcap > 0),
+                                        current_mcap * 0.003 * p['tax_rate'] / estimate, 0.0)
+            daily_tax_to_staking = daily_tax_tokens * p['tax_to_staking']
+            cumulative_tax_collected = cumulative_tax_collected + daily_tax_tokens
+            cumulative_tax_to_staking = cumulative_tax_to_staking + daily_tax_to_staking
+            cumulative_tax_burned = cumulative_tax_burned + daily_tax_tokens * p['tax_to_burn']
+        else:
+            daily_tax_to_staking = zeros
+
+        total_burned = cumulative_tax_burned + cumulative_routine_burned
+        gross_circulating = np.maximum(1, circulating_today - total_burned)
+
+        # === PRICE VELOCITY (ring buffer pencere ortalaması + smoothing) ===
+        current_price_estimate = current_mcap / gross_circulating
+        price_velocity = (current_price_estimate - previous_price) / np.maximum(previous_price, 0.00001)
+        window_mean = velocity_window.push(price_velocity)
+        if velocity_window.count > 1:
+            smoothed_velocity = (smoothed_velocity * (1 - p['velocity_smoothing']) +
+                                 window_mean * p['velocity_smoothing'])
+
+        velocity_effect = np.clip(1 + smoothed_velocity * p['velocity_impact'], 0.3, 2.0)
+        target_staking_rate = np.clip(p['base_rate'] * velocity_effect, p['min_rate'], p['max_rate'])
+
+        staking_momentum = staking_momentum * p['momentum'] + target_staking_rate * (1 - p['momentum'])
+        staking_ma = staking_ma * (1 - p['smoothness']) + staking_momentum * p['smoothness']
+
+        # === STAKING DİNAMİĞİ ===
+        increasing = staking_ma > cumulative_staked / gross_circulating
+        daily_new_staking = np.where(
+            increasing, (gross_circulating - cumulative_staked) * p['entry_speed'] * staking_ma, 0.0)
+        daily_unstaking = np.where(
+            increasing, 0.0,
+            np.maximum(0, cumulative_staked - gross_circulating * staking_ma) * p['exit_speed'])
+        cumulative_staked = np.minimum(np.maximum(0, cumulative_staked + daily_new_staking - daily_unstaking),
+                                       gross_circulating * p['max_rate'])
+        current_staking_ratio = cumulative_staked / gross_circulating
+
+        # === DİNAMİK APY + ÖDÜLLER ===
+        saturation_apy_multiplier = 1 - current_staking_ratio * p['saturation_factor']
+        if months > 0.1:
+            market_growth_rate = (current_mcap / starting_mcap) ** (1 / max(0.1, months)) - 1
+        else:
+            market_growth_rate = zeros
+        market_apy_multiplier = 1 + market_growth_rate * p['market_factor']
+        current_market_apy = np.clip(
+            p['base_apy'] * pool_apy_multiplier * saturation_apy_multiplier * market_apy_multiplier,
+            p['min_apy'], p['max_apy'])
+
+        total_staking_pool = market_staking_pool + cumulative_tax_to_staking
+        apy_based_daily_rewards = np.where(cumulative_staked > 0, cumulative_staked * current_market_apy / 100 / 365, 0.0)
+        daily_staking_rewards = (np.minimum(apy_based_daily_rewards, max_daily_rewards_from_pool) +
+                                 daily_tax_to_staking)
+        fits = distributed_staking_rewards + daily_staking_rewards <= total_staking_pool
+        daily_staking_rewards = np.where(fits, daily_staking_rewards,
+                                         np.maximum(0, total_staking_pool - distributed_staking_rewards))
+        distributed_staking_rewards = np.where(fits, distributed_staking_rewards + daily_staking_rewards,
+                                               total_staking_pool)
+
+        # === EFFECTIVE CIRCULATING + SMOOTH FİYAT ===
+        effective_circulating = np.where(p['include_staked'], gross_circulating,
+                                         np.maximum(1, gross_circulating - cumulative_staked))
+        price_ma = price_ma * price_keep + (current_mcap / effective_circulating) * price_take
+        previous_price = current_price_estimate
+
+        recorder.record(day, {
+            'mcap_usdt': current_mcap,
+            'token_fiyati': price_ma,
+            'gross_circulating_supply': gross_circulating,
+            'effective_circulating_supply': effective_circulating,
+            'maturity_effect': maturity_effect,
+            'maturity_distance_ratio': distance_ratio,
+            'volatilite_etkisi': volatility_effect,
+            'toplam_burned': total_burned,
+            'kumulatif_tax_toplam': cumulative_tax_collected,
+            'smoothed_price_velocity': smoothed_velocity,
+            'kumulatif_staked': cumulative_staked,
+            'staking_orani': current_staking_ratio,
+            'guncel_market_apy': current_market_apy,
+            'dagitilan_staking_odul': distributed_staking_rewards
+        })
+
+    recorder.finish()
+    return recorder
+
+
+def simulate_mainnet_lanes(config: EnhancedNXIDConfig, presale_df: pd.DataFrame,
+                           vesting_df: pd.DataFrame, scenario: str, n_lanes: int,
+                           rng: np.random.Generator, recorder: LaneRecorder) -> LaneRecorder:
+    """Mainnet fazını n_lanes bağımsız volatilite yolu için vektörel simüle et
+
+    Her gün tüm lane'ler için tek seferde N(0, market_volatility * 0.3) çekilir;
+    diğer tüm hesaplamalar simulate_mainnet_phase ile birebir aynıdır.
+    """
+    projection_days = int(config.projection_months * 30.44)
+    base_circulating = daily_circulating_supply(
+        vesting_df, np.arange(projection_days) / 30.44, getattr(config, 'vesting_daily_interpolation', False),
+        fallback=float(presale_df['kumulatif_satilan_token'].iloc[-1]))
+    return run_mainnet_lanes(mainnet_lane_params(config, scenario), float(presale_df['fiyat_usdt'].iloc[-1]),
+                             base_circulating, projection_days, n_lanes,
+                             lambda day: rng.standard_normal(n_lanes), recorder)
@@ -8,25 +8,155 @@ import pandas as pd
 import numpy as np
 import math
 import random
-import streamlit as st
+import logging
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
-from config import EnhancedNXIDConfig
+from config import DEFAULT_PRESALE_ENGINE, EnhancedNXIDConfig
+from mainnet_lanes import RollingMean, daily_circulating_supply
+from montecarlo import MonteCarloResult, run_mainnet_monte_carlo
+from vesting import vesting_table, vesting_schedule_frame
+from cohorts import CohortInterestTracking, ROISurface, build_roi_surface, cohort_interest_tracking, cohort_token_analysis
+from population import PopulationResult, simulate_investor_population
+from scenarios import quarter_index, scenario_day_arrays
+
+logger = logging.getLogger(__name__)
+
+# Mainnet çıktı kolonları (DataFrame sırası) - float olmayanlar ayrı eklenir
+MAINNET_COLUMNS = [
+    'gun', 'ay', 'yil', 'ceyrek', 'ceyrek_yil', 'yil_ici_ceyrek',
+    'mcap_usdt', 'gross_circulating_supply', 'effective_circulating_supply',
+    'token_fiyati', 'presale_fiyat_orani',
+    # McAp faktörleri
+    'starting_mcap', 'ceyrek_carpani', 'temelli_buyume', 'spekulatif_buyume',
+    'maturity_effect', 'maturity_distance_ratio', 'toplam_buyume', 'volatilite_etkisi',
+    'market_beta', 'mcap_moving_average', 'price_moving_average',
+    # Maturity analizi
+    'maturity_target_mcap', 'maturity_progress_pct', 'maturity_damping_enabled',
+    'maturity_convergence_speed',
+    # Tax ve burn
+    'tax_aktif', 'gunluk_tax_token', 'gunluk_tax_staking', 'gunluk_tax_burn',
+    'kumulatif_tax_toplam', 'kumulatif_tax_staking', 'kumulatif_tax_burned',
+    'gunluk_rutin_burn', 'kumulatif_rutin_burned', 'toplam_burned', 'etkili_toplam_arz',
+    # Staking
+    'price_velocity', 'smoothed_price_velocity', 'velocity_effect', 'target_staking_rate',
+    'staking_momentum', 'smooth_staking_orani', 'gunluk_yeni_staking', 'gunluk_unstaking',
+    'kumulatif_staked', 'staking_orani', 'staking_moving_average',
+    # Dynamic APY
+    'pool_remaining_ratio', 'pool_apy_multiplier', 'saturation_apy_multiplier',
+    'market_apy_multiplier', 'max_daily_pool_rewards', 'apy_based_rewards',
+    'guncel_market_apy', 'gunluk_staking_odul', 'dagitilan_staking_odul', 'toplam_staking_havuzu',
+    # Diğer
+    'senaryo', 'burn_orani_yuzdesi', 'dolasim_yuzdesi', 'staked_dolasim_yuzdesi',
+    'effective_dolasim_yuzdesi'
+]
+MAINNET_NON_FLOAT_COLUMNS = ('gun', 'ceyrek', 'ceyrek_yil', 'yil_ici_ceyrek',
+                             'maturity_damping_enabled', 'tax_aktif', 'senaryo')
+
+# Model çıktısını değiştiren her değişiklikte artırılır - disk cache anahtarının parçası
+ENGINE_VERSION = "6.3"
+
+# Her faz kök SeedSequence'in sabit bir alt akışını kullanır (çağrı sırasından bağımsız)
+RNG_STREAMS = {'presale': 0, 'mainnet': 1, 'population': 2}
+
+
+def presale_frame(cfg: EnhancedNXIDConfig, series: Dict[str, np.ndarray], ended: bool) -> pd.DataFrame:
+    """Presale gün serilerinden (fiyat, talep, APY, havuz...) standart presale DataFrame'i
+
+    Vectorized motor ve config batch motoru (batch.py) aynı türetilmiş kolonları kullanır.
+    """
+    price, sold, apy = series['price'], series['sold'], series['apy']
+    demand, rewards_paid, remaining_pool = series['demand'], series['rewards_paid'], series['remaining_pool']
+    n_days = len(price)
+    days = np.arange(n_days)
+    presale_tokens_for_sale = cfg.total_supply * (cfg.presale_allocation / 100)
+    presale_staking_reward_pool = cfg.total_supply * (cfg.presale_staking_pool / 100)
+    remaining_days = np.maximum(1, int(cfg.presale_days) - days)
+    price_ratio = price / cfg.start_price_usdt
+
+    cumulative_sold = np.cumsum(sold)
+    distributed = np.cumsum(rewards_paid)
+    daily_rate = apy / 100 / 365
+
+    has_projection = (cumulative_sold > 0) & (remaining_days > 1)
+    projected = np.where(has_projection, cumulative_sold * daily_rate * (remaining_days - 1), 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sufficiency = np.where(projected > 0, remaining_pool / projected, 1.0)
+
+    presale_ended = np.zeros(n_days, dtype=bool)
+    presale_ended[-1:] = ended
+
+    return pd.DataFrame({
+        'gun': days + 1,
+        'fiyat_usdt': price,
+        'gunluk_talep_usdt': demand,
+        'gunluk_satilan_token': sold,
+        'kumulatif_toplanan_usdt': np.cumsum(demand),
+        'kumulatif_satilan_token': cumulative_sold,
+        'guncel_apy': apy,
+        'dinamik_apy': apy,
+        'ana_para_tokens': cumulative_sold,
+        'gunluk_oduller': rewards_paid,
+        'toplam_dagitilan_odul': distributed,
+        'toplam_balance': cumulative_sold + distributed,
+        'kalan_odul_havuzu': remaining_pool,
+        'havuz_tukenme_yuzdesi': (distributed / presale_staking_reward_pool) * 100,
+        'kalan_gun_sayisi': remaining_days,
+        'tahmin_edilen_toplam_odul': projected,
+        'havuz_yeterlilik_orani': sufficiency,
+        'gunluk_faiz_orani': daily_rate,
+        'faiz_tipi': 'SIMPLE',
+        'temel_talep': series['base_demand'],
+        'apy_etkisi': series['apy_effect'],
+        'fiyat_etkisi': series['price_effect'],
+        'erken_bonus': series['early_bonus'],
+        'volatilite_faktoru': series['volatility'],
+        'presale_bitti': presale_ended,
+        'satilan_token_yuzdesi': (cumulative_sold / presale_tokens_for_sale) * 100,
+        'fiyat_artisi': (price_ratio - 1) * 100,
+        'fiyat_orani': price_ratio
+    })
+
+
+@dataclass
+class MainnetRunState:
+    """Tek bir mainnet çalıştırmasına ait sıralı durum - model instance'ında tutulmaz"""
+    price_velocity_window: RollingMean
+    smoothed_velocity: Optional[float] = None
+    maturity_distance_history: List[float] = field(default_factory=list)
+
 
 class EnhancedTokenomicsModel:
-    """Enhanced NXID Tokenomics Model  - Simplified Maturity + Dynamic Systems"""
+    """Enhanced NXID Tokenomics Model  - Simplified Maturity + Dynamic Systems
+
+    Reentrant: global np.random kullanılmaz ve çalıştırmalar arasında instance
+    üzerinde durum tutulmaz. Her faz kendi Generator'ını model SeedSequence'ından
+    türetir, böylece aynı (veya farklı) instance'lar thread / process'lerde
+    paralel çalışabilir ve aynı seed aynı sonucu verir.
+    """
     
-    def __init__(self, config: EnhancedNXIDConfig):
+    def __init__(self, config: EnhancedNXIDConfig, seed: Optional[int] = None):
         self.config = config
-        # Enhanced tracking için historiler
-        self.price_history = []
-        self.mcap_history = []
-        self.staking_history = []
-        self.price_velocity_history = []
-        self.maturity_distance_history = []
+        self.seed = int(getattr(config, 'simulation_seed', 42) if seed is None else seed)
+        self.seed_sequence = np.random.SeedSequence(self.seed)
+    
+    def make_rng(self, stream: str) -> np.random.Generator:
+        """Faza özel, çalıştırmaya yerel Generator (aynı seed + stream -> aynı sayılar)"""
+        child = np.random.SeedSequence(self.seed_sequence.entropy,
+                                       spawn_key=self.seed_sequence.spawn_key + (RNG_STREAMS[stream],))
+        return np.random.default_rng(child)
         
-    def simulate_presale_phase(self) -> pd.DataFrame:
-        """PRESALE PHASE - Simple Faiz + Dinamik APY () - AYNI"""
-        np.random.seed(42)
+    def simulate_presale_phase(self, engine: Optional[str] = None) -> pd.DataFrame:
+        """PRESALE PHASE - Simple Faiz + Dinamik APY - engine: "loop" | "vectorized" """
+        engine = engine or getattr(self.config, 'presale_engine', DEFAULT_PRESALE_ENGINE)
+        if engine == "vectorized":
+            return self._simulate_presale_phase_vectorized()
+        if engine != "loop":
+            raise ValueError(f"Bilinmeyen presale engine: {engine}")
+        return self._simulate_presale_phase_loop()
+    
+    def _simulate_presale_phase_loop(self) -> pd.DataFrame:
+        """Referans presale döngüsü - gün gün Python hesaplaması"""
+        rng = self.make_rng('presale')
         
         presale_tokens_for_sale = self.config.total_supply * (self.config.presale_allocation / 100)
         presale_staking_reward_pool = self.config.total_supply * (self.config.presale_staking_pool / 100)
@@ -71,7 +201,7 @@ class EnhancedTokenomicsModel:
             
             early_bonus = self.config.early_bird_bonus if day < 30 else 1.0
             
-            volatility_factor = 1 + np.random.normal(0, self.config.demand_volatility * 0.5)
+            volatility_factor = 1 + rng.normal(0, self.config.demand_volatility * 0.5)
             volatility_factor = max(0.98, min(1.02, volatility_factor))
             
             # Toplam talep
@@ -158,199 +288,292 @@ class EnhancedTokenomicsModel:
                 break
         
         return pd.DataFrame(presale_data)
-    
+
+    def _simulate_presale_phase_vectorized(self) -> pd.DataFrame:
+        """Array tabanlı presale motoru - loop ile aynı çıktı (tolerans dahilinde)
+
+        Fiyat, temel talep, fiyat etkisi, erken bonus ve volatilite gün cinsinden
+        kapalı formda olduğu için tüm presale boyunca array olarak hesaplanır.
+        Sadece APY / ödül havuzu yinelemesi sıralı döngüde kalır.
+        """
+        rng = self.make_rng('presale')
+
+        cfg = self.config
+        presale_days = int(cfg.presale_days)
+        presale_tokens_for_sale = cfg.total_supply * (cfg.presale_allocation / 100)
+        presale_staking_reward_pool = cfg.total_supply * (cfg.presale_staking_pool / 100)
+
+        # === KAPALI FORM SERİLER ===
+        days = np.arange(presale_days)
+        price = cfg.start_price_usdt * ((1 + cfg.daily_price_increase / 100) ** days)
+        base_demand = cfg.base_daily_demand_usdt * (cfg.demand_growth_rate ** days)
+        price_ratio = price / cfg.start_price_usdt
+        price_effect = np.clip((1 / price_ratio) ** cfg.price_resistance_factor, 0.3, 2.0)
+        early_bonus = np.where(days < 30, cfg.early_bird_bonus, 1.0)
+        volatility = np.clip(1 + rng.normal(0, cfg.demand_volatility * 0.5, presale_days), 0.98, 1.02)
+        demand_ex_apy = base_demand * price_effect * early_bonus * volatility
+
+        # === SIRALI APY / HAVUZ YİNELEMESİ ===
+        apy = np.empty(presale_days)
+        apy_effect = np.empty(presale_days)
+        demand = np.empty(presale_days)
+        sold = np.empty(presale_days)
+        rewards_paid = np.empty(presale_days)
+        remaining_pool = np.empty(presale_days)
+
+        max_apy = cfg.max_apy
+        min_apy = cfg.minimum_staking_apy
+        apy_gain = cfg.apy_demand_multiplier - 1
+        max_boost = cfg.max_apy_boost
+        price_list = price.tolist()
+        demand_list = demand_ex_apy.tolist()
+
+        pool = presale_staking_reward_pool
+        principal = 0.0
+        n_days = presale_days
+        ended = False
+
+        for day in range(presale_days):
+            day_remaining = presale_days - day if presale_days - day > 1 else 1
+
+            if principal > 0 and pool > 0:
+                current_apy = pool / day_remaining / principal * 365 * 100
+                current_apy = max(min(current_apy, max_apy), min_apy)
+            else:
+                current_apy = max_apy if day == 0 else min_apy
+
+            effect = min(1 + (current_apy / max_apy * apy_gain), max_boost)
+            day_demand = demand_list[day] * effect
+            day_price = price_list[day]
+            day_sold = day_demand / day_price
+
+            remaining_sale_tokens = presale_tokens_for_sale - principal
+            ended = day_sold > remaining_sale_tokens
+            if ended:
+                day_sold = max(0, remaining_sale_tokens)
+                day_demand = day_sold * day_price
+
+            principal += day_sold
+
+            if principal > 0 and pool > 0:
+                day_rewards = principal * (current_apy / 100 / 365)
+                if day_rewards > pool:
+                    day_rewards = pool
+                pool -= day_rewards
+            else:
+                day_rewards = 0
+
+            apy[day] = current_apy
+            apy_effect[day] = effect
+            demand[day] = day_demand
+            sold[day] = day_sold
+            rewards_paid[day] = day_rewards
+            remaining_pool[day] = pool
+
+            if ended:
+                n_days = day + 1
+                break
+
+        span = slice(0, n_days)
+        return presale_frame(cfg, {
+            'price': price[span], 'base_demand': base_demand[span], 'price_effect': price_effect[span],
+            'early_bonus': early_bonus[span], 'volatility': volatility[span], 'apy': apy[span],
+            'apy_effect': apy_effect[span], 'demand': demand[span], 'sold': sold[span],
+            'rewards_paid': rewards_paid[span], 'remaining_pool': remaining_pool[span]
+        }, ended)
+
     def generate_weekly_token_analysis(self, presale_df: pd.DataFrame) -> pd.DataFrame:
-        """Haftalık token analizi - AYNI """
-        weekly_data = []
-        weeks = len(presale_df) // 7
-        
-        for week in range(1, min(weeks + 1, 26)):
-            week_start_day = (week - 1) * 7
-            week_day_index = min(week_start_day, len(presale_df) - 1)
-            
-            week_price = presale_df.iloc[week_day_index]['fiyat_usdt']
-            week_apy = presale_df.iloc[week_day_index]['guncel_apy']
-            
-            investment_amount = self.config.weekly_investment_amount
-            tokens_bought = investment_amount / week_price
-            principal_tokens = tokens_bought
-            total_staking_rewards = 0
-            
-            for day_offset in range(week_start_day, len(presale_df)):
-                if day_offset < len(presale_df):
-                    daily_apy = presale_df.iloc[day_offset]['guncel_apy']
-                    daily_rate = daily_apy / 100 / 365
-                    daily_reward = principal_tokens * daily_rate
-                    
-                    if 'kalan_odul_havuzu' in presale_df.columns:
-                        remaining_pool = presale_df.iloc[day_offset]['kalan_odul_havuzu']
-                        if remaining_pool <= 0:
-                            daily_reward = 0
-                        else:
-                            initial_pool = self.config.total_supply * (self.config.presale_staking_pool / 100)
-                            pool_health = remaining_pool / initial_pool
-                            daily_reward = daily_reward * max(0.1, pool_health)
-                    
-                    total_staking_rewards += daily_reward
-            
-            current_balance = principal_tokens + total_staking_rewards
-            token_gain_percentage = (total_staking_rewards / tokens_bought) * 100 if tokens_bought > 0 else 0
-            
-            weekly_data.append({
-                'hafta': week,
-                'yatirim_gunu': week_start_day + 1,
-                'hafta_fiyati': week_price,
-                'hafta_apy': week_apy,
-                'yatirim_miktari_usdt': investment_amount,
-                'alinan_token': tokens_bought,
-                'ana_para_tokens': principal_tokens,
-                'staking_kazanci': total_staking_rewards,
-                'toplam_token': current_balance,
-                'token_kazanc_yuzdesi': token_gain_percentage,
-                'gun_sayisi': len(presale_df) - week_start_day,
-                'faiz_tipi': 'SIMPLE'
-            })
-        
-        return pd.DataFrame(weekly_data)
+        """Haftalık token analizi - suffix cumsum ile O(gün + kohort) (bkz. cohorts.py)
+
+        Kohort periyodu config.cohort_days (varsayılan 7 = haftalık); kohort sayısı sınırı yok.
+        """
+        return cohort_token_analysis(presale_df, self.config,
+                                     cohort_days=getattr(self.config, 'cohort_days', 7))
+    
+    def generate_weekly_interest_tracking(self, presale_df: pd.DataFrame,
+                                          weekly_df: pd.DataFrame) -> CohortInterestTracking:
+        """Haftalık kohortların gün gün faiz matrisi (kohort × presale günü, bkz. cohorts.py)"""
+        return cohort_interest_tracking(presale_df, weekly_df, self.config)
     
-    def simulate_mainnet_phase(self, presale_df: pd.DataFrame, vesting_df: pd.DataFrame, 
+    def calculate_cohort_roi_surface(self, presale_df: pd.DataFrame, mainnet_df: pd.DataFrame,
+                                     cohort_stride: int = 1, day_stride: int = 1) -> ROISurface:
+        """💹 Günlük giriş kohortu ROI yüzeyi (presale_günü × mainnet_günü, float32)"""
+        return build_roi_surface(presale_df, mainnet_df, self.config,
+                                 cohort_stride=cohort_stride, day_stride=day_stride)
+    
+    def simulate_mainnet_phase(self, presale_df: pd.DataFrame, vesting_df: pd.DataFrame,
                               scenario: str = "base") -> pd.DataFrame:
-        """🚀 ENHANCED MAINNET PHASE  - Simplified Maturity + Dynamic Systems"""
-        np.random.seed(123)
-        
+        """🚀 ENHANCED MAINNET PHASE  - Simplified Maturity + Dynamic Systems
+
+        Çıktı kolonları önceden ayrılmış NumPy buffer'lara yazılır ve sonunda
+        kopyalanmadan DataFrame'e sarılır (gün başına dict oluşturulmaz).
+        """
+        rng = self.make_rng('mainnet')
+        cfg = self.config
+
         # Presale verileri
-        final_presale_raised = presale_df['kumulatif_toplanan_usdt'].iloc[-1]
         final_presale_tokens = presale_df['kumulatif_satilan_token'].iloc[-1]
         final_presale_price = presale_df['fiyat_usdt'].iloc[-1]
-        
+
         # Starting McAp (user input)
-        starting_mcap = self.config.starting_mcap_usdt
-        
-        # Senaryo çarpanları
-        if scenario == "bear":
-            scenario_multipliers = self.config.bear_scenario_multipliers
-        elif scenario == "bull":
-            scenario_multipliers = self.config.bull_scenario_multipliers
-        else:
-            scenario_multipliers = self.config.base_scenario_multipliers
-        
-        projection_days = int(self.config.projection_months * 30.44)
-        mainnet_data = []
-        
-        # Enhanced parametreler 
-        maturity_params = self.config.get_maturity_params()
-        staking_params = self.config.get_staking_params()
-        apy_params = self.config.get_apy_params()
-        
+        starting_mcap = cfg.starting_mcap_usdt
+
+        projection_days = int(cfg.projection_months * 30.44)
+
+        # Senaryo çarpanları + market beta - gün başına array (bkz. scenarios.py)
+        quarter_multiplier, current_beta = scenario_day_arrays(cfg, scenario, projection_days)
+
+        # Enhanced parametreler
+        maturity_params = cfg.get_maturity_params()
+        staking_params = cfg.get_staking_params()
+        apy_params = cfg.get_apy_params()
+
         # Market staking pool
-        market_staking_pool = self.config.total_supply * (self.config.market_staking_pool / 100)
-        
-        # Enhanced akümülatörler 
+        market_staking_pool = cfg.total_supply * (cfg.market_staking_pool / 100)
+
+        # === KOLONLAR İÇİN ÖNCEDEN AYRILMIŞ BUFFER ===
+        float_columns = [c for c in MAINNET_COLUMNS if c not in MAINNET_NON_FLOAT_COLUMNS]
+        buffer = np.empty((len(float_columns), projection_days))
+        out = dict(zip(float_columns, buffer))
+
+        # === GÜNE BAĞLI KAPALI FORM SERİLER ===
+        days = np.arange(projection_days)
+        months_arr = days / 30.44
+        years_arr = days / 365.25
+        quarter = quarter_index(projection_days)
+        fundamental_growth = (1 + cfg.fundamental_growth_rate) ** months_arr
+
+        # REDUCED Volatilite - tüm günler için tek seferde
+        daily_volatility = rng.normal(0, cfg.market_volatility * 0.3, projection_days)
+        volatility_effect = np.clip(1 + daily_volatility * current_beta * 0.5, 0.95, 1.05)
+
+        tax_active = months_arr <= cfg.mainnet_tax_period_months
+        daily_routine_burn = np.where(years_arr <= cfg.burn_duration_years,
+                                      (cfg.total_supply * cfg.annual_burn_rate) / 365, 0.0)
+        cumulative_routine_burned = np.cumsum(daily_routine_burn)
+
+        pool_progress = np.minimum(1.0, years_arr / apy_params['duration_years'])
+        pool_remaining_ratio = 1 - pool_progress
+        pool_apy_multiplier = 1 + (1 - pool_remaining_ratio) * apy_params['pool_factor']
+        max_daily_rewards_from_pool = np.where(
+            (pool_remaining_ratio > 0) & (years_arr < apy_params['duration_years']),
+            (market_staking_pool * pool_remaining_ratio) / (apy_params['duration_years'] * 365), 0.0)
+
+        # === SIRALI DURUM (scalar) ===
         cumulative_tax_collected = 0
         cumulative_tax_to_staking = 0
         cumulative_tax_burned = 0
-        cumulative_routine_burned = 0
         cumulative_staked = 0
         distributed_staking_rewards = 0
         previous_price = final_presale_price
-        
+
         # Enhanced moving averages
         mcap_ma = starting_mcap
         price_ma = final_presale_price
         staking_ma = staking_params['base_rate']
         staking_momentum = staking_params['base_rate']
-        
+
+        maturity_enabled = maturity_params['enabled']
+        target_mcap = maturity_params['target_mcap']
+        speculative_ratio = cfg.speculative_ratio
+        mcap_keep, mcap_take = 1 - cfg.mcap_smoothing_factor * 2, cfg.mcap_smoothing_factor * 2
+        price_keep, price_take = 1 - cfg.price_smoothing_factor * 2, cfg.price_smoothing_factor * 2
+        tax_rate = cfg.mainnet_tax_rate / 100
+        tax_to_staking = cfg.tax_to_staking_percentage / 100
+        tax_to_burn = cfg.tax_to_burn_percentage / 100
+        state = MainnetRunState(RollingMean(staking_params['velocity_window']))
+        velocity_smoothing = staking_params['velocity_smoothing']
+        velocity_impact = staking_params['price_velocity_impact']
+        base_rate = staking_params['base_rate']
+        min_rate, max_rate = staking_params['min_rate'], staking_params['max_rate']
+        momentum = staking_params['momentum']
+        smoothness = staking_params['smoothness']
+        entry_speed, exit_speed = staking_params['entry_speed'], staking_params['exit_speed']
+        base_apy, min_apy, max_apy = apy_params['base_apy'], apy_params['min_apy'], apy_params['max_apy']
+        saturation_factor = apy_params['saturation_factor']
+        market_factor = apy_params['market_factor']
+        include_staked = cfg.include_staked_in_circulating
+
+        # Vesting dolaşım arzı gün bazlı array olarak bir kez çıkarılır (günlük iloc yok)
+        circulating_list = daily_circulating_supply(
+            vesting_df, months_arr, cfg.vesting_daily_interpolation, fallback=final_presale_tokens).tolist()
+
+        months_list = months_arr.tolist()
+        multiplier_list = quarter_multiplier.tolist()
+        fundamental_list = fundamental_growth.tolist()
+        volatility_list = volatility_effect.tolist()
+        tax_active_list = tax_active.tolist()
+        routine_burned_list = cumulative_routine_burned.tolist()
+        pool_multiplier_list = pool_apy_multiplier.tolist()
+        pool_rewards_list = max_daily_rewards_from_pool.tolist()
+
+        # Döngüde yazılan kolonlar
+        mcap_col = out['mcap_usdt']
+        gross_col = out['gross_circulating_supply']
+        effective_col = out['effective_circulating_supply']
+        price_col = out['token_fiyati']
+        maturity_effect_col = out['maturity_effect']
+        distance_col = out['maturity_distance_ratio']
+        growth_col = out['toplam_buyume']
+        tax_tokens_col = out['gunluk_tax_token']
+        tax_staking_col = out['gunluk_tax_staking']
+        tax_burn_col = out['gunluk_tax_burn']
+        tax_total_cum_col = out['kumulatif_tax_toplam']
+        tax_staking_cum_col = out['kumulatif_tax_staking']
+        tax_burned_cum_col = out['kumulatif_tax_burned']
+        velocity_col = out['price_velocity']
+        smoothed_velocity_col = out['smoothed_price_velocity']
+        velocity_effect_col = out['velocity_effect']
+        target_rate_col = out['target_staking_rate']
+        momentum_col = out['staking_momentum']
+        smooth_staking_col = out['smooth_staking_orani']
+        new_staking_col = out['gunluk_yeni_staking']
+        unstaking_col = out['gunluk_unstaking']
+        staked_col = out['kumulatif_staked']
+        staking_ratio_col = out['staking_orani']
+        saturation_col = out['saturation_apy_multiplier']
+        market_multiplier_col = out['market_apy_multiplier']
+        apy_rewards_col = out['apy_based_rewards']
+        apy_col = out['guncel_market_apy']
+        rewards_col = out['gunluk_staking_odul']
+        distributed_col = out['dagitilan_staking_odul']
+
         for day in range(projection_days):
-            months = day / 30.44
-            years = day / 365.25
-            quarter = int(months // 3) % 16
-            quarter_year = quarter // 4 + 1
-            quarter_in_year = quarter % 4 + 1
-            
-            # === SIMPLIFIED MATURITY DAMPING CALCULATION  ===
-            
-            # 1. Çeyreklik senaryo etkisi
-            if quarter < len(scenario_multipliers):
-                quarter_multiplier = scenario_multipliers[quarter]
-            else:
-                quarter_multiplier = scenario_multipliers[-1]
-            
-            # 2. Market beta
-            if quarter < len(self.config.market_beta_per_quarter):
-                current_beta = self.config.market_beta_per_quarter[quarter]
-            else:
-                current_beta = self.config.market_beta_per_quarter[-1]
-            
-            # 3. SIMPLIFIED MATURITY DAMPING 
-            if maturity_params['enabled']:
-                target_mcap = maturity_params['target_mcap']
-                current_mcap_estimate = mcap_ma
-                
-                # Simple distance ratio calculation
-                distance_ratio = current_mcap_estimate / target_mcap
-                
-                # Simple maturity effect based on distance
+            months = months_list[day]
+
+            # === SIMPLIFIED MATURITY DAMPING ===
+            if maturity_enabled:
+                distance_ratio = mcap_ma / target_mcap
                 if distance_ratio < 1.0:  # Below target -> BOOST
-                    # Further below = stronger boost
-                    boost_strength = (1.0 - distance_ratio)  # 0 to 1
-                    maturity_effect = 1.0 + boost_strength * 0.5  # Max 1.5x boost
+                    maturity_effect = 1.0 + (1.0 - distance_ratio) * 0.5  # Max 1.5x boost
                 else:  # Above target -> DAMP
-                    # Further above = stronger damping
-                    excess_ratio = distance_ratio - 1.0
-                    damp_strength = min(excess_ratio, 1.0)  # Cap at 1.0
-                    maturity_effect = 1.0 - damp_strength * 0.3  # Max 0.7x damping
-                
-                # Smooth maturity effect transitions
+                    maturity_effect = 1.0 - min(distance_ratio - 1.0, 1.0) * 0.3  # Max 0.7x damping
                 maturity_effect = max(0.7, min(1.5, maturity_effect))
-                
-                # Track distance for analysis
-                self.maturity_distance_history.append(distance_ratio - 1.0)
+                state.maturity_distance_history.append(distance_ratio - 1.0)
             else:
                 maturity_effect = 1.0
-                distance_ratio = current_mcap_estimate / target_mcap if 'target_mcap' in locals() else 1.0
-            
-            # 4. Base growth calculation - SIMPLIFIED
-            fundamental_growth = (1 + self.config.fundamental_growth_rate) ** months
-            
-            # Simplified speculative growth - NO testere pattern
-            base_speculative = quarter_multiplier * maturity_effect
-            speculative_growth = base_speculative
-            
+                distance_ratio = 1.0
+
+            # Base growth + STRONGER Smooth McAp
             base_growth = (
-                self.config.speculative_ratio * speculative_growth + 
-                (1 - self.config.speculative_ratio) * fundamental_growth
+                speculative_ratio * (multiplier_list[day] * maturity_effect) +
+                (1 - speculative_ratio) * fundamental_list[day]
             )
-            
-            # 5. REDUCED Volatilite  - Less testere
-            daily_volatility = np.random.normal(0, self.config.market_volatility * 0.3)  # Reduced volatility
-            volatility_effect = 1 + daily_volatility * current_beta * 0.5  # Reduced impact
-            volatility_effect = max(0.95, min(1.05, volatility_effect))  # Tighter bounds
-            
-            # Raw McAp
-            raw_mcap = starting_mcap * base_growth * volatility_effect
-            
-            # STRONGER Smooth McAp - Less testere
-            mcap_ma = mcap_ma * (1 - self.config.mcap_smoothing_factor * 2) + raw_mcap * (self.config.mcap_smoothing_factor * 2)
+            raw_mcap = starting_mcap * base_growth * volatility_list[day]
+            mcap_ma = mcap_ma * mcap_keep + raw_mcap * mcap_take
             current_mcap = mcap_ma
-            
-            # === ENHANCED CIRCULATING SUPPLY WITH REAL CALCULATION  ===
-            month_index = min(len(vesting_df) - 1, int(months))
-            if month_index < len(vesting_df):
-                base_circulating = vesting_df.iloc[month_index]['circulating_supply']
-            else:
-                base_circulating = final_presale_tokens
-            
+
+            # === ENHANCED CIRCULATING SUPPLY WITH REAL CALCULATION ===
+            base_circulating = circulating_list[day]
+
             # Tax sistemi
-            tax_active = months <= self.config.mainnet_tax_period_months
-            if tax_active and current_mcap > 0:
-                daily_volume = current_mcap * 0.003
-                daily_tax_usdt = daily_volume * (self.config.mainnet_tax_rate / 100)
+            if tax_active_list[day] and current_mcap > 0:
+                daily_tax_usdt = current_mcap * 0.003 * tax_rate
                 current_price_estimate = current_mcap / base_circulating if base_circulating > 0 else final_presale_price
                 daily_tax_tokens = daily_tax_usdt / current_price_estimate
-                
-                daily_tax_to_staking = daily_tax_tokens * (self.config.tax_to_staking_percentage / 100)
-                daily_tax_to_burn = daily_tax_tokens * (self.config.tax_to_burn_percentage / 100)
-                
+                daily_tax_to_staking = daily_tax_tokens * tax_to_staking
+                daily_tax_to_burn = daily_tax_tokens * tax_to_burn
+
                 cumulative_tax_collected += daily_tax_tokens
                 cumulative_tax_to_staking += daily_tax_to_staking
                 cumulative_tax_burned += daily_tax_to_burn
@@ -358,342 +581,190 @@ class EnhancedTokenomicsModel:
                 daily_tax_tokens = 0
                 daily_tax_to_staking = 0
                 daily_tax_to_burn = 0
-            
-            # Rutin burn
-            if years <= self.config.burn_duration_years:
-                daily_routine_burn = (self.config.total_supply * self.config.annual_burn_rate) / 365
-                cumulative_routine_burned += daily_routine_burn
-            else:
-                daily_routine_burn = 0
-            
-            # TOTAL BURNED TOKENS
-            total_burned = cumulative_tax_burned + cumulative_routine_burned
-            
-            # REAL CIRCULATING SUPPLY 
+
+            # REAL CIRCULATING SUPPLY (tax + rutin burn düşülmüş)
+            total_burned = cumulative_tax_burned + routine_burned_list[day]
             gross_circulating = max(1, base_circulating - total_burned)
-            
-            # === ENHANCED DYNAMIC STAKING SYSTEM  ===
-            
-            # Price estimation for staking calculations
+
+            # === ENHANCED DYNAMIC STAKING SYSTEM ===
             current_price_estimate = current_mcap / gross_circulating if gross_circulating > 0 else final_presale_price
-            
-            # ENHANCED PRICE VELOCITY CALCULATION 
+
+            # ENHANCED PRICE VELOCITY CALCULATION
             price_velocity = (current_price_estimate - previous_price) / max(previous_price, 0.00001)
-            self.price_velocity_history.append(price_velocity)
-            
-            # Price velocity smoothing
-            if len(self.price_velocity_history) > staking_params['velocity_window']:
-                self.price_velocity_history.pop(0)
-            
-            # Smoothed price velocity
-            velocity_smoothing = staking_params['velocity_smoothing']
-            if len(self.price_velocity_history) > 1:
-                raw_avg_velocity = np.mean(self.price_velocity_history[-staking_params['velocity_window']:])
-                if hasattr(self, 'smoothed_velocity'):
-                    self.smoothed_velocity = self.smoothed_velocity * (1 - velocity_smoothing) + raw_avg_velocity * velocity_smoothing
+            raw_avg_velocity = float(state.price_velocity_window.push(price_velocity))
+
+            if state.price_velocity_window.count > 1:
+                if state.smoothed_velocity is not None:
+                    state.smoothed_velocity = state.smoothed_velocity * (1 - velocity_smoothing) + raw_avg_velocity * velocity_smoothing
                 else:
-                    self.smoothed_velocity = raw_avg_velocity
+                    state.smoothed_velocity = raw_avg_velocity
             else:
-                self.smoothed_velocity = 0
-            
-            # ENHANCED PRICE VELOCITY IMPACT ON STAKING 
-            velocity_impact = staking_params['price_velocity_impact']
-            velocity_effect = 1 + self.smoothed_velocity * velocity_impact
-            velocity_effect = max(0.3, min(2.0, velocity_effect))
-            
-            # Target staking rate calculation
-            base_rate = staking_params['base_rate']
-            target_staking_rate = base_rate * velocity_effect
-            target_staking_rate = max(staking_params['min_rate'], 
-                                    min(staking_params['max_rate'], target_staking_rate))
-            
-            # ENHANCED STAKING MOMENTUM 
-            momentum = staking_params['momentum']
+                state.smoothed_velocity = 0
+
+            velocity_effect = max(0.3, min(2.0, 1 + state.smoothed_velocity * velocity_impact))
+            target_staking_rate = max(min_rate, min(max_rate, base_rate * velocity_effect))
+
+            # ENHANCED STAKING MOMENTUM + smooth geçiş
             staking_momentum = staking_momentum * momentum + target_staking_rate * (1 - momentum)
-            
-            # Smooth staking transition
-            smoothness = staking_params['smoothness']
             staking_ma = staking_ma * (1 - smoothness) + staking_momentum * smoothness
-            smooth_staking_rate = staking_ma
-            
-            # ENHANCED STAKING DYNAMICS 
+
             current_staking_ratio = cumulative_staked / gross_circulating if gross_circulating > 0 else 0
-            available_for_staking = gross_circulating - cumulative_staked
-            
-            if smooth_staking_rate > current_staking_ratio:
+            if staking_ma > current_staking_ratio:
                 # Staking artıyor
-                entry_speed = staking_params['entry_speed']
-                daily_new_staking = available_for_staking * entry_speed * smooth_staking_rate
+                daily_new_staking = (gross_circulating - cumulative_staked) * entry_speed * staking_ma
                 daily_unstaking = 0
             else:
                 # Staking azalıyor
-                exit_speed = staking_params['exit_speed']
-                target_staked = gross_circulating * smooth_staking_rate
-                excess_staked = max(0, cumulative_staked - target_staked)
+                excess_staked = max(0, cumulative_staked - gross_circulating * staking_ma)
                 daily_unstaking = excess_staked * exit_speed
                 daily_new_staking = 0
-            
-            # Update staking
+
             cumulative_staked = max(0, cumulative_staked + daily_new_staking - daily_unstaking)
-            cumulative_staked = min(cumulative_staked, gross_circulating * staking_params['max_rate'])
-            
-            # === ENHANCED DYNAMIC STAKING APY  ===
-            
-            # Pool depletion progress
-            pool_progress = min(1.0, years / apy_params['duration_years'])
-            pool_remaining_ratio = 1 - pool_progress
-            
-            # Current staking ratio
+            cumulative_staked = min(cumulative_staked, gross_circulating * max_rate)
+
+            # === ENHANCED DYNAMIC STAKING APY ===
             current_staking_ratio = cumulative_staked / gross_circulating if gross_circulating > 0 else 0
-            
-            # ENHANCED APY CALCULATION 
-            base_apy = apy_params['base_apy']
-            min_apy = apy_params['min_apy']
-            max_apy = apy_params['max_apy']
-            
-            # Pool depletion factor
-            pool_factor = apy_params['pool_factor']
-            pool_apy_multiplier = 1 + (1 - pool_remaining_ratio) * pool_factor
-            
-            # Staking saturation factor (ters korelasyon)
-            saturation_factor = apy_params['saturation_factor']
             saturation_apy_multiplier = 1 - current_staking_ratio * saturation_factor
-            
-            # Market demand factor (basit market cap growth rate)
             market_growth_rate = (current_mcap / starting_mcap) ** (1 / max(0.1, months)) - 1 if months > 0.1 else 0
-            market_factor = apy_params['market_factor']
             market_apy_multiplier = 1 + market_growth_rate * market_factor
-            
-            # Combined APY
-            current_market_apy = base_apy * pool_apy_multiplier * saturation_apy_multiplier * market_apy_multiplier
+
+            current_market_apy = base_apy * pool_multiplier_list[day] * saturation_apy_multiplier * market_apy_multiplier
             current_market_apy = max(min_apy, min(max_apy, current_market_apy))
-            
-            # Enhanced Staking rewards calculation 
+
             total_staking_pool = market_staking_pool + cumulative_tax_to_staking
-            
-            # Pool release calculation
-            if pool_remaining_ratio > 0 and years < apy_params['duration_years']:
-                daily_pool_release = (market_staking_pool * pool_remaining_ratio) / (apy_params['duration_years'] * 365)
-                max_daily_rewards_from_pool = daily_pool_release
-            else:
-                max_daily_rewards_from_pool = 0
-            
-            # APY based daily rewards
             apy_based_daily_rewards = (cumulative_staked * current_market_apy / 100 / 365) if cumulative_staked > 0 else 0
-            
-            # Actual distributed rewards (limited by pool)
-            daily_staking_rewards = min(apy_based_daily_rewards, max_daily_rewards_from_pool)
-            daily_staking_rewards += daily_tax_to_staking  # Add tax rewards
-            
-            # Update distributed rewards
+            daily_staking_rewards = min(apy_based_daily_rewards, pool_rewards_list[day]) + daily_tax_to_staking
+
             if distributed_staking_rewards + daily_staking_rewards <= total_staking_pool:
                 distributed_staking_rewards += daily_staking_rewards
             else:
                 daily_staking_rewards = max(0, total_staking_pool - distributed_staking_rewards)
                 distributed_staking_rewards = total_staking_pool
-            
-            # === REAL EFFECTIVE CIRCULATING SUPPLY  ===
-            if self.config.include_staked_in_circulating:
+
+            # === REAL EFFECTIVE CIRCULATING SUPPLY + SMOOTH FİYAT ===
+            if include_staked:
                 effective_circulating = gross_circulating  # Staked dahil
             else:
                 effective_circulating = max(1, gross_circulating - cumulative_staked)  # Staked hariç
-            
-            # ENHANCED TOKEN PRICE (SMOOTH) 
+
             raw_token_price = current_mcap / effective_circulating if effective_circulating > 0 else final_presale_price
-            price_ma = price_ma * (1 - self.config.price_smoothing_factor * 2) + raw_token_price * (self.config.price_smoothing_factor * 2)
-            token_price = price_ma
-            
-            price_vs_presale = token_price / final_presale_price
-            
-            # Store for next iteration
+            price_ma = price_ma * price_keep + raw_token_price * price_take
             previous_price = current_price_estimate
-            
-            mainnet_data.append({
-                'gun': day,
-                'ay': months,
-                'yil': years,
-                'ceyrek': quarter + 1,
-                'ceyrek_yil': quarter_year,
-                'yil_ici_ceyrek': quarter_in_year,
-                'mcap_usdt': current_mcap,
-                'gross_circulating_supply': gross_circulating,
-                'effective_circulating_supply': effective_circulating,
-                'token_fiyati': token_price,
-                'presale_fiyat_orani': price_vs_presale,
-                
-                # Enhanced McAp faktörleri 
-                'starting_mcap': starting_mcap,
-                'ceyrek_carpani': quarter_multiplier,
-                'temelli_buyume': fundamental_growth,
-                'spekulatif_buyume': speculative_growth,
-                'maturity_effect': maturity_effect,
-                'maturity_distance_ratio': distance_ratio,
-                'toplam_buyume': base_growth,
-                'volatilite_etkisi': volatility_effect,
-                'market_beta': current_beta,
-                'mcap_moving_average': mcap_ma,
-                'price_moving_average': price_ma,
-                
-                # Enhanced Maturity analizi  - SIMPLIFIED
-                'maturity_target_mcap': maturity_params['target_mcap'],
-                'maturity_progress_pct': (current_mcap / maturity_params['target_mcap']) * 100,
-                'maturity_damping_enabled': maturity_params['enabled'],
-                'maturity_convergence_speed': maturity_params['convergence_speed'],
-                
-                # Tax ve burn
-                'tax_aktif': tax_active,
-                'gunluk_tax_token': daily_tax_tokens,
-                'gunluk_tax_staking': daily_tax_to_staking,
-                'gunluk_tax_burn': daily_tax_to_burn,
-                'kumulatif_tax_toplam': cumulative_tax_collected,
-                'kumulatif_tax_staking': cumulative_tax_to_staking,
-                'kumulatif_tax_burned': cumulative_tax_burned,
-                'gunluk_rutin_burn': daily_routine_burn,
-                'kumulatif_rutin_burned': cumulative_routine_burned,
-                'toplam_burned': total_burned,
-                'etkili_toplam_arz': self.config.total_supply - total_burned,
-                
-                # Enhanced Staking 
-                'price_velocity': price_velocity,
-                'smoothed_price_velocity': self.smoothed_velocity,
-                'velocity_effect': velocity_effect,
-                'target_staking_rate': target_staking_rate,
-                'staking_momentum': staking_momentum,
-                'smooth_staking_orani': smooth_staking_rate,
-                'gunluk_yeni_staking': daily_new_staking,
-                'gunluk_unstaking': daily_unstaking,
-                'kumulatif_staked': cumulative_staked,
-                'staking_orani': current_staking_ratio,
-                'staking_moving_average': staking_ma,
-                
-                # Enhanced Dynamic APY 
-                'pool_remaining_ratio': pool_remaining_ratio,
-                'pool_apy_multiplier': pool_apy_multiplier,
-                'saturation_apy_multiplier': saturation_apy_multiplier,
-                'market_apy_multiplier': market_apy_multiplier,
-                'max_daily_pool_rewards': max_daily_rewards_from_pool,
-                'apy_based_rewards': apy_based_daily_rewards,
-                'guncel_market_apy': current_market_apy,
-                'gunluk_staking_odul': daily_staking_rewards,
-                'dagitilan_staking_odul': distributed_staking_rewards,
-                'toplam_staking_havuzu': total_staking_pool,
-                
-                # Diğer
-                'senaryo': scenario,
-                'burn_orani_yuzdesi': (total_burned / self.config.total_supply) * 100,
-                'dolasim_yuzdesi': (gross_circulating / (self.config.total_supply - total_burned)) * 100,
-                'staked_dolasim_yuzdesi': (cumulative_staked / gross_circulating) * 100 if gross_circulating > 0 else 0,
-                'effective_dolasim_yuzdesi': (effective_circulating / (self.config.total_supply - total_burned)) * 100
-            })
-        
-        return pd.DataFrame(mainnet_data)
+
+            mcap_col[day] = current_mcap
+            gross_col[day] = gross_circulating
+            effective_col[day] = effective_circulating
+            price_col[day] = price_ma
+            maturity_effect_col[day] = maturity_effect
+            distance_col[day] = distance_ratio
+            growth_col[day] = base_growth
+            tax_tokens_col[day] = daily_tax_tokens
+            tax_staking_col[day] = daily_tax_to_staking
+            tax_burn_col[day] = daily_tax_to_burn
+            tax_total_cum_col[day] = cumulative_tax_collected
+            tax_staking_cum_col[day] = cumulative_tax_to_staking
+            tax_burned_cum_col[day] = cumulative_tax_burned
+            velocity_col[day] = price_velocity
+            smoothed_velocity_col[day] = state.smoothed_velocity
+            velocity_effect_col[day] = velocity_effect
+            target_rate_col[day] = target_staking_rate
+            momentum_col[day] = staking_momentum
+            smooth_staking_col[day] = staking_ma
+            new_staking_col[day] = daily_new_staking
+            unstaking_col[day] = daily_unstaking
+            staked_col[day] = cumulative_staked
+            staking_ratio_col[day] = current_staking_ratio
+            saturation_col[day] = saturation_apy_multiplier
+            market_multiplier_col[day] = market_apy_multiplier
+            apy_rewards_col[day] = apy_based_daily_rewards
+            apy_col[day] = current_market_apy
+            rewards_col[day] = daily_staking_rewards
+            distributed_col[day] = distributed_staking_rewards
+
+        # === TÜRETİLMİŞ KOLONLAR (vektörel) ===
+        total_burned = tax_burned_cum_col + cumulative_routine_burned
+        remaining_supply = cfg.total_supply - total_burned
+
+        out['ay'][:] = months_arr
+        out['yil'][:] = years_arr
+        out['presale_fiyat_orani'][:] = price_col / final_presale_price
+        out['starting_mcap'][:] = starting_mcap
+        out['ceyrek_carpani'][:] = quarter_multiplier
+        out['temelli_buyume'][:] = fundamental_growth
+        out['spekulatif_buyume'][:] = quarter_multiplier * maturity_effect_col
+        out['volatilite_etkisi'][:] = volatility_effect
+        out['market_beta'][:] = current_beta
+        out['mcap_moving_average'][:] = mcap_col
+        out['price_moving_average'][:] = price_col
+        out['maturity_target_mcap'][:] = target_mcap
+        out['maturity_progress_pct'][:] = (mcap_col / target_mcap) * 100
+        out['maturity_convergence_speed'][:] = maturity_params['convergence_speed']
+        out['gunluk_rutin_burn'][:] = daily_routine_burn
+        out['kumulatif_rutin_burned'][:] = cumulative_routine_burned
+        out['toplam_burned'][:] = total_burned
+        out['etkili_toplam_arz'][:] = remaining_supply
+        out['staking_moving_average'][:] = smooth_staking_col
+        out['pool_remaining_ratio'][:] = pool_remaining_ratio
+        out['pool_apy_multiplier'][:] = pool_apy_multiplier
+        out['max_daily_pool_rewards'][:] = max_daily_rewards_from_pool
+        out['toplam_staking_havuzu'][:] = market_staking_pool + tax_staking_cum_col
+        out['burn_orani_yuzdesi'][:] = (total_burned / cfg.total_supply) * 100
+        out['dolasim_yuzdesi'][:] = (gross_col / remaining_supply) * 100
+        out['staked_dolasim_yuzdesi'][:] = (staked_col / gross_col) * 100
+        out['effective_dolasim_yuzdesi'][:] = (effective_col / remaining_supply) * 100
+
+        # Float blok kopyalanmadan sarılır, diğer tipler yerlerine eklenir
+        mainnet_df = pd.DataFrame(buffer.T, columns=float_columns, copy=False)
+        non_float_values = {
+            'gun': days,
+            'ceyrek': quarter + 1,
+            'ceyrek_yil': quarter // 4 + 1,
+            'yil_ici_ceyrek': quarter % 4 + 1,
+            'maturity_damping_enabled': np.full(projection_days, bool(maturity_enabled)),
+            'tax_aktif': tax_active,
+            'senaryo': scenario
+        }
+        for name in MAINNET_NON_FLOAT_COLUMNS:
+            mainnet_df.insert(MAINNET_COLUMNS.index(name), name, non_float_values[name])
+
+        return mainnet_df
+    
+    def simulate_mainnet_monte_carlo(self, presale_df: pd.DataFrame, vesting_df: pd.DataFrame,
+                                     scenario: str = "base", n_paths: Optional[int] = None,
+                                     seed: Optional[int] = None) -> MonteCarloResult:
+        """🎲 Mainnet Monte Carlo - yüzdelik bantlar + headline metrik dağılımları
+
+        Yollar tek bir NumPy ekseni olarak birlikte ilerletilir (bkz. montecarlo.py).
+        """
+        return run_mainnet_monte_carlo(
+            self.config, presale_df, vesting_df, scenario,
+            n_paths=n_paths if n_paths is not None else self.config.monte_carlo_paths,
+            seed=seed if seed is not None else self.config.monte_carlo_seed
+        )
+    
+    def simulate_investor_population(self, presale_df: pd.DataFrame, mainnet_df: pd.DataFrame,
+                                     n_investors: Optional[int] = None) -> PopulationResult:
+        """👥 Yatırımcı popülasyonu - config.investor_count_simulation kadar (veya n_investors)
+
+        Chunk'lar halinde örneklenir, bellek yatırımcı sayısından bağımsızdır (bkz. population.py).
+        """
+        return simulate_investor_population(presale_df, mainnet_df, self.config,
+                                            self.make_rng('population'), n_investors=n_investors)
     
     def calculate_individual_vesting_schedules(self, months_projection: int = None) -> pd.DataFrame:
-        """📅 Enhanced Vesting Schedules  - AYNI"""
+        """📅 Enhanced Vesting Schedules - tablo tabanlı (config.get_vesting_allocations)
+
+        Tüm ay × tahsis matrisi vesting.py'de tek broadcast işlemle hesaplanır.
+        """
         
         if months_projection is None:
             months_projection = self.config.vesting_analysis_months
         
-        vesting_data = []
-        
-        for month in range(months_projection):
-            vesting_month = max(0, month - 6)  # 6 ay gecikme
-            
-            # === PRESALE ALLOCATION (ANINDA) ===
-            presale_tokens = self.config.total_supply * (self.config.presale_allocation / 100)
-            vested_presale = presale_tokens if month >= 0 else 0
-            
-            # === PRESALE STAKING POOL VESTING ===
-            presale_staking_tokens = self.config.total_supply * (self.config.presale_staking_pool / 100)
-            if vesting_month < self.config.presale_staking_cliff_months:
-                vested_presale_staking = 0
-            else:
-                vesting_progress = min(1.0, (vesting_month - self.config.presale_staking_cliff_months) / 
-                                     max(1, self.config.presale_staking_vesting_months - self.config.presale_staking_cliff_months))
-                vested_presale_staking = presale_staking_tokens * vesting_progress
-            
-            # === MARKET STAKING POOL VESTING ===
-            market_staking_tokens = self.config.total_supply * (self.config.market_staking_pool / 100)
-            if vesting_month < self.config.market_staking_cliff_months:
-                vested_market_staking = 0
-            else:
-                vesting_progress = min(1.0, (vesting_month - self.config.market_staking_cliff_months) / 
-                                     max(1, self.config.market_staking_vesting_months - self.config.market_staking_cliff_months))
-                vested_market_staking = market_staking_tokens * vesting_progress
-            
-            # === TEAM VESTING ===
-            team_tokens = self.config.total_supply * (self.config.team_allocation / 100)
-            if vesting_month < self.config.team_cliff_months:
-                vested_team = 0
-            else:
-                vesting_progress = min(1.0, (vesting_month - self.config.team_cliff_months) / 
-                                     max(1, self.config.team_vesting_months - self.config.team_cliff_months))
-                vested_team = team_tokens * vesting_progress
-            
-            # === DAO TREASURY VESTING ===
-            dao_tokens = self.config.total_supply * (self.config.dao_treasury / 100)
-            if vesting_month < self.config.dao_cliff_months:
-                vested_dao = 0
-            else:
-                vesting_progress = min(1.0, (vesting_month - self.config.dao_cliff_months) / 
-                                     max(1, self.config.dao_vesting_months - self.config.dao_cliff_months))
-                vested_dao = dao_tokens * vesting_progress
-            
-            # === MARKETING VESTING ===
-            marketing_tokens = self.config.total_supply * (self.config.marketing / 100)
-            if vesting_month < self.config.marketing_cliff_months:
-                vested_marketing = 0
-            else:
-                vesting_progress = min(1.0, (vesting_month - self.config.marketing_cliff_months) / 
-                                     max(1, self.config.marketing_vesting_months - self.config.marketing_cliff_months))
-                vested_marketing = marketing_tokens * vesting_progress
-            
-            # === LIQUIDITY (ANINDA) ===
-            liquidity_tokens = self.config.total_supply * (self.config.liquidity / 100)
-            vested_liquidity = liquidity_tokens if month >= 0 else 0
-            
-            # === TOTAL CALCULATIONS ===
-            total_vested = (vested_presale + vested_presale_staking + vested_market_staking + 
-                           vested_team + vested_dao + vested_marketing + vested_liquidity)
-            
-            vested_percentage_of_total_supply = (total_vested / self.config.total_supply * 100)
-            
-            # === CIRCULATING SUPPLY ===
-            circulating_supply = total_vested
-            circulating_percentage = (circulating_supply / self.config.total_supply * 100)
-            
-            vesting_data.append({
-                'ay': month,
-                'vesting_ay': vesting_month,
-                
-                # Individual components
-                'vested_presale': vested_presale,
-                'vested_presale_staking': vested_presale_staking,
-                'vested_market_staking': vested_market_staking,
-                'vested_team': vested_team,
-                'vested_dao': vested_dao,
-                'vested_marketing': vested_marketing,
-                'vested_liquidity': vested_liquidity,
-                
-                # Totals
-                'toplam_vested': total_vested,
-                'circulating_supply': circulating_supply,
-                'vested_toplam_arz_yuzdesi': vested_percentage_of_total_supply,
-                'dolasim_yuzdesi': circulating_percentage,
-                
-                # Individual percentages
-                'presale_staking_vested_pct': (vested_presale_staking / presale_staking_tokens * 100) if presale_staking_tokens > 0 else 0,
-                'market_staking_vested_pct': (vested_market_staking / market_staking_tokens * 100) if market_staking_tokens > 0 else 0,
-                'team_vested_pct': (vested_team / team_tokens * 100) if team_tokens > 0 else 0,
-                'dao_vested_pct': (vested_dao / dao_tokens * 100) if dao_tokens > 0 else 0,
-                'marketing_vested_pct': (vested_marketing / marketing_tokens * 100) if marketing_tokens > 0 else 0,
-                'liquidity_vested_pct': (vested_liquidity / liquidity_tokens * 100) if liquidity_tokens > 0 else 0,
-                
-                # Status
-                'vesting_basladi': month >= 6
-            })
-        
-        return pd.DataFrame(vesting_data)
+        table = vesting_table(self.config.get_vesting_allocations())
+        vesting_df = vesting_schedule_frame(table, months_projection, self.config.total_supply,
+                                            self.config.vesting_delay_months)
+        # Presale anında serbest - yüzde kolonu raporlanmaz
+        return vesting_df.drop(columns=['presale_vested_pct'])
     
     def calculate_enhanced_metrics(self, presale_df: pd.DataFrame, 
                                  weekly_df: pd.DataFrame,
@@ -769,7 +840,7 @@ class EnhancedTokenomicsModel:
                 'toplam_tax_burned': float(mainnet_df['kumulatif_tax_burned'].iloc[-1]),
                 'toplam_rutin_burned': float(mainnet_df['kumulatif_rutin_burned'].iloc[-1]),
                 'senaryo': mainnet_df['senaryo'].iloc[0] if 'senaryo' in mainnet_df.columns else 'base',
-                'ceyrek_sayisi': 16,
+                'ceyrek_sayisi': int(mainnet_df['ceyrek'].max()) if 'ceyrek' in mainnet_df.columns else 16,
                 'analiz_ay_sayisi': self.config.projection_months,
                 
                 # Enhanced: Simplified Maturity Metrics 
@@ -823,5 +894,5 @@ class EnhancedTokenomicsModel:
             }
             
         except Exception as e:
-            st.error(f"Enhanced metrik hesaplama hatası : {e}")
+            logger.exception(f"Enhanced metrik hesaplama hatası : {e}")
             return {'error': str(e)}
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+NXID Mainnet Monte Carlo
+========================
+Volatilite şoklarının tek bir seed'e bağlı kalmaması için mainnet fazı
+binlerce bağımsız yol üzerinde çalıştırılır (mainnet_lanes - yol ekseni
+vektörel). Sonuç: günlük p5/p25/p50/p75/p95 bantları + yol başına
+headline metrik dağılımları.
+"""
+
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+from config import EnhancedNXIDConfig
+from mainnet_lanes import LaneRecorder, simulate_mainnet_lanes
+
+BAND_PERCENTILES = (5, 25, 50, 75, 95)
+BAND_FIELDS = ('mcap_usdt', 'token_fiyati', 'staking_orani')
+
+AVG_USER_INVESTMENT = 1000  # calculate_enhanced_metrics ile aynı ($1000 ortalama yatırım)
+
+
+class MonteCarloRecorder(LaneRecorder):
+    """Günlük yüzdelik bantlar + yol başına running reduction'lar
+
+    (gün × yol) matrisi hiç tutulmaz - sadece block_days günlük bir pencere
+    biriktirilip yüzdelikler blok halinde hesaplanır; bellek yol sayısıyla
+    doğrusal kalır.
+    """
+
+    def __init__(self, band_fields: Sequence[str] = BAND_FIELDS,
+                 percentiles: Sequence[float] = BAND_PERCENTILES, block_days: int = 32):
+        self.band_fields = list(band_fields)
+        self.percentiles = list(percentiles)
+        self.block_days = block_days
+
+    def start(self, n_days, n_lanes, days, months):
+        self.days = days
+        self.months = months
+        self.bands = {name: np.empty((n_days, len(self.percentiles))) for name in self.band_fields}
+        self.block = {name: np.empty((self.block_days, n_lanes)) for name in self.band_fields}
+        self.block_start = 0
+        self.max_price = np.full(n_lanes, -np.inf)
+        self.max_price_day = np.zeros(n_lanes, dtype=np.int64)
+        self.max_mcap = np.full(n_lanes, -np.inf)
+        self.max_staking_ratio = np.full(n_lanes, -np.inf)
+        self.max_distance_ratio = np.full(n_lanes, -np.inf)
+        self.apy_sum = np.zeros(n_lanes)
+        self.last: Dict[str, np.ndarray] = {}
+
+    def _flush(self, end_day: int):
+        count = end_day - self.block_start
+        if count <= 0:
+            return
+        for name, block in self.block.items():
+            self.bands[name][self.block_start:end_day] = np.percentile(
+                block[:count], self.percentiles, axis=1).T
+        self.block_start = end_day
+
+    def record(self, day, values):
+        for name, block in self.block.items():
+            block[day - self.block_start] = values[name]
+        if day + 1 - self.block_start == self.block_days:
+            self._flush(day + 1)
+
+        price = values['token_fiyati']
+        new_peak = price > self.max_price
+        self.max_price = np.where(new_peak, price, self.max_price)
+        self.max_price_day[new_peak] = day
+        np.maximum(self.max_mcap, values['mcap_usdt'], out=self.max_mcap)
+        np.maximum(self.max_staking_ratio, values['staking_orani'], out=self.max_staking_ratio)
+        np.maximum(self.max_distance_ratio, values['maturity_distance_ratio'], out=self.max_distance_ratio)
+        self.apy_sum += values['guncel_market_apy']
+        self.last = values
+
+    def finish(self):
+        n_days = len(self.days)
+        self._flush(n_days)
+        self.block = {}
+        self.final = {name: np.array(values, copy=True) for name, values in self.last.items()}
+        self.mean_apy = self.apy_sum / max(1, n_days)
+
+
+@dataclass
+class MonteCarloResult:
+    """Monte Carlo çıktısı"""
+    n_paths: int
+    seed: Optional[int]
+    scenario: str
+    bands: Dict[str, pd.DataFrame]          # alan -> gun, ay, p5..p95
+    path_metrics: pd.DataFrame              # yol başına headline metrikler
+    summary: pd.DataFrame                   # metrik -> ortalama, std, p5..p95
+    elapsed_seconds: float = 0.0
+    percentiles: Sequence[float] = field(default=BAND_PERCENTILES)
+
+
+def lane_metrics(recorder: MonteCarloRecorder, target_mcap, final_presale_price) -> pd.DataFrame:
+    """Lane başına headline metrikler (target_mcap / final_presale_price skaler ya da lane array'i)"""
+    final = recorder.final
+    avg_tokens_bought = AVG_USER_INVESTMENT / final_presale_price
+    return pd.DataFrame({
+        'max_tahmin_fiyat': recorder.max_price,
+        'max_fiyat_zamani_ay': recorder.months[recorder.max_price_day],
+        'max_mcap': recorder.max_mcap,
+        'presale_fiyat_artisi': recorder.max_price / final_presale_price,
+        'final_token_fiyati': final['token_fiyati'],
+        'final_mcap': final['mcap_usdt'],
+        'final_dolasim_arzi': final['gross_circulating_supply'],
+        'toplam_burned_token': final['toplam_burned'],
+        'toplam_tax_toplanan': final['kumulatif_tax_toplam'],
+        'max_staking_orani': recorder.max_staking_ratio,
+        'final_staking_orani': final['staking_orani'],
+        'ortalama_market_apy': recorder.mean_apy,
+        'final_market_apy': final['guncel_market_apy'],
+        'max_maturity_progress': recorder.max_mcap / target_mcap * 100,
+        'final_maturity_progress': final['mcap_usdt'] / target_mcap * 100,
+        'max_maturity_distance_ratio': recorder.max_distance_ratio,
+        'ortalama_kullanici_zirve_roi': avg_tokens_bought * recorder.max_price / AVG_USER_INVESTMENT,
+        'ortalama_kullanici_final_roi': avg_tokens_bought * final['token_fiyati'] / AVG_USER_INVESTMENT,
+    })
+
+
+def _summarize(path_metrics: pd.DataFrame, percentiles: Sequence[float]) -> pd.DataFrame:
+    values = path_metrics.to_numpy()
+    summary = pd.DataFrame({
+        'ortalama': values.mean(axis=0),
+        'std': values.std(axis=0),
+    }, index=path_metrics.columns)
+    quantiles = np.percentile(values, percentiles, axis=0)
+    for p, row in zip(percentiles, quantiles):
+        summary[f'p{p:g}'] = row
+    return summary
+
+
+def run_mainnet_monte_carlo(config: EnhancedNXIDConfig, presale_df: pd.DataFrame,
+                            vesting_df: pd.DataFrame, scenario: str = "base",
+                            n_paths: int = 1000, seed: Optional[int] = None,
+                            band_fields: Sequence[str] = BAND_FIELDS,
+                            percentiles: Sequence[float] = BAND_PERCENTILES) -> MonteCarloResult:
+    """🎲 Mainnet fazını n_paths bağımsız volatilite yolu ile simüle et
+
+    Presale ve vesting deterministiktir, bir kez hesaplanıp tüm yollara verilir.
+    Aynı seed aynı bantları üretir; seed=None her çağrıda yeni yollar çeker.
+    """
+    if n_paths < 1:
+        raise ValueError("n_paths en az 1 olmalı")
+
+    start = time.perf_counter()
+    rng = np.random.default_rng(np.random.SeedSequence(seed))
+    recorder = simulate_mainnet_lanes(config, presale_df, vesting_df, scenario, n_paths, rng,
+                                      MonteCarloRecorder(band_fields, percentiles))
+
+    bands = {}
+    for name, band in recorder.bands.items():
+        frame = pd.DataFrame(band, columns=[f'p{p:g}' for p in percentiles])
+        frame.insert(0, 'ay', recorder.months)
+        frame.insert(0, 'gun', recorder.days)
+        bands[name] = frame
+
+    final_presale_price = float(presale_df['fiyat_usdt'].iloc[-1])
+    path_metrics = lane_metrics(recorder, config.maturity_target_mcap, final_presale_price)
+
+    return MonteCarloResult(
+        n_paths=n_paths,
+        seed=seed,
+        scenario=scenario,
+        bands=bands,
+        path_metrics=path_metrics,
+        summary=_summarize(path_metrics, percentiles),
+        elapsed_seconds=time.perf_counter() - start,
+        percentiles=tuple(percentiles)
+    )
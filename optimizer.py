@@ -0,0 +1,347 @@
+"""
+NXID Config Optimizer
+=====================
+Tahsis, staking, APY ve tax parametrelerinin izin verilen aralıklarında
+calculate_performance_score_v6'yı (veya seçilen herhangi bir metriği)
+maksimize eden türevsiz arama.
+
+- Adaylar birim küpte tutulur; her nesil elitlerin etrafında Gauss
+  mutasyonu ile üretilir (μ + λ evolution strategy), ilk nesil latin hypercube.
+- Her aday validate_* kısıtlarına göre onarılır (tahsis toplamı %100,
+  tax dağılımı %100, min <= base <= max sıralamaları).
+- Nesiller sweep.run_sweep ile paralel batch olarak değerlendirilir,
+  her değerlendirme cache'lenir (aynı onarılmış aday tekrar çalışmaz). Cache
+  anahtarı base config hash'ini içerir ve ham sweep satırını tutar - hedefler
+  her çağrıda satırdan hesaplanır.
+- İyileşme patience nesil boyunca tol altında kalırsa erken durur.
+- Birden fazla hedefte sonuç Pareto kümesidir (baskılanmayan adaylar).
+"""
+
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from analytics import AnalyticsManager
+from config import EnhancedNXIDConfig
+from sweep import config_field_types, run_sweep
+
+SCORE_OBJECTIVE = 'score'
+OPTIMIZER_OBJECTIVES = ['score', 'mainnet.ortalama_kullanici_zirve_roi', 'mainnet.ortalama_kullanici_final_roi',
+                        'mainnet.max_mcap', 'mainnet.max_staking_orani', '-mainnet.toplam_tax_toplanan']
+
+# Sidebar aralıkları (presale tahsisi / staking havuzu alt sınırı dejenere presale'i önlemek için yükseltildi)
+ALLOCATION_SPACE = {
+    'presale_allocation': (20.0, 50.0),
+    'presale_staking_pool': (1.0, 10.0),
+    'market_staking_pool': (10.0, 40.0),
+    'liquidity': (3.0, 15.0),
+    'team_allocation': (10.0, 25.0),
+    'dao_treasury': (10.0, 25.0),
+    'marketing': (5.0, 15.0),
+}
+STAKING_SPACE = {
+    'min_staking_rate': (0.05, 0.5),
+    'base_staking_rate': (0.05, 0.8),
+    'max_staking_rate': (0.1, 0.95),
+    'price_velocity_impact': (-1.0, 0.0),
+    'staking_entry_speed': (0.001, 0.01),
+    'staking_exit_speed': (0.002, 0.02),
+}
+APY_SPACE = {
+    'max_apy': (100.0, 10000.0),
+    'minimum_staking_apy': (10.0, 200.0),
+    'min_staking_apy': (5.0, 50.0),
+    'base_staking_apy': (5.0, 150.0),
+    'max_staking_apy': (5.0, 500.0),
+}
+TAX_SPACE = {
+    'mainnet_tax_period_months': (3, 24),
+    'mainnet_tax_rate': (1.0, 10.0),
+    'tax_to_staking_percentage': (40.0, 80.0),
+}
+DEFAULT_SEARCH_SPACE = {**ALLOCATION_SPACE, **STAKING_SPACE, **APY_SPACE, **TAX_SPACE}
+SEARCH_GROUPS = {'Tahsis': ALLOCATION_SPACE, 'Staking': STAKING_SPACE, 'APY': APY_SPACE, 'Tax': TAX_SPACE}
+
+# validate_enhanced_parameters: min <= base <= max
+ORDERED_GROUPS = (
+    ('min_staking_rate', 'base_staking_rate', 'max_staking_rate'),
+    ('min_staking_apy', 'base_staking_apy', 'max_staking_apy'),
+)
+
+
+def _repair_allocation(values: Dict[str, float], bounds: Dict[str, Tuple[float, float]],
+                       fixed_total: float) -> Optional[Dict[str, float]]:
+    """Aranan tahsisleri sınırlar içinde kalarak toplam %100'e ölçekle (su doldurma)"""
+    target = 100.0 - fixed_total
+    low = np.array([bounds[name][0] for name in values])
+    high = np.array([bounds[name][1] for name in values])
+    if not (low.sum() - 1e-9 <= target <= high.sum() + 1e-9):
+        return None
+    shares = np.clip(np.array(list(values.values()), dtype=float), low, high)
+    for _ in range(len(shares) + 1):
+        gap = target - shares.sum()
+        if abs(gap) < 1e-9:
+            break
+        slack = (high - shares) if gap > 0 else (shares - low)
+        if slack.sum() <= 0:
+            return None
+        shares = np.clip(shares + gap * slack / slack.sum(), low, high)
+    shares = np.round(shares, 4)
+    shares[np.argmax(high - low)] += target - shares.sum()   # yuvarlama artığını en geniş alana ver
+    return dict(zip(values, shares.tolist()))
+
+
+def repair_candidate(overrides: Dict, base_config: EnhancedNXIDConfig,
+                     search_space: Dict[str, Tuple[float, float]]) -> Optional[Dict]:
+    """Adayı validate_* kısıtlarını sağlayacak şekilde onar - onarılamazsa None"""
+    field_types = config_field_types()
+    repaired = {}
+    for name, value in overrides.items():
+        low, high = search_space[name]
+        value = min(max(value, low), high)
+        repaired[name] = int(round(value)) if field_types[name] is int else round(float(value), 6)
+
+    allocation = {name: repaired[name] for name in ALLOCATION_SPACE if name in repaired}
+    if allocation:
+        fixed_total = sum(getattr(base_config, name) for name in ALLOCATION_SPACE if name not in allocation)
+        allocation = _repair_allocation(allocation, search_space, fixed_total)
+        if allocation is None:
+            return None
+        repaired.update(allocation)
+
+    if 'tax_to_staking_percentage' in repaired:
+        repaired['tax_to_burn_percentage'] = round(100.0 - repaired['tax_to_staking_percentage'], 6)
+
+    for group in ORDERED_GROUPS:
+        searched = [name for name in group if name in repaired]
+        if searched:
+            ordered = sorted(repaired.get(name, getattr(base_config, name)) for name in group)
+            for name, value in zip(group, ordered):
+                if name in repaired or value != getattr(base_config, name):
+                    repaired[name] = value
+
+    config = EnhancedNXIDConfig.from_dict({**base_config.to_dict(), **repaired})
+    if not (config.validate_distribution() and config.validate_tax_distribution()
+            and config.validate_enhanced_parameters()):
+        return None
+    return repaired
+
+
+def unflatten_metrics(row: Dict) -> Dict:
+    """sweep satırındaki 'bölüm.metrik' kolonları -> calculate_enhanced_metrics yapısı"""
+    metrics: Dict[str, Dict] = {}
+    for key, value in row.items():
+        if isinstance(key, str) and '.' in key:
+            section, name = key.split('.', 1)
+            metrics.setdefault(section, {})[name] = value
+    return metrics
+
+
+def performance_score(row: Dict, config: EnhancedNXIDConfig, scenario: str) -> float:
+    """Sweep satırından calculate_performance_score_v6"""
+    return float(AnalyticsManager(config).calculate_performance_score_v6(unflatten_metrics(row), scenario))
+
+
+def _parse_objectives(objectives: Union[str, Sequence[str]]) -> List[Tuple[str, float]]:
+    """'metrik' -> maksimize, '-metrik' -> minimize; (kolon, işaret) listesi"""
+    if isinstance(objectives, str):
+        objectives = [objectives]
+    return [(name[1:], -1.0) if name.startswith('-') else (name, 1.0) for name in objectives]
+
+
+def pareto_mask(values: np.ndarray) -> np.ndarray:
+    """Maksimizasyon yönünde baskılanmayan satırlar (values: (n, k))"""
+    n = len(values)
+    mask = np.ones(n, dtype=bool)
+    for i in range(n):
+        if not mask[i]:
+            continue
+        dominated = np.all(values >= values[i], axis=1) & np.any(values > values[i], axis=1)
+        if dominated.any():
+            mask[i] = False
+    return mask
+
+
+def _selection_rank(values: np.ndarray) -> np.ndarray:
+    """Küçük = iyi. Tek hedef: değere göre; çok hedef: Pareto katmanı, sonra ortalama sıra"""
+    if values.shape[1] == 1:
+        return np.argsort(np.argsort(-values[:, 0]))
+    layer = np.zeros(len(values), dtype=int)
+    remaining = np.arange(len(values))
+    depth = 0
+    while len(remaining):
+        front = pareto_mask(values[remaining])
+        layer[remaining[front]] = depth
+        remaining = remaining[~front]
+        depth += 1
+    mean_rank = np.mean([np.argsort(np.argsort(-column)) for column in values.T], axis=0)
+    return np.lexsort((mean_rank, layer)).argsort()
+
+
+@dataclass
+class OptimizationResult:
+    """Optimizer çıktısı"""
+    objectives: List[str]
+    best_overrides: Dict
+    best_config: EnhancedNXIDConfig
+    best_values: Dict[str, float]
+    history: pd.DataFrame                   # tüm değerlendirmeler (nesil, parametreler, hedefler)
+    pareto: pd.DataFrame                    # baskılanmayan adaylar (tek hedefte en iyi satır)
+    generations: int
+    n_evaluations: int
+    cache_hits: int
+    stop_reason: str
+    elapsed_seconds: float = 0.0
+    search_space: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+
+def optimize_config(base_config: Optional[EnhancedNXIDConfig] = None,
+                    objectives: Union[str, Sequence[str]] = SCORE_OBJECTIVE,
+                    search_space: Optional[Dict[str, Tuple[float, float]]] = None,
+                    scenario: str = "base", population_size: int = 32, max_generations: int = 20,
+                    max_evaluations: Optional[int] = None, elite_fraction: float = 0.25,
+                    mutation_scale: float = 0.15, patience: int = 4, tol: float = 1e-6,
+                    max_workers: Optional[int] = None, seed: Optional[int] = None,
+                    cache: Optional[Dict] = None,
+                    progress: Optional[Callable[[int, int, Dict], None]] = None) -> OptimizationResult:
+    """🧭 Config optimizer - hedef(ler)i maksimize eden validate_* uyumlu config'leri ara
+
+    objectives: 'score' (calculate_performance_score_v6) ya da sweep metrik kolonları
+    ('mainnet.max_mcap'); başında '-' olan hedef minimize edilir.
+    cache: dışarıdan verilirse çağrılar arasında değerlendirmeler paylaşılır
+    ((config hash, senaryo, override'lar) -> ham sweep satırı; hedeften bağımsız).
+    progress(nesil, toplam_değerlendirme, en_iyi_değerler) her nesil sonunda çağrılır.
+    """
+    base_config = base_config or EnhancedNXIDConfig()
+    search_space = dict(search_space or DEFAULT_SEARCH_SPACE)
+    objective_specs = _parse_objectives(objectives)
+    names = list(search_space)
+    low = np.array([search_space[name][0] for name in names], dtype=float)
+    span = np.array([search_space[name][1] for name in names], dtype=float) - low
+    rng = np.random.default_rng(seed)
+    cache = {} if cache is None else cache
+    base_hash = base_config.config_hash()
+    max_evaluations = max_evaluations or population_size * max_generations
+
+    start = time.perf_counter()
+    history: List[Dict] = []
+    evaluated = set()
+    cache_hits = 0
+    best_history: List[np.ndarray] = []
+    stall = 0
+    stop_reason = "max_generations"
+    generation = 0
+
+    def _candidate(unit: np.ndarray) -> Optional[Dict]:
+        return repair_candidate(dict(zip(names, (low + unit * span).tolist())), base_config, search_space)
+
+    def _objective_values(row: Dict, overrides: Dict) -> Dict[str, float]:
+        values = {}
+        for name, _ in objective_specs:
+            if name == SCORE_OBJECTIVE:
+                config = EnhancedNXIDConfig.from_dict({**base_config.to_dict(), **overrides})
+                values[name] = performance_score(row, config, scenario)
+            else:
+                values[name] = float(row.get(name, np.nan))
+        return values
+
+    # İlk nesil: latin hypercube
+    units = (np.argsort(rng.random((population_size, len(names))), axis=0) +
+             rng.random((population_size, len(names)))) / population_size
+
+    for generation in range(max_generations):
+        candidates = []
+        for unit in units:
+            overrides = _candidate(unit)
+            if overrides is None:
+                continue
+            key = (base_hash, scenario) + tuple(sorted(overrides.items()))
+            if key in evaluated:
+                continue
+            evaluated.add(key)
+            candidates.append((key, overrides, unit))
+        budget = max_evaluations - len(history)
+        candidates = candidates[:max(0, budget)]
+
+        pending = [(key, overrides) for key, overrides, _ in candidates if key not in cache]
+        cache_hits += len(candidates) - len(pending)
+        if pending:
+            sweep_df = run_sweep([overrides for _, overrides in pending], base_config, scenario,
+                                 max_workers=max_workers)
+            for (key, overrides), row in zip(pending, sweep_df.to_dict('records')):
+                cache[key] = None if isinstance(row.get('hata'), str) else row
+
+        for key, overrides, unit in candidates:
+            row = cache[key]
+            values = None if row is None else _objective_values(row, overrides)
+            history.append({'nesil': generation, **overrides,
+                            **({name: np.nan for name, _ in objective_specs} if values is None else values),
+                            'gecerli': values is not None, '_unit': unit})
+
+        frame = pd.DataFrame(history)
+        valid = frame[frame['gecerli']].dropna(subset=[name for name, _ in objective_specs])
+        if valid.empty:
+            units = rng.random((population_size, len(names)))
+            continue
+
+        signed = valid[[name for name, _ in objective_specs]].to_numpy() * np.array([sign for _, sign in objective_specs])
+        ranks = _selection_rank(signed)
+        if progress is not None:
+            progress(generation, len(history), valid.iloc[int(np.argmin(ranks))][[n for n, _ in objective_specs]].to_dict())
+
+        # === ERKEN DURMA ===
+        if len(objective_specs) == 1:
+            best = np.array([signed[:, 0].max()])
+            improved = not best_history or best[0] > best_history[-1][0] + tol
+        else:
+            front = np.unique(signed[pareto_mask(signed)], axis=0)
+            improved = not best_history or not (front.shape == best_history[-1].shape and np.allclose(front, best_history[-1]))
+            best = front
+        best_history.append(best)
+        stall = 0 if improved else stall + 1
+        if stall >= patience:
+            stop_reason = "stalled"
+            break
+        if len(history) >= max_evaluations:
+            stop_reason = "max_evaluations"
+            break
+
+        # === SONRAKİ NESİL: elitler etrafında Gauss mutasyonu + %10 keşif ===
+        n_elite = max(1, int(np.ceil(len(valid) * elite_fraction)))
+        elite_units = np.stack(valid['_unit'].to_numpy()[np.argsort(ranks)[:n_elite]])
+        scale = mutation_scale * (0.85 ** generation)
+        parents = elite_units[rng.integers(0, n_elite, population_size)]
+        units = np.clip(parents + rng.normal(0, scale, parents.shape), 0.0, 1.0)
+        n_explore = max(1, population_size // 10)
+        units[:n_explore] = rng.random((n_explore, len(names)))
+
+    frame = pd.DataFrame(history).drop(columns=['_unit'], errors='ignore')
+    objective_names = [name for name, _ in objective_specs]
+    valid = frame[frame['gecerli']].dropna(subset=objective_names) if len(frame) else frame
+    if valid.empty:
+        raise RuntimeError("Optimizer geçerli bir aday bulamadı - arama aralıklarını kontrol edin")
+
+    signed = valid[objective_names].to_numpy() * np.array([sign for _, sign in objective_specs])
+    ranks = _selection_rank(signed)
+    best_row = valid.iloc[int(np.argmin(ranks))]
+    pareto = valid[pareto_mask(signed)] if len(objective_specs) > 1 else valid.iloc[[int(np.argmin(ranks))]]
+    parameter_columns = [column for column in frame.columns if column not in objective_names + ['nesil', 'gecerli']]
+    best_overrides = {name: best_row[name] for name in parameter_columns if pd.notna(best_row[name])}
+    best_overrides = {name: (int(value) if config_field_types()[name] is int else float(value))
+                      for name, value in best_overrides.items()}
+
+    return OptimizationResult(
+        objectives=[('-' if sign < 0 else '') + name for name, sign in objective_specs],
+        best_overrides=best_overrides,
+        best_config=EnhancedNXIDConfig.from_dict({**base_config.to_dict(), **best_overrides}),
+        best_values={name: float(best_row[name]) for name in objective_names},
+        history=frame,
+        pareto=pareto.sort_values(objective_names[0], ascending=objective_specs[0][1] < 0).reset_index(drop=True),
+        generations=generation + 1,
+        n_evaluations=len(history),
+        cache_hits=cache_hits,
+        stop_reason=stop_reason,
+        elapsed_seconds=time.perf_counter() - start,
+        search_space=search_space
+    )
@@ -0,0 +1,362 @@
+"""
+NXID Stage Pipeline
+===================
+Simülasyon aşamaları bir bağımlılık grafiğidir:
+
+    presale ──> weekly
+       │
+       ├──────> mainnet ──> metrics
+    vesting ────┘    (presale, weekly, vesting, mainnet)
+
+Her aşamanın anahtarı = okuduğu config alanlarının değerleri + üst aşama
+anahtarları (+ senaryo). Okunan alanlar elle listelenmez: aşama bir
+ConfigReadTracker vekili ile çalıştırılır ve gerçekten okunan alanlar
+kaydedilir. Aynı alan değerleri aynı kontrol akışını ve sonucu verdiği
+için, sadece girdisi değişen aşamalar yeniden hesaplanır (ör. mainnet tax
+slider'ı presale'i tetiklemez). Sonuçlar bellek sınırlı bir LRU'da tutulur.
+
+run_scenarios: presale / weekly / vesting bir kez çalışır, senaryoya bağlı
+aşamalar (mainnet → metrics ...) senaryo başına process pool'a dağıtılır.
+
+Cache'ten dönen DataFrame'ler paylaşılır - salt okunur kullanılmalıdır.
+"""
+
+import os
+import threading
+import time
+import types
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from config import EnhancedNXIDConfig
+
+CONFIG_FIELDS = frozenset(f.name for f in fields(EnhancedNXIDConfig))
+DEFAULT_CACHE_BYTES = 256 * 1024 ** 2
+
+
+class ConfigReadTracker:
+    """EnhancedNXIDConfig vekili - aşama içinde okunan alan adlarını kaydeder
+
+    Metotlar (get_staking_params vb.) vekile bağlanarak çağrılır, böylece
+    metot içindeki okumalar da kaydedilir. Aşamalar config'i değiştiremez.
+    """
+
+    def __init__(self, config: EnhancedNXIDConfig):
+        object.__setattr__(self, '_config', config)
+        object.__setattr__(self, 'reads', set())
+
+    def __getattr__(self, name):
+        config = object.__getattribute__(self, '_config')
+        if name in CONFIG_FIELDS:
+            self.reads.add(name)
+            return getattr(config, name)
+        attribute = getattr(type(config), name)
+        if callable(attribute):
+            return types.MethodType(attribute, self)
+        return getattr(config, name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Aşama config'i değiştiremez: {name}")
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, np.ndarray):
+        return tuple(value.tolist())
+    return value
+
+
+def field_fingerprint(config: EnhancedNXIDConfig, names: FrozenSet[str]) -> Tuple:
+    """Seçilen config alanlarının hashlenebilir değer tuple'ı"""
+    return tuple((name, _freeze(getattr(config, name))) for name in sorted(names))
+
+
+def estimate_nbytes(value) -> int:
+    """LRU bellek sınırı için yaklaşık boyut"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return 64 + sum(estimate_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return 64 + sum(estimate_nbytes(item) for item in value)
+    nbytes = getattr(value, 'nbytes', None)
+    return int(nbytes) if isinstance(nbytes, (int, np.integer)) else 64
+
+
+class StageCache:
+    """Thread-safe, bayt sınırlı LRU (en eski kullanılan önce atılır)"""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[Tuple, Tuple[object, int]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, value):
+        nbytes = estimate_nbytes(value)
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return
+            self.entries[key] = (value, nbytes)
+            self.total_bytes += nbytes
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_bytes
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.total_bytes,
+                    'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses}
+
+
+@dataclass
+class Stage:
+    """Grafikteki bir aşama: run(config, *üst_çıktılar, **args)"""
+    name: str
+    inputs: Tuple[str, ...]
+    run: Callable
+    args: Tuple[str, ...] = ()
+
+
+def _model(config):
+    from models import EnhancedTokenomicsModel
+    return EnhancedTokenomicsModel(config)
+
+
+STAGES: Dict[str, Stage] = {stage.name: stage for stage in (
+    Stage('presale', (), lambda config: _model(config).simulate_presale_phase()),
+    Stage('weekly', ('presale',),
+          lambda config, presale: _model(config).generate_weekly_token_analysis(presale)),
+    Stage('vesting', (), lambda config: _model(config).calculate_individual_vesting_schedules()),
+    Stage('mainnet', ('presale', 'vesting'),
+          lambda config, presale, vesting, scenario: _model(config).simulate_mainnet_phase(presale, vesting, scenario),
+          args=('scenario',)),
+    Stage('metrics', ('presale', 'weekly', 'vesting', 'mainnet'),
+          lambda config, presale, weekly, vesting, mainnet: _model(config).calculate_enhanced_metrics(
+              presale, weekly, vesting, mainnet)),
+    Stage('monte_carlo', ('presale', 'vesting'),
+          lambda config, presale, vesting, scenario: _model(config).simulate_mainnet_monte_carlo(
+              presale, vesting, scenario),
+          args=('scenario',)),
+    Stage('population', ('presale', 'mainnet'),
+          lambda config, presale, mainnet: _model(config).simulate_investor_population(presale, mainnet)),
+)}
+
+
+def execute_stage(name: str, config: EnhancedNXIDConfig, upstream: List, scenario: str) -> Tuple[object, FrozenSet[str]]:
+    """Aşamayı okuma takibiyle çalıştır -> (çıktı, okunan config alanları)
+
+    Modül seviyesinde - process pool worker'larından da çağrılır.
+    """
+    stage = STAGES[name]
+    kwargs = {'scenario': scenario} if 'scenario' in stage.args else {}
+    tracker = ConfigReadTracker(config)
+    value = stage.run(tracker, *upstream, **kwargs)
+    return value, frozenset(tracker.reads)
+
+
+def _run_scenario_chain(config: EnhancedNXIDConfig, scenario: str, names: Tuple[str, ...],
+                        shared: Dict[str, object]) -> List[Tuple[object, FrozenSet[str], float]]:
+    """Worker giriş noktası - ortak aşama çıktıları üzerinde bir senaryonun aşamaları"""
+    outputs = dict(shared)
+    computed = []
+    for name in names:
+        start = time.perf_counter()
+        value, reads = execute_stage(name, config, [outputs[d] for d in STAGES[name].inputs], scenario)
+        outputs[name] = value
+        computed.append((value, reads, time.perf_counter() - start))
+    return computed
+
+
+@dataclass
+class PipelineRun:
+    """Pipeline.run çıktısı - aşama çıktıları + hangi aşamaların hesaplandığı"""
+    outputs: Dict[str, object]
+    computed: List[str] = field(default_factory=list)
+    cached: List[str] = field(default_factory=list)
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    keys: Dict[str, Tuple] = field(default_factory=dict)
+
+    def __getitem__(self, name):
+        return self.outputs[name]
+
+
+class SimulationPipeline:
+    """🧩 Aşama bazlı memoization - sadece girdisi değişen aşamalar yeniden çalışır"""
+
+    def __init__(self, cache: Optional[StageCache] = None):
+        self.cache = cache if cache is not None else StageCache()
+        self.read_sets: Dict[str, List[FrozenSet[str]]] = {name: [] for name in STAGES}
+        self.lock = threading.RLock()
+
+    def _lookup(self, stage: Stage, config, upstream_keys: Tuple, args: Tuple):
+        with self.lock:
+            read_sets = list(self.read_sets[stage.name])
+        for names in read_sets:
+            key = (stage.name, field_fingerprint(config, names), upstream_keys, args)
+            entry = self.cache.get(key)
+            if entry is not None:
+                return key, entry[0]
+        return None, None
+
+    def _store(self, stage: Stage, config, names: FrozenSet[str], upstream_keys: Tuple, args: Tuple,
+               value) -> Tuple:
+        with self.lock:
+            if names not in self.read_sets[stage.name]:
+                self.read_sets[stage.name].append(names)
+        key = (stage.name, field_fingerprint(config, names), upstream_keys, args)
+        self.cache.put(key, value)
+        return key
+
+    def _compute(self, stage: Stage, config, upstream: List, upstream_keys: Tuple, args: Tuple,
+                 scenario: str):
+        value, names = execute_stage(stage.name, config, upstream, scenario)
+        return self._store(stage, config, names, upstream_keys, args, value), value
+
+    def run(self, config: EnhancedNXIDConfig, scenario: str = "base",
+            stages: Tuple[str, ...] = ('presale', 'weekly', 'vesting', 'mainnet', 'metrics')) -> PipelineRun:
+        """İstenen aşamaları (ve bağımlılıklarını) çalıştır; değişmeyenler cache'ten gelir"""
+        result = PipelineRun(outputs={})
+        keys = result.keys
+
+        def resolve(name: str):
+            if name in keys:
+                return
+            stage = STAGES[name]
+            for dependency in stage.inputs:
+                resolve(dependency)
+            args = (('scenario', scenario),) if 'scenario' in stage.args else ()
+            upstream_keys = tuple(keys[dependency] for dependency in stage.inputs)
+            key, value = self._lookup(stage, config, upstream_keys, args)
+            if key is not None:
+                result.cached.append(name)
+            else:
+                start = time.perf_counter()
+                key, value = self._compute(stage, config, [result.outputs[d] for d in stage.inputs],
+                                           upstream_keys, args, scenario)
+                result.stage_seconds[name] = time.perf_counter() - start
+                result.computed.append(name)
+            keys[name] = key
+            result.outputs[name] = value
+
+        for name in stages:
+            resolve(name)
+        return result
+
+
+    def _closure(self, stages: Tuple[str, ...]) -> List[str]:
+        """İstenen aşamalar + bağımlılıkları, topolojik sırada"""
+        ordered: List[str] = []
+
+        def visit(name: str):
+            if name in ordered:
+                return
+            for dependency in STAGES[name].inputs:
+                visit(dependency)
+            ordered.append(name)
+
+        for name in stages:
+            visit(name)
+        return ordered
+
+    @staticmethod
+    def _scenario_dependent(ordered: List[str]) -> set:
+        dependent = set()
+        for name in ordered:
+            stage = STAGES[name]
+            if 'scenario' in stage.args or any(d in dependent for d in stage.inputs):
+                dependent.add(name)
+        return dependent
+
+    def run_scenarios(self, config: EnhancedNXIDConfig, scenarios: Tuple[str, ...] = ("bear", "base", "bull"),
+                      stages: Tuple[str, ...] = ('presale', 'weekly', 'vesting', 'mainnet', 'metrics'),
+                      max_workers: Optional[int] = None, executor: str = 'process') -> Dict[str, PipelineRun]:
+        """🔀 Senaryo karşılaştırması - ortak aşamalar bir kez, senaryo aşamaları paralel
+
+        max_workers=0 (ya da tek CPU) aynı process'te sıralı çalıştırır.
+        executor='thread' ortak presale / vesting frame'lerini worker başına pickle'lamaz
+        ve yeni process başlatmaz (PyInstaller exe'si, Streamlit içi çağrılar).
+        """
+        if executor not in ('process', 'thread'):
+            raise ValueError(f"Bilinmeyen executor: {executor} (process / thread)")
+        ordered = self._closure(stages)
+        dependent = self._scenario_dependent(ordered)
+        shared_names = tuple(name for name in ordered if name not in dependent)
+        chain = tuple(name for name in ordered if name in dependent)
+        shared = self.run(config, scenarios[0], stages=shared_names)
+
+        runs: Dict[str, PipelineRun] = {}
+        pending: Dict[str, Tuple[str, ...]] = {}
+        for scenario in scenarios:
+            run = PipelineRun(outputs=dict(shared.outputs), cached=list(shared.cached),
+                              computed=list(shared.computed), stage_seconds=dict(shared.stage_seconds))
+            scenario_keys = run.keys = dict(shared.keys)
+            for position, name in enumerate(chain):
+                stage = STAGES[name]
+                key, value = self._lookup(stage, config, tuple(scenario_keys[d] for d in stage.inputs),
+                                          (('scenario', scenario),) if 'scenario' in stage.args else ())
+                if key is None:
+                    pending[scenario] = chain[position:]
+                    break
+                scenario_keys[name] = key
+                run.outputs[name] = value
+                run.cached.append(name)
+            runs[scenario] = run
+
+        if pending:
+            if max_workers is None:
+                max_workers = min(len(pending), os.cpu_count() or 1)
+            jobs = {scenario: (config, scenario, names,
+                               {name: runs[scenario].outputs[name] for name in ordered
+                                if name in runs[scenario].outputs})
+                    for scenario, names in pending.items()}
+            if max_workers <= 1:
+                computed = {scenario: _run_scenario_chain(*job) for scenario, job in jobs.items()}
+            else:
+                pool_class = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+                with pool_class(max_workers=max_workers) as pool:
+                    futures = {scenario: pool.submit(_run_scenario_chain, *job) for scenario, job in jobs.items()}
+                    computed = {scenario: future.result() for scenario, future in futures.items()}
+
+            for scenario, names in pending.items():
+                run = runs[scenario]
+                scenario_keys = run.keys
+                for name, (value, reads, seconds) in zip(names, computed[scenario]):
+                    stage = STAGES[name]
+                    args = (('scenario', scenario),) if 'scenario' in stage.args else ()
+                    scenario_keys[name] = self._store(stage, config, reads,
+                                                      tuple(scenario_keys[d] for d in stage.inputs), args, value)
+                    run.outputs[name] = value
+                    run.computed.append(name)
+                    run.stage_seconds[name] = seconds
+        return runs
+
+
+DEFAULT_PIPELINE = SimulationPipeline()
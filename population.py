@@ -0,0 +1,196 @@
+"""
+NXID Investor Population Engine
+===============================
+investor_count_simulation kadar (veya milyonlarca) yatırımcı örneklenir:
+yatırım büyüklüğü min/max_investment_usdt arasında log-uniform, giriş günü
+presale günlük talebiyle orantılı. Holding'ler structure-of-arrays chunk'lar
+halinde hesaplanır ve sadece sabit boyutlu özetlere akıtılır:
+
+- giriş günü başına yatırımcı sayısı / USDT (bincount) -> ROI yüzdelikleri
+- token holding'lerinin log-histogramı (adet + toplam) -> Gini, top %1 / %10 payı
+
+Bellek yatırımcı sayısından bağımsızdır (chunk_size + histogram), süre doğrusal.
+"""
+
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+from config import EnhancedNXIDConfig
+from cohorts import _quantiles, cohort_token_factor
+
+HOLDING_BINS = 4096
+DEFAULT_CHUNK_SIZE = 262_144
+KEEP_INVESTORS_LIMIT = 100_000  # Bu sayının altında SoA tablo sonuçta tutulur
+
+
+@dataclass
+class PopulationResult:
+    """Popülasyon simülasyonu çıktısı"""
+    n_investors: int
+    metrics: Dict[str, float]
+    roi_bands: pd.DataFrame                 # mainnet günü -> yatırımcılar arası ROI yüzdelikleri
+    entry_counts: np.ndarray                # presale günü başına yatırımcı sayısı
+    entry_investment: np.ndarray            # presale günü başına toplam USDT
+    holding_edges: np.ndarray               # log-histogram kenarları (token)
+    holding_counts: np.ndarray
+    holding_sums: np.ndarray
+    investors: Optional[pd.DataFrame] = None  # küçük popülasyonlarda SoA tablo
+    elapsed_seconds: float = 0.0
+    percentiles: Sequence[float] = field(default=(5, 25, 50, 75, 95))
+
+    def lorenz_curve(self):
+        """(nüfus payı, token payı) - histogram bin'leri küçükten büyüğe"""
+        counts, sums = self.holding_counts, self.holding_sums
+        population_share = np.concatenate([[0.0], np.cumsum(counts) / max(1, counts.sum())])
+        holding_share = np.concatenate([[0.0], np.cumsum(sums) / max(1e-300, sums.sum())])
+        return population_share, holding_share
+
+
+def _gini_from_histogram(counts: np.ndarray, sums: np.ndarray) -> float:
+    """Bin içi eşit dağılım varsayımıyla Lorenz eğrisinden Gini (4096 log bin'de ihmal edilebilir hata)"""
+    total_count, total_sum = counts.sum(), sums.sum()
+    if total_count == 0 or total_sum <= 0:
+        return 0.0
+    x = np.concatenate([[0.0], np.cumsum(counts) / total_count])
+    y = np.concatenate([[0.0], np.cumsum(sums) / total_sum])
+    return float(1 - np.sum((x[1:] - x[:-1]) * (y[1:] + y[:-1])))
+
+
+def _top_share(counts: np.ndarray, sums: np.ndarray, fraction: float) -> float:
+    """En büyük holder'ların (nüfusun fraction kadarı) toplam token payı"""
+    total_count, total_sum = counts.sum(), sums.sum()
+    if total_count == 0 or total_sum <= 0:
+        return 0.0
+    remaining = fraction * total_count
+    taken = 0.0
+    for count, amount in zip(counts[::-1], sums[::-1]):
+        if count == 0:
+            continue
+        if count >= remaining:
+            taken += amount * (remaining / count)
+            break
+        taken += amount
+        remaining -= count
+    return float(taken / total_sum)
+
+
+def _holders_for_majority(counts: np.ndarray, sums: np.ndarray, share: float = 0.5) -> int:
+    """Token arzının share kadarını tutan en küçük holder sayısı (Nakamoto tarzı)"""
+    total_sum = sums.sum()
+    if total_sum <= 0:
+        return 0
+    target = share * total_sum
+    holders, taken = 0.0, 0.0
+    for count, amount in zip(counts[::-1], sums[::-1]):
+        if count == 0:
+            continue
+        if taken + amount >= target:
+            holders += (target - taken) / (amount / count)
+            break
+        taken += amount
+        holders += count
+    return int(np.ceil(holders))
+
+
+def simulate_investor_population(presale_df: pd.DataFrame, mainnet_df: pd.DataFrame,
+                                 config: EnhancedNXIDConfig, rng: np.random.Generator,
+                                 n_investors: Optional[int] = None,
+                                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                 percentiles: Sequence[float] = (5, 25, 50, 75, 95),
+                                 keep_investors: Optional[bool] = None) -> PopulationResult:
+    """👥 Yatırımcı popülasyonu - presale staking + mainnet değeri, dağılım metrikleri"""
+    n_investors = int(config.investor_count_simulation if n_investors is None else n_investors)
+    if n_investors < 1:
+        raise ValueError("n_investors en az 1 olmalı")
+    if keep_investors is None:
+        keep_investors = n_investors <= KEEP_INVESTORS_LIMIT
+    start_time = time.perf_counter()
+
+    min_investment = float(config.min_investment_usdt)
+    max_investment = float(max(config.max_investment_usdt, min_investment))
+    log_min, log_max = np.log(min_investment), np.log(max_investment)
+
+    # Giriş günü: presale günlük USDT talebiyle orantılı
+    demand = np.maximum(presale_df['gunluk_talep_usdt'].to_numpy(dtype=float), 0.0)
+    if demand.sum() <= 0:
+        demand = np.ones(len(presale_df))
+    entry_cdf = np.cumsum(demand) / demand.sum()
+    n_days = len(presale_df)
+
+    token_factor = cohort_token_factor(presale_df, config)          # 1$ -> presale sonu token
+    price = mainnet_df['token_fiyati'].to_numpy(dtype=float)
+    peak_price, final_price = float(price.max()), float(price[-1])
+
+    # Holding histogram aralığı önceden bilinir: [min_yatırım * min_faktör, max_yatırım * max_faktör]
+    log_low = np.log(min_investment * token_factor.min())
+    log_high = np.log(max_investment * token_factor.max())
+    bin_width = max(log_high - log_low, 1e-12) / HOLDING_BINS
+
+    entry_counts = np.zeros(n_days)
+    entry_investment = np.zeros(n_days)
+    holding_counts = np.zeros(HOLDING_BINS)
+    holding_sums = np.zeros(HOLDING_BINS)
+    total_investment = 0.0
+    kept = []
+
+    for start in range(0, n_investors, chunk_size):
+        n = min(chunk_size, n_investors - start)
+        # === SoA chunk ===
+        investment = np.exp(rng.uniform(log_min, log_max, n))
+        entry_day = np.minimum(np.searchsorted(entry_cdf, rng.random(n), side='right'), n_days - 1)
+        tokens = investment * token_factor[entry_day]
+
+        entry_counts += np.bincount(entry_day, minlength=n_days)
+        entry_investment += np.bincount(entry_day, weights=investment, minlength=n_days)
+        bins = np.clip(((np.log(tokens) - log_low) / bin_width).astype(np.int64), 0, HOLDING_BINS - 1)
+        holding_counts += np.bincount(bins, minlength=HOLDING_BINS)
+        holding_sums += np.bincount(bins, weights=tokens, minlength=HOLDING_BINS)
+        total_investment += float(investment.sum())
+
+        if keep_investors:
+            kept.append(pd.DataFrame({
+                'yatirim_usdt': investment,
+                'giris_gunu': entry_day + 1,
+                'token': tokens,
+                'zirve_roi': token_factor[entry_day] * peak_price,
+                'final_roi': token_factor[entry_day] * final_price
+            }))
+
+    # === ROI DAĞILIMI (ROI sadece giriş gününe bağlı -> gün başına sayılar yeterli) ===
+    roi_factor_q = _quantiles(token_factor[entry_counts > 0], percentiles, entry_counts[entry_counts > 0])
+    roi_bands = pd.DataFrame({'gun': mainnet_df['gun'].to_numpy(), 'ay': mainnet_df['ay'].to_numpy(dtype=float)})
+    for p, factor in zip(percentiles, roi_factor_q):
+        roi_bands[f'p{p:g}'] = factor * price
+
+    final_roi = token_factor * final_price
+    metrics = {
+        'yatirimci_sayisi': n_investors,
+        'toplam_yatirim_usdt': total_investment,
+        'ortalama_yatirim_usdt': total_investment / n_investors,
+        'toplam_token': float(holding_sums.sum()),
+        'karda_yatirimci_orani': float(entry_counts[final_roi > 1].sum() / n_investors),
+        'usdt_agirlikli_final_roi': float(np.sum(entry_investment * final_roi) / max(total_investment, 1e-300)),
+        'gini_katsayisi': _gini_from_histogram(holding_counts, holding_sums),
+        'top1_token_payi': _top_share(holding_counts, holding_sums, 0.01),
+        'top10_token_payi': _top_share(holding_counts, holding_sums, 0.10),
+        'yuzde50_holder_sayisi': _holders_for_majority(holding_counts, holding_sums, 0.5),
+    }
+    for p, factor in zip(percentiles, roi_factor_q):
+        metrics[f'final_roi_p{p:g}'] = float(factor * final_price)
+        metrics[f'zirve_roi_p{p:g}'] = float(factor * peak_price)
+
+    return PopulationResult(
+        n_investors=n_investors,
+        metrics=metrics,
+        roi_bands=roi_bands,
+        entry_counts=entry_counts,
+        entry_investment=entry_investment,
+        holding_edges=np.exp(log_low + bin_width * np.arange(HOLDING_BINS + 1)),
+        holding_counts=holding_counts,
+        holding_sums=holding_sums,
+        investors=pd.concat(kept, ignore_index=True) if kept else None,
+        elapsed_seconds=time.perf_counter() - start_time,
+        percentiles=tuple(percentiles)
+    )
@@ -1,8 +1,12 @@
 # run.py  –  Streamlit’i başlatan sarıcı
 import sys, os
+import multiprocessing
 import streamlit.web.cli as stcli
 
 if __name__ == "__main__":
+    # exe içinde process pool worker'ları bu exe'yi yeniden çalıştırır - worker ise
+    # burada worker olarak çalışıp çıkar, ikinci bir Streamlit sunucusu başlatmaz
+    multiprocessing.freeze_support()
     # exe içindeyken göreceli yolların bozulmaması için
     os.chdir(os.path.dirname(__file__))
     sys.argv = ["streamlit", "run", "main.py", "--global.developmentMode=false"]
@@ -0,0 +1,169 @@
+"""
+NXID Scenario Library
+=====================
+Mainnet senaryoları isimli çeyreklik çarpan + beta eğrileridir. Yerleşik
+bear / base / bull config'teki 16 çeyreklik listelerden gelir; kullanıcı
+senaryoları config.custom_scenarios içinde saklanır (config hash'ine ve
+JSON kaydına dahil) ve istenen uzunlukta olabilir.
+
+Eğri projeksiyondan kısaysa:
+- "wrap": baştan tekrar eder
+- "hold": son çeyrek değeri korunur
+
+Yerleşik senaryolar eski motorun kuralını korur ("builtin"): çeyrek 16'lık
+döngüde sayılır (int(ay // 3) % 16), liste 16'dan kısaysa son değer korunur.
+
+Çeyreklik değerler bir kez gün başına array'lere açılır; mainnet motorları
+gün döngüsünde sadece indeksler. simulate_scenario_library tüm kütüphaneyi
+batch motoruyla tek gün döngüsünde çalıştırır.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Sequence, Tuple
+from config import EnhancedNXIDConfig
+
+BUILTIN_SCENARIOS = ("bear", "base", "bull")
+SCENARIO_OVERFLOW = ("wrap", "hold")
+BUILTIN_OVERFLOW = "builtin"     # yerleşik senaryolar: çeyrek % 16, liste kısaysa son değer
+BUILTIN_QUARTER_CYCLE = 16
+DAYS_PER_MONTH = 30.44
+
+
+@dataclass
+class ScenarioDefinition:
+    """İsimli senaryo - çeyrek başına McAp çarpanı (+ opsiyonel market beta)"""
+    name: str
+    multipliers: List[float]
+    betas: Optional[List[float]] = None      # None -> config.market_beta_per_quarter
+    overflow: str = "wrap"                   # "wrap" | "hold"
+    description: str = ""
+
+    def __post_init__(self):
+        if not self.name:
+            raise ValueError("Senaryo adı boş olamaz")
+        if not self.multipliers:
+            raise ValueError(f"'{self.name}' senaryosunda çarpan yok")
+        if self.betas is not None and not self.betas:
+            raise ValueError(f"'{self.name}' senaryosunda beta listesi boş")
+        if self.overflow not in SCENARIO_OVERFLOW + (BUILTIN_OVERFLOW,):
+            raise ValueError(f"Bilinmeyen overflow: {self.overflow} ({' / '.join(SCENARIO_OVERFLOW)})")
+        self.multipliers = [float(value) for value in self.multipliers]
+        if self.betas is not None:
+            self.betas = [float(value) for value in self.betas]
+
+    @property
+    def n_quarters(self) -> int:
+        return len(self.multipliers)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScenarioDefinition":
+        valid_fields = {'name', 'multipliers', 'betas', 'overflow', 'description'}
+        return cls(**{k: v for k, v in data.items() if k in valid_fields})
+
+
+def quarter_index(n_days: int) -> np.ndarray:
+    """Gün -> mainnet çeyreği (0 tabanlı, sarmadan)"""
+    return (np.arange(n_days) / DAYS_PER_MONTH // 3).astype(np.int64)
+
+
+def expand_quarterly(values: Sequence[float], n_days: int, overflow: str = "wrap") -> np.ndarray:
+    """Çeyreklik değerler -> (n_days,) gün başına array"""
+    values = np.asarray(values, dtype=float)
+    quarter = quarter_index(n_days)
+    if overflow == "wrap":
+        return values[quarter % len(values)]
+    if overflow == "hold":
+        return values[np.minimum(quarter, len(values) - 1)]
+    if overflow == BUILTIN_OVERFLOW:
+        return values[np.minimum(quarter % BUILTIN_QUARTER_CYCLE, len(values) - 1)]
+    raise ValueError(f"Bilinmeyen overflow: {overflow}")
+
+
+def builtin_scenario(config: EnhancedNXIDConfig, name: str) -> ScenarioDefinition:
+    """Config'teki bear / base / bull listelerinden yerleşik senaryo"""
+    multipliers = {'bear': 'bear_scenario_multipliers', 'base': 'base_scenario_multipliers',
+                   'bull': 'bull_scenario_multipliers'}[name]
+    return ScenarioDefinition(name=name, multipliers=getattr(config, multipliers),
+                              betas=config.market_beta_per_quarter, overflow=BUILTIN_OVERFLOW)
+
+
+def scenario_definition(config: EnhancedNXIDConfig, name: str) -> ScenarioDefinition:
+    """İsim -> senaryo; bilinmeyen isimler (eski davranış gibi) base'e düşer
+
+    Yerleşik isimler custom_scenarios'a bakmaz - aşama cache'i sadece gerçekten
+    okunan config alanlarıyla anahtarlanır.
+    """
+    if name in BUILTIN_SCENARIOS:
+        return builtin_scenario(config, name)
+    for data in config.custom_scenarios or []:
+        if data.get('name') == name:
+            return ScenarioDefinition.from_dict(data)
+    return builtin_scenario(config, "base")
+
+
+def scenario_day_arrays(config: EnhancedNXIDConfig, name: str, n_days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Senaryo -> (gün başına çarpan, gün başına market beta)"""
+    definition = scenario_definition(config, name)
+    betas = definition.betas if definition.betas is not None else config.market_beta_per_quarter
+    return (expand_quarterly(definition.multipliers, n_days, definition.overflow),
+            expand_quarterly(betas, n_days, definition.overflow))
+
+
+class ScenarioRegistry:
+    """📚 Senaryo kütüphanesi - yerleşikler + config.custom_scenarios"""
+
+    def __init__(self, config: EnhancedNXIDConfig):
+        self.config = config
+
+    def names(self) -> List[str]:
+        return list(BUILTIN_SCENARIOS) + [data['name'] for data in self.config.custom_scenarios or []]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names()
+
+    def get(self, name: str) -> ScenarioDefinition:
+        if name not in self:
+            raise KeyError(f"Senaryo bulunamadı: {name}")
+        return scenario_definition(self.config, name)
+
+    def definitions(self) -> List[ScenarioDefinition]:
+        return [self.get(name) for name in self.names()]
+
+    def register(self, definition: ScenarioDefinition, replace: bool = False):
+        """Kullanıcı senaryosu ekle (config.custom_scenarios'a yazılır)"""
+        if definition.name in BUILTIN_SCENARIOS:
+            raise ValueError(f"Yerleşik senaryo adı kullanılamaz: {definition.name}")
+        custom = [data for data in self.config.custom_scenarios or [] if data['name'] != definition.name]
+        if len(custom) != len(self.config.custom_scenarios or []) and not replace:
+            raise ValueError(f"Senaryo zaten var: {definition.name}")
+        custom.append(definition.to_dict())
+        self.config.custom_scenarios = custom
+
+    def remove(self, name: str):
+        if name in BUILTIN_SCENARIOS:
+            raise ValueError(f"Yerleşik senaryo silinemez: {name}")
+        self.config.custom_scenarios = [data for data in self.config.custom_scenarios or []
+                                        if data['name'] != name]
+
+
+def simulate_scenario_library(config: EnhancedNXIDConfig, names: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """🧪 Kütüphanedeki tüm senaryolar tek batch gün döngüsünde - senaryo başına headline metrikler
+
+    Her senaryo lane'i config'in kendi mainnet seed akışını kullanır; sonuç
+    senaryoyu tek başına simulate_mainnet_phase ile çalıştırmakla aynıdır.
+    """
+    from batch import config_array, simulate_mainnet_batch, simulate_presale_batch
+    from montecarlo import lane_metrics
+
+    names = list(names) if names is not None else ScenarioRegistry(config).names()
+    configs = [config] * len(names)
+    presale = simulate_presale_batch(configs)
+    recorder = simulate_mainnet_batch(configs, presale, names)
+    metrics = lane_metrics(recorder, config_array(configs, 'maturity_target_mcap'), presale.final_price)
+    metrics.index = pd.Index(names, name='senaryo')
+    return metrics
@@ -0,0 +1,267 @@
+"""
+NXID Simulation Service
+=======================
+Yerel HTTP/JSON servis - diğer araçlar modeli Streamlit olmadan çağırır.
+
+    python service.py --port 8765 --workers 4
+
+    POST /simulate   {"config": {...override...}, "scenario": "base",
+                      "series": ["token_fiyati", "mcap_usdt"], "max_points": 500}
+    GET  /health     -> {"status": "ok"}
+    GET  /stats      -> cache / kuyruk / pool sayaçları
+
+- İşler sınırlı bir process pool'da çalışır; kuyruktaki benzersiz iş sayısı
+  max_pending'i aşarsa 503 + Retry-After döner.
+- Aynı anahtarlı (kanonik config hash + senaryo + ENGINE_VERSION) eşzamanlı
+  istekler tek bir işi paylaşır; biten sonuçlar LRU cache'ten servis edilir.
+- Seriler max_points noktaya eşit aralıkla indirgenir (ilk / son gün korunur).
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+from config import EnhancedNXIDConfig
+from models import ENGINE_VERSION
+
+logger = logging.getLogger("nxid.service")
+
+# Worker'ın döndürdüğü mainnet serileri - istek bunlardan seçer
+SERIES_COLUMNS = ('ay', 'mcap_usdt', 'token_fiyati', 'staking_orani', 'gross_circulating_supply',
+                  'effective_circulating_supply', 'toplam_burned', 'guncel_market_apy')
+DEFAULT_SERIES = ('mcap_usdt', 'token_fiyati', 'staking_orani')
+DEFAULT_MAX_POINTS = 500
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class ServiceBusy(Exception):
+    """Kuyruk dolu - istemci tekrar denemeli"""
+
+
+def job_key(config: EnhancedNXIDConfig, scenario: str) -> str:
+    payload = f"{config.config_hash()}|{scenario}|{ENGINE_VERSION}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _simulate_job(config_data: Dict, scenario: str) -> Dict:
+    """Worker giriş noktası - metrikler + SERIES_COLUMNS (numpy, pickle ile döner)"""
+    from pipeline import DEFAULT_PIPELINE
+
+    config = EnhancedNXIDConfig.from_dict(config_data)
+    run = DEFAULT_PIPELINE.run(config, scenario)
+    mainnet_df = run['mainnet']
+    return {'metrics': run['metrics'],
+            'series': {name: mainnet_df[name].to_numpy(copy=True) for name in SERIES_COLUMNS}}
+
+
+def downsample_index(n: int, max_points: int) -> np.ndarray:
+    """Eşit aralıklı max_points indeks (ilk ve son nokta dahil)"""
+    if max_points <= 0 or n <= max_points:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max_points).round().astype(np.int64))
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"JSON'a çevrilemeyen tip: {type(value).__name__}")
+
+
+class SimulationService:
+    """🛰️ Sınırlı process pool + in-flight dedupe + sonuç LRU'su"""
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = 64,
+                 cache_entries: int = 256, request_timeout: float = 120.0):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.cache_entries = cache_entries
+        self.request_timeout = request_timeout
+        self.pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        # RLock: zaten bitmiş future'da add_done_callback _finish'i kilit altındayken çağırır
+        self.lock = threading.RLock()
+        self.in_flight: Dict[str, Future] = {}
+        self.cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self.counters = {'requests': 0, 'cache_hits': 0, 'deduplicated': 0, 'computed': 0,
+                         'rejected': 0, 'errors': 0}
+
+    def _submit(self, key: str, config: EnhancedNXIDConfig, scenario: str) -> Tuple[Future, str]:
+        """Cache / in-flight / yeni iş - (future, kaynak)"""
+        with self.lock:
+            self.counters['requests'] += 1
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.counters['cache_hits'] += 1
+                future = Future()
+                future.set_result(self.cache[key])
+                return future, 'cache'
+            if key in self.in_flight:
+                self.counters['deduplicated'] += 1
+                return self.in_flight[key], 'dedupe'
+            if len(self.in_flight) >= self.max_pending:
+                self.counters['rejected'] += 1
+                raise ServiceBusy(f"{len(self.in_flight)} iş kuyrukta")
+            try:
+                future = self.pool.submit(_simulate_job, config.to_dict(), scenario)
+            except BrokenProcessPool:
+                # Çöken worker pool'u bozar - yeniden kur
+                self.pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                future = self.pool.submit(_simulate_job, config.to_dict(), scenario)
+            self.in_flight[key] = future
+            future.add_done_callback(lambda done, key=key: self._finish(key, done))
+            return future, 'computed'
+
+    def _finish(self, key: str, future: Future):
+        with self.lock:
+            self.in_flight.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                self.counters['errors'] += 1
+                return
+            self.counters['computed'] += 1
+            self.cache[key] = future.result()
+            while len(self.cache) > self.cache_entries:
+                self.cache.popitem(last=False)
+
+    def simulate(self, payload: Dict) -> Dict:
+        """İstek gövdesi -> yanıt dict'i (ValueError: hatalı istek, ServiceBusy: kuyruk dolu)"""
+        overrides = payload.get('config') or {}
+        if not isinstance(overrides, dict):
+            raise ValueError("'config' bir JSON nesnesi olmalı")
+        unknown = set(overrides) - set(EnhancedNXIDConfig.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Bilinmeyen config alanları: {sorted(unknown)}")
+        config = EnhancedNXIDConfig.from_dict({**EnhancedNXIDConfig().to_dict(), **overrides})
+        if not (config.validate_distribution() and config.validate_tax_distribution()
+                and config.validate_enhanced_parameters()):
+            raise ValueError("Geçersiz config (dağılım / tax / enhanced parametreler)")
+        scenario = str(payload.get('scenario', 'base'))
+        series_names = payload.get('series', [])
+        if series_names is True:
+            series_names = list(DEFAULT_SERIES)
+        unknown_series = set(series_names) - set(SERIES_COLUMNS)
+        if unknown_series:
+            raise ValueError(f"Bilinmeyen seriler: {sorted(unknown_series)} (mevcut: {list(SERIES_COLUMNS)})")
+        max_points = int(payload.get('max_points', DEFAULT_MAX_POINTS))
+
+        key = job_key(config, scenario)
+        start = time.perf_counter()
+        future, source = self._submit(key, config, scenario)
+        result = future.result(timeout=self.request_timeout)
+
+        response = {'key': key, 'scenario': scenario, 'source': source,
+                    'elapsed_seconds': time.perf_counter() - start, 'metrics': result['metrics']}
+        if series_names:
+            index = downsample_index(len(result['series']['ay']), max_points)
+            response['series'] = {'ay': result['series']['ay'][index],
+                                  **{name: result['series'][name][index] for name in series_names}}
+        return response
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {**self.counters, 'cache_entries': len(self.cache), 'in_flight': len(self.in_flight),
+                    'max_workers': self.max_workers, 'max_pending': self.max_pending,
+                    'engine_version': ENGINE_VERSION}
+
+    def shutdown(self, wait: bool = True):
+        self.pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class SimulationRequestHandler(BaseHTTPRequestHandler):
+    """JSON istek / yanıt - servis nesnesi server.service üzerinden"""
+    server_version = "NXIDSimulation/1.0"
+
+    def _send(self, status: int, body: Dict, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body, default=_json_default, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, {'status': 'ok'})
+        elif self.path == '/stats':
+            self._send(200, self.server.service.stats())
+        else:
+            self._send(404, {'error': f"Bilinmeyen yol: {self.path}"})
+
+    def do_POST(self):
+        if self.path != '/simulate':
+            self._send(404, {'error': f"Bilinmeyen yol: {self.path}"})
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            self._send(413, {'error': "İstek gövdesi çok büyük"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(payload, dict):
+                raise ValueError("İstek gövdesi bir JSON nesnesi olmalı")
+            self._send(200, self.server.service.simulate(payload))
+        except ServiceBusy as e:
+            self._send(503, {'error': f"Servis meşgul: {e}"}, {'Retry-After': '1'})
+        except FutureTimeoutError:
+            self._send(504, {'error': "Simülasyon zaman aşımı"})
+        except (ValueError, TypeError) as e:
+            self._send(400, {'error': str(e)})
+        except Exception as e:
+            logger.exception("Simülasyon hatası")
+            self._send(500, {'error': f"{type(e).__name__}: {e}"})
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class SimulationHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128   # varsayılan 5 - eşzamanlı istemcilerde SYN düşer, 1s yeniden deneme
+
+
+def create_server(host: str = "127.0.0.1", port: int = 8765, **service_kwargs) -> ThreadingHTTPServer:
+    """Sunucu + servis (server.service); serve_forever ayrı çağrılır"""
+    server = SimulationHTTPServer((host, port), SimulationRequestHandler)
+    server.service = SimulationService(**service_kwargs)
+    return server
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="NXID simülasyon HTTP servisi")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None, help="Process sayısı (varsayılan: CPU)")
+    parser.add_argument('--max-pending', type=int, default=64, help="Kuyruktaki benzersiz iş sınırı")
+    parser.add_argument('--cache-entries', type=int, default=256)
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    server = create_server(args.host, args.port, max_workers=args.workers, max_pending=args.max_pending,
+                           cache_entries=args.cache_entries)
+    logger.info(f"NXID simulation service http://{args.host}:{args.port} "
+                f"({server.service.max_workers} worker)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,8 @@ Enhanced: Detailed Controls + Examples + Advanced Maturity + Dynamic Staking + R
 import streamlit as st
 import json
 import os
-from config import EnhancedNXIDConfig
+from config import PRESALE_ENGINES, EnhancedNXIDConfig
+from scenarios import ScenarioDefinition
 from utils import display_nxid_logo, NXID_COLORS
 
 class SidebarManager:
@@ -181,7 +182,7 @@ class SidebarManager:
             config.projection_months = st.number_input(
                 "Mainnet Projeksiyonu (ay)", 
                 min_value=12, 
-                max_value=60, 
+                max_value=120, 
                 value=config.projection_months, 
                 step=3,
                 help="""
@@ -191,6 +192,7 @@ class SidebarManager:
                 • 24 ay = Kısa vadeli analiz
                 • 36 ay = Orta vadeli analiz
                 • 48 ay = Uzun vadeli analiz (önerilen)
+                • 120 ay = 10 yıl (16 çeyrekten uzun eğriler senaryo kütüphanesinden)
                 
                 İçerir: Market dinamikleri, staking, vergi/yakma, maturity ilerlemesi
                 """
@@ -546,6 +548,21 @@ class SidebarManager:
                     Analiz: Basit faiz ile token birikimini gösterir
                     """
                 )
+                config.cohort_days = st.number_input(
+                    "Kohort Periyodu (gün)",
+                    min_value=1,
+                    max_value=30,
+                    value=int(config.cohort_days),
+                    step=1,
+                    help="""
+                    Giriş Kohortu Periyodu:
+                    
+                    • 7 gün = Haftalık kohortlar (varsayılan)
+                    • 1 gün = Her presale günü ayrı kohort
+                    
+                    Tüm presale boyunca kohort sınırı yoktur
+                    """
+                )
             
             # Presale etkisini göster
             days = config.presale_days
@@ -784,7 +801,7 @@ class SidebarManager:
             config.price_velocity_window = st.number_input(
                 "Fiyat Hızı Penceresi (gün)", 
                 min_value=3, 
-                max_value=30, 
+                max_value=365, 
                 value=config.price_velocity_window, 
                 step=1,
                 help="""
@@ -794,6 +811,7 @@ class SidebarManager:
                 • 5 gün = Kısa vadeli hareketlere çok duyarlı
                 • 7 gün = Haftalık hız (standart)
                 • 14 gün = İki haftalık hız (daha yumuşak)
+                • 90+ gün = Çeyreklik eğilim (ring buffer ile maliyet pencereden bağımsız)
                 
                 Daha kısa = fiyat değişikliklerine daha reaktif
                 Daha uzun = daha yumuşak, daha az değişken staking davranışı
@@ -1343,6 +1361,21 @@ class SidebarManager:
         """Vesting Programları"""
         with st.sidebar.expander("Vesting Programları", expanded=False):
             
+            config.vesting_delay_months = st.number_input(
+                "Vesting Başlangıç Gecikmesi (ay)",
+                min_value=0,
+                max_value=24,
+                value=int(config.vesting_delay_months),
+                step=1,
+                help="""
+                Tüm cliff / vesting sayaçları bu gecikmeden sonra başlar
+                (presale ve likidite anında serbest).
+                
+                • 6 ay = Varsayılan
+                • 0 ay = Vesting mainnet ile başlar
+                """
+            )
+            
             st.markdown("### Staking Havuz Vesting")
             st.info("**Not:** Presale staking havuzu anında serbest bırakılır (0 cliff, 1 ay vesting)")
             
@@ -1564,6 +1597,128 @@ class SidebarManager:
             • Dinamik APY: {'Etkin' if config.dynamic_apy_enabled else 'Devre Dışı'}
             """)
             
+            st.markdown("### Simülasyon Motoru")
+            presale_engines = list(PRESALE_ENGINES)
+            config.presale_engine = st.selectbox(
+                "Presale Motoru",
+                presale_engines,
+                index=presale_engines.index(config.presale_engine) if config.presale_engine in presale_engines else 0,
+                help="""
+                Presale Simülasyon Motoru:
+                
+                vectorized (Varsayılan): Fiyat, talep ve volatilite array olarak hesaplanır
+                • Uzun presale süreleri ve parametre taramaları için hızlı
+                • Sadece APY / ödül havuzu döngüsü sıralı çalışır
+                
+                loop: Referans gün gün Python döngüsü
+                • Sonuçlar vectorized ile tolerans dahilinde aynıdır
+                """
+            )
+            config.simulation_seed = st.number_input(
+                "Simülasyon Seed",
+                min_value=0, max_value=2**31 - 1,
+                value=int(config.simulation_seed), step=1,
+                help="Presale talep ve mainnet volatilite akışlarının kök seed'i - aynı seed aynı sonucu verir"
+            )
+            config.vesting_daily_interpolation = st.checkbox(
+                "Günlük Vesting İnterpolasyonu",
+                value=config.vesting_daily_interpolation,
+                help="""
+                Mainnet dolaşım arzı:
+                • Kapalı (varsayılan): Her ay içinde sabit, ay başında basamak
+                • Açık: Unlock eğrisi aylar arasında günlük doğrusal interpolasyon (cliff atlamaları yumuşar)
+                """
+            )
+            
+            st.markdown("### Monte Carlo")
+            config.monte_carlo_enabled = st.checkbox(
+                "Monte Carlo Bantları",
+                value=config.monte_carlo_enabled,
+                help="""
+                Mainnet fazı çok sayıda bağımsız volatilite yolu ile simüle edilir:
+                • McAp, fiyat ve staking oranı için günlük p5/p25/p50/p75/p95 bantları
+                • Headline metriklerin (zirve fiyat, final ROI...) dağılımı
+                • Tek seed'e bağlı tek bir çizgi yerine belirsizlik aralığı
+                """
+            )
+            if config.monte_carlo_enabled:
+                config.monte_carlo_paths = st.number_input(
+                    "Yol Sayısı", min_value=100, max_value=20000,
+                    value=int(config.monte_carlo_paths), step=100,
+                    help="10.000 yol / 48 ay birkaç saniye sürer"
+                )
+                config.monte_carlo_seed = st.number_input(
+                    "Seed", min_value=0, max_value=2**31 - 1,
+                    value=int(config.monte_carlo_seed), step=1,
+                    help="Aynı seed aynı bantları üretir"
+                )
+            
+            st.markdown("### Senaryo Kütüphanesi")
+            scenarios_text = st.text_area(
+                "Özel Senaryolar (JSON)",
+                value=json.dumps(config.custom_scenarios, ensure_ascii=False, indent=1),
+                height=150,
+                help="""
+                İsimli senaryo listesi - çeyrek sayısı serbest:
+                [{"name": "supercycle", "multipliers": [1.0, 1.4, 2.0, ...],
+                  "betas": [1.1, 1.0, ...] (opsiyonel), "overflow": "hold" | "wrap"}]
+                
+                hold = son çeyrek korunur, wrap = eğri baştan tekrar eder
+                """
+            )
+            try:
+                custom_scenarios = json.loads(scenarios_text or "[]")
+                for data in custom_scenarios:
+                    ScenarioDefinition.from_dict(data)
+                config.custom_scenarios = custom_scenarios
+            except (ValueError, TypeError, AttributeError) as e:
+                st.error(f"Senaryo JSON hatası: {e}")
+            
+            st.markdown("### Yatırımcı Popülasyonu")
+            config.population_enabled = st.checkbox(
+                "Popülasyon Simülasyonu",
+                value=config.population_enabled,
+                help="Bireysel yatırımcılar örneklenir: ROI yüzdelikleri, holder konsantrasyonu ve Gini"
+            )
+            if config.population_enabled:
+                config.investor_count_simulation = st.number_input(
+                    "Yatırımcı Sayısı", min_value=1, max_value=5_000_000,
+                    value=int(config.investor_count_simulation), step=1000,
+                    help="Bellek yatırımcı sayısından bağımsız - 1M yatırımcı ~1 saniye"
+                )
+                config.min_investment_usdt = st.number_input(
+                    "Min Yatırım (USDT)", min_value=1.0, max_value=1_000_000.0,
+                    value=float(config.min_investment_usdt), step=50.0
+                )
+                config.max_investment_usdt = st.number_input(
+                    "Max Yatırım (USDT)", min_value=float(config.min_investment_usdt), max_value=10_000_000.0,
+                    value=max(float(config.max_investment_usdt), float(config.min_investment_usdt)), step=500.0
+                )
+            
+            st.markdown("### Grafik Performansı")
+            config.chart_max_points = st.number_input(
+                "Trace Başına Maks. Nokta", min_value=10, max_value=20000,
+                value=int(config.chart_max_points), step=100,
+                help="Uzun günlük seriler bu bütçeye indirgenir - ilk / son nokta ve tepe / dip korunur"
+            )
+            downsample_methods = ["lttb", "minmax", "none"]
+            config.chart_downsample_method = st.selectbox(
+                "Downsample Yöntemi",
+                downsample_methods,
+                index=downsample_methods.index(config.chart_downsample_method)
+                if config.chart_downsample_method in downsample_methods else 0,
+                help="""
+                lttb (Varsayılan): Largest-Triangle-Three-Buckets - çizgi şeklini korur
+                minmax: Her bucket'ın min ve max noktası - gürültülü serilerde tepe / dip garantili
+                none: Tüm günlük noktalar tarayıcıya gönderilir
+                """
+            )
+            config.chart_webgl_threshold = st.number_input(
+                "WebGL Eşiği (Figür Başına Nokta)", min_value=0, max_value=1_000_000,
+                value=int(config.chart_webgl_threshold), step=1000,
+                help="Toplam nokta bu eşiği aşan grafikler SVG yerine WebGL (Scattergl) ile çizilir - 0 = kapalı"
+            )
+            
             st.markdown("### Sistem Versiyon Bilgisi")
             system_info = config.get_system_info()
             st.info(f"""
@@ -0,0 +1,221 @@
+"""
+NXID Parameter Sweep Engine
+===========================
+EnhancedNXIDConfig alanları üzerinde grid / rastgele aralık taraması.
+Her nokta presale → vesting → mainnet → calculate_enhanced_metrics
+zincirini çalıştırır; noktalar chunk'lar halinde process pool'a dağıtılır
+ve sonuç tek bir düz (tidy) metrik tablosudur.
+
+- chunk_size: process'ler arası pickle / IPC yükünü azaltır
+- progress(tamamlanan, toplam) callback'i
+- worker çökmesi (BrokenProcessPool) -> pool yeniden kurulur, biten
+  chunk'lar korunur; tekrar çöken chunk'ın noktaları tek worker'da
+  sırayla çalıştırılır, çöken nokta 'hata' kolonu ile işaretlenir.
+"""
+
+import itertools
+import math
+import os
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import fields
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from config import EnhancedNXIDConfig
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def config_field_types() -> Dict[str, type]:
+    """Tarama yapılabilir config alanları -> tip (int / float / bool / str)"""
+    scalar_types = {int: int, float: float, bool: bool, str: str,
+                    'int': int, 'float': float, 'bool': bool, 'str': str}
+    return {f.name: scalar_types[f.type] for f in fields(EnhancedNXIDConfig) if f.type in scalar_types}
+
+
+def _coerce(name: str, value, field_types: Dict[str, type]):
+    if name not in field_types:
+        raise ValueError(f"Taranamayan / bilinmeyen config alanı: {name}")
+    kind = field_types[name]
+    if kind is int:
+        return int(round(float(value)))
+    if kind is float:
+        return float(value)
+    if kind is bool:
+        return bool(value)
+    return value
+
+
+def config_grid(grid: Dict[str, Sequence]) -> List[Dict]:
+    """Kartezyen grid: {'alan': [değerler]} -> override dict listesi"""
+    field_types = config_field_types()
+    names = list(grid)
+    return [{name: _coerce(name, value, field_types) for name, value in zip(names, combo)}
+            for combo in itertools.product(*(grid[name] for name in names))]
+
+
+def config_samples(ranges: Dict[str, Tuple[float, float]], n_points: int,
+                   seed: Optional[int] = None) -> List[Dict]:
+    """Latin hypercube örnekleme: {'alan': (alt, üst)} -> n_points override dict'i"""
+    field_types = config_field_types()
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, (low, high) in ranges.items():
+        strata = (rng.permutation(n_points) + rng.random(n_points)) / n_points
+        columns[name] = low + strata * (high - low)
+    return [{name: _coerce(name, columns[name][i], field_types) for name in ranges}
+            for i in range(n_points)]
+
+
+def flatten_metrics(metrics: Dict) -> Dict[str, float]:
+    """calculate_enhanced_metrics çıktısı -> 'bölüm.metrik' skaler kolonları"""
+    flat = {}
+    for section, values in metrics.items():
+        if isinstance(values, dict):
+            for key, value in values.items():
+                if isinstance(value, (bool, np.bool_, int, float, np.integer, np.floating)):
+                    flat[f'{section}.{key}'] = value
+        elif isinstance(values, (bool, np.bool_, int, float, np.integer, np.floating, str)):
+            flat[section] = values
+    return flat
+
+
+def simulate_config(config: EnhancedNXIDConfig, scenario: str = "base") -> Dict:
+    """Tek config için tam zincir: presale → weekly → vesting → mainnet → metrikler"""
+    from models import EnhancedTokenomicsModel
+
+    model = EnhancedTokenomicsModel(config)
+    presale_df = model.simulate_presale_phase()
+    weekly_token_df = model.generate_weekly_token_analysis(presale_df)
+    vesting_df = model.calculate_individual_vesting_schedules()
+    mainnet_df = model.simulate_mainnet_phase(presale_df, vesting_df, scenario)
+    return model.calculate_enhanced_metrics(presale_df, weekly_token_df, vesting_df, mainnet_df)
+
+
+def _config_valid(config: EnhancedNXIDConfig) -> bool:
+    return (config.validate_distribution() and config.validate_tax_distribution()
+            and config.validate_enhanced_parameters())
+
+
+def _run_point(base: Dict, overrides: Dict, scenario: str) -> Dict:
+    row = {}
+    try:
+        config = EnhancedNXIDConfig.from_dict({**base, **overrides})
+        row['config_gecerli'] = _config_valid(config)
+        metrics = simulate_config(config, scenario)
+        if 'error' in metrics:
+            row['hata'] = str(metrics['error'])
+        row.update(flatten_metrics(metrics))
+    except Exception as e:
+        row['hata'] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def _run_chunk(base: Dict, scenario: str, chunk: List[Tuple[int, Dict]]) -> List[Tuple[int, Dict]]:
+    """Worker giriş noktası - bir chunk'taki tüm noktalar (hatalar satır olarak döner)"""
+    return [(index, _run_point(base, overrides, scenario)) for index, overrides in chunk]
+
+
+def _chunks(items: List, size: int) -> List[List]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _run_isolated(base: Dict, scenario: str, points: List[Tuple[int, Dict]], report):
+    """Tekrar çöken chunk'ın noktaları tek worker'da sırayla - çöken nokta kesin olarak bulunur"""
+    pool = ProcessPoolExecutor(max_workers=1)
+    try:
+        for point in points:
+            try:
+                report(pool.submit(_run_chunk, base, scenario, [point]).result())
+            except BrokenProcessPool:
+                report([(point[0], {'hata': 'worker çöktü (BrokenProcessPool)'})])
+                pool.shutdown(wait=False)
+                pool = ProcessPoolExecutor(max_workers=1)
+    finally:
+        pool.shutdown()
+
+
+def run_sweep(points: Union[Sequence[Dict], Dict[str, Sequence]],
+              base_config: Optional[EnhancedNXIDConfig] = None, scenario: str = "base",
+              max_workers: Optional[int] = None, chunk_size: Optional[int] = None,
+              progress: Optional[ProgressCallback] = None, max_retries: int = 1) -> pd.DataFrame:
+    """🧪 Parametre taraması - her nokta için bir satır (override alanları + düz metrikler)
+
+    points: override dict listesi ya da doğrudan grid ({'alan': [değerler]}).
+    max_workers=0 aynı process'te sıralı çalıştırır (debug / küçük taramalar).
+    Başarısız noktalar 'hata' kolonu dolu satır olarak döner, tarama durmaz.
+    """
+    if isinstance(points, dict):
+        points = config_grid(points)
+    points = list(points)
+    base = (base_config or EnhancedNXIDConfig()).to_dict()
+    total = len(points)
+    if total == 0:
+        return pd.DataFrame()
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunk_size is None:
+        # Worker başına ~4 chunk: IPC yükü düşük, yük dengesi yeterli
+        chunk_size = max(1, min(256, math.ceil(total / (max(1, max_workers) * 4))))
+
+    start = time.perf_counter()
+    results: Dict[int, Dict] = {}
+    indexed = list(enumerate(points))
+
+    def _report(rows):
+        for index, row in rows:
+            results[index] = row
+        if progress is not None:
+            progress(len(results), total)
+
+    if max_workers == 0:
+        for chunk in _chunks(indexed, chunk_size):
+            _report(_run_chunk(base, scenario, chunk))
+    else:
+        pending = [(chunk, 0) for chunk in _chunks(indexed, chunk_size)]
+        while pending:
+            crashed = []
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = {pool.submit(_run_chunk, base, scenario, chunk): (chunk, attempt)
+                           for chunk, attempt in pending}
+                try:
+                    for future in as_completed(futures):
+                        try:
+                            _report(future.result())
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            # Pickle vb. chunk düzeyi hata - noktaları işaretle
+                            chunk, _ = futures[future]
+                            _report([(index, {'hata': f"{type(e).__name__}: {e}"}) for index, _ in chunk])
+                except BrokenProcessPool:
+                    for future, (chunk, attempt) in futures.items():
+                        if future.done() and not future.cancelled() and future.exception() is None:
+                            _report(future.result())
+                        else:
+                            crashed.append((chunk, attempt))
+
+            pending, suspects = [], []
+            for chunk, attempt in crashed:
+                chunk = [(index, overrides) for index, overrides in chunk if index not in results]
+                if not chunk:
+                    continue
+                if attempt < max_retries:
+                    pending.append((chunk, attempt + 1))
+                else:
+                    suspects.extend(chunk)
+            if suspects:
+                _run_isolated(base, scenario, suspects, _report)
+
+    rows = []
+    for index, overrides in indexed:
+        rows.append({'nokta': index, **overrides, **results.get(index, {})})
+    sweep_df = pd.DataFrame(rows)
+    if 'hata' not in sweep_df.columns:
+        sweep_df['hata'] = None
+    sweep_df.attrs['elapsed_seconds'] = time.perf_counter() - start
+    sweep_df.attrs['scenario'] = scenario
+    return sweep_df
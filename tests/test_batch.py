@@ -0,0 +1,50 @@
+"""
+simulate_batch <-> tek config run eşdeğerliği
+=============================================
+Batch motoru her config'i bir lane olarak çalıştırır; satır başına metrikler
+(değer ve tip) tek başına simulate_config ile aynı olmalıdır.
+
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from batch import simulate_batch
+from config import EnhancedNXIDConfig
+from sweep import simulate_config
+
+PRESALE_COLUMNS = ('presale_gun_sayisi', 'final_presale_fiyati', 'toplam_toplanan_usdt', 'satilan_token')
+
+CONFIGS = [
+    {},
+    {'presale_days': 90, 'simulation_seed': 7},
+    {'base_daily_demand_usdt': 5e6},                      # token limiti ile erken biten presale
+    {'include_staked_in_circulating': False, 'price_velocity_window': 200},
+    {'mainnet_tax_rate': 8.0, 'projection_months': 120},  # ayrı projeksiyon grubu
+]
+
+
+@pytest.fixture(scope='module')
+def batch():
+    configs = [EnhancedNXIDConfig(**overrides) for overrides in CONFIGS]
+    return simulate_batch(configs)
+
+
+@pytest.mark.parametrize('index', range(len(CONFIGS)))
+def test_batch_metrics_match_single_run(batch, index):
+    single = simulate_config(batch.configs[index])
+    row = batch.config_metrics(index)
+
+    for name, value in row.items():
+        section = 'presale' if name in PRESALE_COLUMNS else 'mainnet'
+        if name not in single[section]:
+            continue
+        expected = single[section][name]
+        assert type(value) is type(expected), name
+        assert value == pytest.approx(expected, rel=1e-9, abs=1e-12), name
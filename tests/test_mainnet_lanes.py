@@ -0,0 +1,70 @@
+"""
+Lane motoru <-> simulate_mainnet_phase eşdeğerliği
+==================================================
+mainnet_lanes.run_mainnet_lanes, models.simulate_mainnet_phase'in vektörel
+kopyasıdır (Monte Carlo + batch). Tek lane'e tek run'ın volatilite şokları
+verildiğinde iki motor aynı seriyi üretmelidir - biri değişip diğeri
+değişmezse bu test kırılır.
+
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import EnhancedNXIDConfig
+from mainnet_lanes import ColumnRecorder, simulate_mainnet_lanes
+from models import EnhancedTokenomicsModel
+
+LANE_COLUMNS = ['mcap_usdt', 'token_fiyati', 'gross_circulating_supply', 'effective_circulating_supply',
+                'maturity_effect', 'maturity_distance_ratio', 'volatilite_etkisi', 'toplam_burned',
+                'kumulatif_tax_toplam', 'smoothed_price_velocity', 'kumulatif_staked', 'staking_orani',
+                'guncel_market_apy', 'dagitilan_staking_odul']
+
+CONFIGS = {
+    'default': {},
+    'staked_excluded': {'include_staked_in_circulating': False},
+    'no_maturity': {'enable_maturity_damping': False},
+    'velocity_window_1': {'price_velocity_window': 1},
+    'velocity_window_200': {'price_velocity_window': 200},
+    'daily_vesting_120m': {'vesting_daily_interpolation': True, 'projection_months': 120},
+    'long_tax': {'mainnet_tax_period_months': 24, 'mainnet_tax_rate': 8.0},
+}
+
+
+class ReplayNoise:
+    """Tek run'ın volatilite şoklarını lane motoruna gün gün veren rng yerine geçen nesne"""
+
+    def __init__(self, noise: np.ndarray):
+        self.noise = noise
+        self.day = 0
+
+    def standard_normal(self, n: int) -> np.ndarray:
+        values = self.noise[self.day:self.day + n]
+        self.day += n
+        return values
+
+
+@pytest.mark.parametrize('scenario', ['bear', 'base', 'bull'])
+@pytest.mark.parametrize('overrides', list(CONFIGS.values()), ids=list(CONFIGS))
+def test_single_lane_matches_simulate_mainnet_phase(overrides, scenario):
+    config = EnhancedNXIDConfig(**overrides)
+    model = EnhancedTokenomicsModel(config)
+    presale_df = model.simulate_presale_phase()
+    vesting_df = model.calculate_individual_vesting_schedules()
+    mainnet_df = model.simulate_mainnet_phase(presale_df, vesting_df, scenario)
+
+    # simulate_mainnet_phase şoklarını 'mainnet' akışından tek seferde çeker
+    noise = model.make_rng('mainnet').standard_normal(len(mainnet_df))
+    recorder = simulate_mainnet_lanes(config, presale_df, vesting_df, scenario, 1, ReplayNoise(noise),
+                                      ColumnRecorder(LANE_COLUMNS))
+
+    for column in LANE_COLUMNS:
+        np.testing.assert_allclose(recorder.columns[column][:, 0], mainnet_df[column].to_numpy(dtype=float),
+                                   rtol=1e-9, atol=1e-12, err_msg=column)
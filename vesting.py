@@ -0,0 +1,103 @@
+"""
+NXID Table-Driven Vesting Engine
+================================
+Her tahsis bir tablo satırıdır (pay, cliff, vesting süresi, gecikme, anında).
+Tüm program tek bir broadcast array işlemiyle hesaplanır:
+ay × tahsis - istenirse önünde batch ekseni (binlerce alternatif tablo).
+
+Satır kuralı (calculate_individual_vesting_schedules ile aynı):
+    vesting_ay = max(0, ay - delay)
+    vested = 0                                                 vesting_ay < cliff
+           = tokens * min(1, (vesting_ay - cliff) / max(1, vesting - cliff))
+    instant satırlar (presale, liquidity) ay 0'dan itibaren tamamı serbest.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Sequence, Union
+
+VESTING_TABLE_COLUMNS = ('name', 'share_pct', 'cliff_months', 'vesting_months', 'delay_months', 'instant')
+
+
+def vesting_table(allocations: Union[pd.DataFrame, Sequence[Dict]]) -> pd.DataFrame:
+    """Tahsis listesini (dict'ler) veya DataFrame'i standart vesting tablosuna çevir"""
+    if isinstance(allocations, pd.DataFrame):
+        allocations = allocations.to_dict('records')
+    defaults = {'cliff_months': 0, 'vesting_months': 0, 'delay_months': 0, 'instant': False}
+    rows = []
+    for allocation in allocations:
+        missing = [c for c in ('name', 'share_pct') if c not in allocation]
+        if missing:
+            raise ValueError(f"Vesting tablosunda eksik kolon(lar): {missing}")
+        row = dict(defaults)
+        row.update({k: v for k, v in allocation.items() if v is not None and not pd.isna(v)})
+        row['instant'] = bool(row['instant'])
+        rows.append(row)
+    return pd.DataFrame(rows, columns=list(VESTING_TABLE_COLUMNS))
+
+
+def vested_tokens(share_pct, cliff_months, vesting_months, delay_months, instant,
+                  months, total_supply: float) -> np.ndarray:
+    """Broadcast vesting: tahsis parametreleri (..., A), months (M,) -> (..., M, A) token
+
+    Parametreler aynı şekle broadcast edilebilen array'ler olabilir; önde ek
+    eksenler (ör. (B, A) batch) sonuçta korunur. months kesirli olabilir.
+    """
+    months = np.asarray(months, dtype=float)[:, None]
+    share_pct, cliff, vesting, delay, instant = (
+        np.expand_dims(np.asarray(p), -2)
+        for p in (share_pct, cliff_months, vesting_months, delay_months, instant))
+
+    tokens = total_supply * (share_pct / 100)
+    vesting_month = np.maximum(0, months - delay)
+    progress = np.minimum(1.0, (vesting_month - cliff) / np.maximum(1, vesting - cliff))
+    vested = np.where(vesting_month < cliff, 0.0, tokens * progress)
+    return np.where(instant.astype(bool), tokens * (months >= 0), vested)
+
+
+def vesting_params(table: pd.DataFrame) -> np.ndarray:
+    """Tablo -> (5, A) parametre array'i: share_pct, cliff, vesting, delay, instant"""
+    return np.stack([table[column].to_numpy(dtype=float) for column in VESTING_TABLE_COLUMNS[1:]])
+
+
+def vesting_matrix(table: pd.DataFrame, months, total_supply: float) -> np.ndarray:
+    """Tek tablo için (M, A) vested token matrisi"""
+    return vested_tokens(*vesting_params(table), months, total_supply)
+
+
+def circulating_supply_batch(tables: Union[np.ndarray, Sequence[pd.DataFrame]], months,
+                             total_supply: float) -> np.ndarray:
+    """Aynı tahsis sırasına sahip birçok tablo için (B, M) dolaşım arzı
+
+    tables: tablo listesi ya da doğrudan (B, 5, A) parametre array'i (sweep'ler
+    için pandas'a hiç girmeden).
+    """
+    params = tables if isinstance(tables, np.ndarray) else np.stack([vesting_params(t) for t in tables])
+    vested = vested_tokens(params[:, 0], params[:, 1], params[:, 2], params[:, 3], params[:, 4],
+                           months, total_supply)
+    return vested.sum(axis=-1)
+
+
+def vesting_schedule_frame(table: pd.DataFrame, months_projection: int, total_supply: float,
+                           delay_months: int = 6) -> pd.DataFrame:
+    """Tablo -> aylık vesting DataFrame'i (vested_<name> + <name>_vested_pct kolonları)"""
+    months = np.arange(months_projection)
+    vested = vesting_matrix(table, months, total_supply)
+    tokens = total_supply * (table['share_pct'].to_numpy(dtype=float) / 100)
+
+    # Toplam soldan sağa (tablo sırası) toplanır - eski satır toplamıyla birebir
+    total_vested = np.zeros(months_projection)
+    for column in vested.T:
+        total_vested = total_vested + column
+
+    data = {'ay': months, 'vesting_ay': np.maximum(0, months - delay_months)}
+    for name, column in zip(table['name'], vested.T):
+        data[f'vested_{name}'] = column
+    data['toplam_vested'] = total_vested
+    data['circulating_supply'] = total_vested
+    data['vested_toplam_arz_yuzdesi'] = total_vested / total_supply * 100
+    data['dolasim_yuzdesi'] = total_vested / total_supply * 100
+    for name, column, amount in zip(table['name'], vested.T, tokens):
+        data[f'{name}_vested_pct'] = column / amount * 100 if amount > 0 else np.zeros(months_projection)
+    data['vesting_basladi'] = months >= delay_months
+    return pd.DataFrame(data)
@@ -9,11 +9,83 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-from typing import Dict, List, Tuple
+from collections.abc import MutableMapping
+from typing import Callable, Dict, List, Tuple
 from utils import NXID_COLORS, hex_to_rgb, get_chart_template, display_nxid_logo
 from config import EnhancedNXIDConfig
+from downsampling import downsample_indices, take, take_points
+from cohorts import CohortInterestTracking, cohort_interest_tracking
+from figure_cache import DEFAULT_FIGURE_CACHE, FigureRecorder, TraceSpec
 import base64
 import os
+import threading
+
+WEBGL_UNIFIED_HOVER_TRACES = 24   # Bunun üstünde 'x unified' hover kutusu okunmaz hale gelir
+WEEKLY_TRACKING_VIEWS = {'all': "Tüm haftalar", 'first': "İlk 9 hafta", 'single': "Tek hafta"}
+
+
+class LazyChartMap(MutableMapping):
+    """Grafik adı -> figür; figür ilk erişimde üretilir ve run boyunca memoize edilir
+
+    'name in charts' grafiğin bu run için mevcut olduğunu söyler (üretilmiş
+    olmasını değil). Builder'lar (callable, args) olarak tutulur - bound
+    metotlar + DataFrame'ler pickle edilebilir, st.cache_data ile uyumlu.
+    """
+
+    def __init__(self, chart_builder: Callable = None):
+        self._builders: Dict[str, Tuple[Callable, tuple]] = {}
+        self._figures: Dict[str, go.Figure] = {}
+        self._chart_builder = chart_builder     # (ad, builder, *args) -> figür, ör. figür cache'i
+        self._lock = threading.Lock()
+
+    def register(self, name: str, builder: Callable, *args):
+        """Grafiği lazy kaydet - builder(*args) ilk charts[name] erişiminde çağrılır"""
+        self._builders[name] = (builder, args)
+        self._figures.pop(name, None)
+
+    def rebind(self, name: str, *args):
+        """Kayıtlı builder'ı yeni argümanlarla (ör. UI seçimi) yeniden kaydet - figür sonraki erişimde üretilir"""
+        builder, _ = self._builders[name]
+        self.register(name, builder, *args)
+
+    def __getitem__(self, name: str) -> go.Figure:
+        figure = self._figures.get(name)
+        if figure is not None:
+            return figure
+        with self._lock:
+            if name not in self._figures:
+                builder, args = self._builders[name]
+                if self._chart_builder is not None:
+                    self._figures[name] = self._chart_builder(name, builder, *args)
+                else:
+                    self._figures[name] = builder(*args)
+            return self._figures[name]
+
+    def __setitem__(self, name: str, figure: go.Figure):
+        """Hazır figür (ör. diskten yüklenen) - builder'ı varsa yine kayıtlı kalır"""
+        self._builders.setdefault(name, (None, ()))
+        self._figures[name] = figure
+
+    def __delitem__(self, name: str):
+        del self._builders[name]
+        self._figures.pop(name, None)
+
+    def __contains__(self, name) -> bool:
+        return name in self._builders
+
+    def __iter__(self):
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def __getstate__(self):
+        return {'_builders': self._builders, '_figures': self._figures, '_chart_builder': self._chart_builder}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
 
 class EnhancedVisualizationManager:
     """Enhanced Görselleştirme Yöneticisi  - New Charts + Simplified"""
@@ -21,62 +93,359 @@ class EnhancedVisualizationManager:
     def __init__(self, config: EnhancedNXIDConfig):
         self.config = config
         self.chart_template = get_chart_template()
+        self._recording = False   # True: builder'lar FigureRecorder'a çalışır (bkz. build_chart)
+    
+    def build_chart(self, chart_id: str, builder: Callable, *args) -> go.Figure:
+        """Builder'ı kayıt modunda çalıştır - figür DEFAULT_FIGURE_CACHE'ten yeniden kullanılır / patch'lenir
+
+        Sadece data'sı değişen trace'ler güncellenir; layout değiştiyse tam kurulum.
+        """
+        self._recording = True
+        try:
+            recorded = builder(*args)
+        finally:
+            self._recording = False
+        if not isinstance(recorded, FigureRecorder):
+            return recorded
+        return DEFAULT_FIGURE_CACHE.materialize(chart_id, recorded,
+                                                finalize=self._webgl_if_dense if recorded.webgl else None)
+    
+    def _subplots(self, **kwargs):
+        """make_subplots (kayıt modunda FigureRecorder)"""
+        if self._recording:
+            return FigureRecorder(make_subplots, **kwargs)
+        return make_subplots(**kwargs)
+    
+    def _figure(self, **kwargs):
+        """go.Figure (kayıt modunda FigureRecorder)"""
+        if self._recording:
+            return FigureRecorder(go.Figure, **kwargs)
+        return go.Figure(**kwargs)
+    
+    def _downsample_index(self, x, y):
+        """Trace için korunacak indeksler (bütçe içindeyse None)"""
+        return downsample_indices(x, y, self.config.chart_max_points, self.config.chart_downsample_method)
+    
+    def _scatter(self, x, y, index=None, **kwargs) -> go.Scatter:
+        """go.Scatter + nokta bütçesi - uzun seriler downsample edilir (uçlar ve tepe / dip korunur)
+
+        index: fill='tonexty' çiftleri gibi aynı x'i paylaşması gereken trace'ler için ortak indeksler.
+        customdata / text / marker array'leri de aynı indekslerle kesilir.
+        """
+        if index is None:
+            index = self._downsample_index(x, y)
+        kwargs = take_points(kwargs, index, len(x))
+        if self._recording:
+            return TraceSpec('Scatter', x=take(x, index), y=take(y, index), **kwargs)
+        return go.Scatter(x=take(x, index), y=take(y, index), **kwargs)
+    
+    def _webgl_if_dense(self, fig: go.Figure) -> go.Figure:
+        """Yoğun figürler WebGL'e geçer - toplam Scatter noktası chart_webgl_threshold'u aşarsa Scattergl
+
+        SVG'de binlerce noktalı onlarca trace tarayıcıyı kilitler. Trace özellikleri
+        (legendgroup, hovertemplate, fill, subplot ekseni) aynen taşınır; Scattergl'de
+        olmayan bir özellik kullanan trace SVG kalır. Çok trace'li figürlerde unified
+        hover kutusu en yakın trace'e indirgenir.
+        """
+        threshold = self.config.chart_webgl_threshold
+        if isinstance(fig, FigureRecorder):
+            # Kayıt modu: karar kaydedilir, dönüşüm figür kurulurken uygulanır
+            fig.webgl = 0 < threshold < fig.n_points()
+            return fig
+        scatters = [trace for trace in fig.data if trace.type == 'scatter']
+        n_points = sum(len(trace.x) for trace in scatters if trace.x is not None)
+        if threshold <= 0 or n_points <= threshold:
+            return fig
+        
+        traces = []
+        for trace in fig.data:
+            if trace.type == 'scatter':
+                data = trace.to_plotly_json()
+                data.pop('type', None)
+                try:
+                    trace = go.Scattergl(**data)
+                except ValueError:
+                    pass
+            traces.append(trace)
+        dense = go.Figure(data=traces, layout=fig.layout)
+        if len(traces) > WEBGL_UNIFIED_HOVER_TRACES and dense.layout.hovermode == 'x unified':
+            dense.update_layout(hovermode='closest')
+        dense.update_layout(legend=dict(groupclick='togglegroup'))
+        return dense
     
     def create_enhanced_visualizations_v4(self, presale_df: pd.DataFrame, 
                                         weekly_df: pd.DataFrame,
                                         vesting_df: pd.DataFrame,
                                         mainnet_df: pd.DataFrame,
-                                        scenario: str) -> Dict[str, go.Figure]:
-        """Enhanced Görselleştirmeler  - New Charts + Simplified Maturity"""
+                                        scenario: str,
+                                        weekly_tracking: CohortInterestTracking = None) -> LazyChartMap:
+        """Enhanced Görselleştirmeler  - New Charts + Simplified Maturity
+
+        Grafikler lazy kaydedilir: her figür bölümü render edildiğinde üretilir.
+        weekly_tracking: model katmanında hesaplanmış kohort × gün faiz matrisi (yoksa grafikte hesaplanır).
+        """
         
-        charts = {}
+        charts = LazyChartMap(self.build_chart)
         
         # 1. Token dağılımı (logo ile)
-        charts['distribution'] = self._create_enhanced_distribution_pie_chart_with_logo()
+        charts.register('distribution', self._create_enhanced_distribution_pie_chart_with_logo)
         
         # 2. Enhanced vesting programı (staking pools ile)
-        charts['vesting'] = self._create_enhanced_vesting_schedule_chart(vesting_df)
+        charts.register('vesting', self._create_enhanced_vesting_schedule_chart, vesting_df)
         
         # 3. Presale temel analiz
-        charts['presale_basic'] = self._create_presale_basic_chart(presale_df)
+        charts.register('presale_basic', self._create_presale_basic_chart, presale_df)
         
         # 4. Presale USD ve Token analizi
-        charts['presale_usd_tokens'] = self._create_presale_usd_tokens_chart(presale_df)
+        charts.register('presale_usd_tokens', self._create_presale_usd_tokens_chart, presale_df)
         
         # 5. Presale APY + Staking analizi
-        charts['presale_apy'] = self._create_presale_apy_staking_analysis(presale_df)
+        charts.register('presale_apy', self._create_presale_apy_staking_analysis, presale_df)
         
         # 6. Haftalık token tracking
         if not weekly_df.empty:
-            charts['weekly_tokens'] = self._create_weekly_daily_interest_tracking(weekly_df, presale_df)
+            charts.register('weekly_tokens', self._create_weekly_daily_interest_tracking, weekly_df, presale_df,
+                            weekly_tracking)
         
         # 7. YENİ: Market Cap Evolution Analysis (maturity grafiklerinden ÖNCE)
-        charts['mcap_evolution'] = self._create_mcap_evolution_analysis_chart(mainnet_df, scenario)
+        charts.register('mcap_evolution', self._create_mcap_evolution_analysis_chart, mainnet_df, scenario)
         
         # 8. YENİ: Total Supply vs Market Cap Analysis
-        charts['total_supply_mcap'] = self._create_total_supply_mcap_analysis_chart(mainnet_df, scenario)
+        charts.register('total_supply_mcap', self._create_total_supply_mcap_analysis_chart, mainnet_df, scenario)
         
         # 9. YENİ: Separate Market Cap Analysis
-        charts['separate_mcap'] = self._create_separate_mcap_analysis_chart(mainnet_df, scenario)
+        charts.register('separate_mcap', self._create_separate_mcap_analysis_chart, mainnet_df, scenario)
         
         # 10. YENİ: Circulating Supply Analysis
-        charts['circulating_supply'] = self._create_circulating_supply_analysis_chart(mainnet_df, vesting_df)
+        charts.register('circulating_supply', self._create_circulating_supply_analysis_chart, mainnet_df, vesting_df)
         
         # 11. Enhanced mainnet market (simplified)
-        charts['mainnet_market'] = self._create_enhanced_smooth_mainnet_market_chart(mainnet_df, scenario)
+        charts.register('mainnet_market', self._create_enhanced_smooth_mainnet_market_chart, mainnet_df, scenario)
         
         # 12. Enhanced mainnet staking
-        charts['mainnet_staking'] = self._create_enhanced_mainnet_staking_chart(mainnet_df)
+        charts.register('mainnet_staking', self._create_enhanced_mainnet_staking_chart, mainnet_df)
         
         # 13. YENİ: Simplified Maturity Analysis Chart
         if self.config.enable_maturity_damping and self.config.enable_maturity_analysis:
-            charts['maturity_analysis'] = self._create_simplified_maturity_analysis_chart(mainnet_df, scenario)
+            charts.register('maturity_analysis', self._create_simplified_maturity_analysis_chart, mainnet_df, scenario)
         
         # 14. Mainnet tax & burn
-        charts['mainnet_tax_burn'] = self._create_mainnet_tax_burn_chart(mainnet_df)
+        charts.register('mainnet_tax_burn', self._create_mainnet_tax_burn_chart, mainnet_df)
         
         return charts
-    
+
+    def create_monte_carlo_bands_chart(self, mc_result, scenario: str) -> go.Figure:
+        """🎲 Monte Carlo yüzdelik bantları - McAp, fiyat ve staking oranı"""
+        panels = [
+            ('mcap_usdt', 'Market Cap (M$)', 1e6, NXID_COLORS['primary'], '$%{y:.2f}M'),
+            ('token_fiyati', 'Token Price ($)', 1, NXID_COLORS['mainnet'], '$%{y:.6f}'),
+            ('staking_orani', 'Staking Ratio (%)', 0.01, NXID_COLORS['purple'], '%{y:.1f}%'),
+        ]
+        fig = self._subplots(
+            rows=3, cols=1,
+            subplot_titles=[f'{title} - p5/p25/p50/p75/p95' for _, title, _, _, _ in panels],
+            vertical_spacing=0.08
+        )
+
+        for row, (name, title, scale, color, fmt) in enumerate(panels, start=1):
+            band = mc_result.bands[name]
+            x = band['ay']
+            # Bantlar fill ile eşleşir - panel başına ortak indeks (p5 / p50 / p95 şekilleri korunur)
+            indices = [self._downsample_index(x, band[column]) for column in ('p5', 'p50', 'p95')]
+            index = None if indices[1] is None else np.union1d(np.union1d(indices[0], indices[1]), indices[2])
+            for low, high, alpha, label in (('p5', 'p95', 0.15, 'p5-p95'), ('p25', 'p75', 0.35, 'p25-p75')):
+                fig.add_trace(
+                    self._scatter(x, band[low] / scale, index=index, line=dict(width=0), showlegend=False,
+                              legendgroup=f'{name}_{label}', hoverinfo='skip'),
+                    row=row, col=1
+                )
+                fig.add_trace(
+                    self._scatter(x, band[high] / scale, index=index, name=f'{title} {label}',
+                              line=dict(width=0), fill='tonexty', legendgroup=f'{name}_{label}',
+                              fillcolor=f"rgba{hex_to_rgb(color) + (alpha,)}",
+                              hovertemplate=f'<b>%{{x:.1f}}. Ay</b><br>{label}: {fmt}<extra></extra>'),
+                    row=row, col=1
+                )
+            fig.add_trace(
+                self._scatter(x, band['p50'] / scale, index=index, name=f'{title} Median',
+                          line=dict(color=color, width=3),
+                          hovertemplate=f'<b>%{{x:.1f}}. Ay</b><br>Median: {fmt}<extra></extra>'),
+                row=row, col=1
+            )
+            fig.update_yaxes(title_text=title, row=row, col=1)
+
+        fig.update_xaxes(title_text="Mainnet Ayı", row=3, col=1)
+
+        template_config = self.chart_template.copy()
+        template_config.update({
+            'title': dict(text=f'<b>Monte Carlo Bands - {mc_result.n_paths:,} Paths ({scenario.upper()})</b>', x=0.5,
+                        font=dict(size=24, color=NXID_COLORS['primary'])),
+            'height': 1000,
+            'hovermode': 'x unified'
+        })
+
+        fig.update_layout(**template_config)
+        return self._webgl_if_dense(fig)
+
+    def create_cohort_roi_surface_chart(self, surface, scenario: str) -> go.Figure:
+        """💹 Günlük kohort ROI yüzeyi - heatmap + kohortlar arası yüzdelik bantları"""
+        fig = self._subplots(
+            rows=2, cols=1,
+            subplot_titles=['ROI (x) by Presale Entry Day and Mainnet Month',
+                           'Cohort ROI Percentiles (p5/p50/p95, USDT-weighted median)'],
+            row_heights=[0.6, 0.4],
+            vertical_spacing=0.12
+        )
+
+        fig.add_trace(
+            go.Heatmap(x=surface.mainnet_months, y=surface.presale_days + 1, z=surface.roi,
+                      colorscale='RdYlGn', zmid=1.0, colorbar=dict(title='ROI (x)', len=0.55, y=0.75),
+                      hovertemplate='<b>Entry day %{y}</b><br>Month %{x:.1f}<br>ROI: %{z:.2f}x<extra></extra>'),
+            row=1, col=1
+        )
+
+        bands = surface.percentiles((5, 50, 95))
+        weighted = surface.percentiles((50,), weighted=True)
+        fig.add_trace(
+            go.Scatter(x=bands['ay'], y=bands['p5'], name='p5', line=dict(width=0), showlegend=False,
+                      legendgroup='roi_band', hoverinfo='skip'),
+            row=2, col=1
+        )
+        fig.add_trace(
+            go.Scatter(x=bands['ay'], y=bands['p95'], name='p5-p95', line=dict(width=0), fill='tonexty',
+                      fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['user_gains']) + (0.25,)}", legendgroup='roi_band',
+                      hovertemplate='<b>%{x:.1f}. Ay</b><br>p95: %{y:.2f}x<extra></extra>'),
+            row=2, col=1
+        )
+        fig.add_trace(
+            go.Scatter(x=bands['ay'], y=bands['p50'], name='Median ROI',
+                      line=dict(color=NXID_COLORS['user_gains'], width=3),
+                      hovertemplate='<b>%{x:.1f}. Ay</b><br>Median: %{y:.2f}x<extra></extra>'),
+            row=2, col=1
+        )
+        fig.add_trace(
+            go.Scatter(x=weighted['ay'], y=weighted['p50'], name='USDT-weighted Median',
+                      line=dict(color=NXID_COLORS['gold'], width=2, dash='dot'),
+                      hovertemplate='<b>%{x:.1f}. Ay</b><br>Weighted median: %{y:.2f}x<extra></extra>'),
+            row=2, col=1
+        )
+        fig.add_hline(y=1.0, line_dash="dash", line_color=NXID_COLORS['gray'], row=2, col=1)
+
+        fig.update_xaxes(title_text="Mainnet Ayı", row=2, col=1)
+        fig.update_yaxes(title_text="Presale Entry Day", row=1, col=1)
+        fig.update_yaxes(title_text="ROI (x)", row=2, col=1)
+
+        template_config = self.chart_template.copy()
+        template_config.update({
+            'title': dict(text=f'<b>Daily Cohort Investor ROI Surface ({scenario.upper()})</b>', x=0.5,
+                        font=dict(size=24, color=NXID_COLORS['primary'])),
+            'height': 900,
+            'hovermode': 'closest'
+        })
+
+        fig.update_layout(**template_config)
+        return fig
+
+    def create_investor_population_chart(self, population, scenario: str) -> go.Figure:
+        """👥 Yatırımcı popülasyonu - Lorenz eğrisi + yatırımcılar arası ROI bantları"""
+        metrics = population.metrics
+        fig = self._subplots(
+            rows=1, cols=2,
+            subplot_titles=[f"Token Holder Lorenz Curve (Gini {metrics['gini_katsayisi']:.3f})",
+                           'Investor ROI Percentiles over Mainnet'],
+            horizontal_spacing=0.1
+        )
+
+        population_share, holding_share = population.lorenz_curve()
+        fig.add_trace(
+            go.Scatter(x=[0, 100], y=[0, 100], name='Perfect Equality',
+                      line=dict(color=NXID_COLORS['gray'], width=1, dash='dash'), hoverinfo='skip'),
+            row=1, col=1
+        )
+        fig.add_trace(
+            go.Scatter(x=population_share * 100, y=holding_share * 100, name='Lorenz',
+                      line=dict(color=NXID_COLORS['primary'], width=3), fill='tonexty',
+                      fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['primary']) + (0.15,)}",
+                      hovertemplate='<b>Alt %{x:.1f}% holder</b><br>Token payı: %{y:.1f}%<extra></extra>'),
+            row=1, col=1
+        )
+
+        bands = population.roi_bands
+        fig.add_trace(
+            go.Scatter(x=bands['ay'], y=bands['p5'], name='p5', line=dict(width=0), showlegend=False,
+                      legendgroup='population_band', hoverinfo='skip'),
+            row=1, col=2
+        )
+        fig.add_trace(
+            go.Scatter(x=bands['ay'], y=bands['p95'], name='p5-p95', line=dict(width=0), fill='tonexty',
+                      fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['user_gains']) + (0.25,)}",
+                      legendgroup='population_band',
+                      hovertemplate='<b>%{x:.1f}. Ay</b><br>p95: %{y:.2f}x<extra></extra>'),
+            row=1, col=2
+        )
+        fig.add_trace(
+            go.Scatter(x=bands['ay'], y=bands['p50'], name='Median Investor ROI',
+                      line=dict(color=NXID_COLORS['user_gains'], width=3),
+                      hovertemplate='<b>%{x:.1f}. Ay</b><br>Median: %{y:.2f}x<extra></extra>'),
+            row=1, col=2
+        )
+        fig.add_hline(y=1.0, line_dash="dash", line_color=NXID_COLORS['gray'], row=1, col=2)
+
+        fig.update_xaxes(title_text="Holder Payı (%)", row=1, col=1)
+        fig.update_yaxes(title_text="Token Payı (%)", row=1, col=1)
+        fig.update_xaxes(title_text="Mainnet Ayı", row=1, col=2)
+        fig.update_yaxes(title_text="ROI (x)", row=1, col=2)
+
+        template_config = self.chart_template.copy()
+        template_config.update({
+            'title': dict(text=f'<b>Investor Population - {population.n_investors:,} Investors ({scenario.upper()})</b>',
+                        x=0.5, font=dict(size=24, color=NXID_COLORS['primary'])),
+            'height': 550,
+            'hovermode': 'closest'
+        })
+
+        fig.update_layout(**template_config)
+        return fig
+
+    def create_scenario_comparison_chart(self, mainnet_by_scenario: Dict[str, pd.DataFrame]) -> go.Figure:
+        """🔀 Senaryo karşılaştırması - bear / base / bull aynı eksenlerde"""
+        scenario_colors = {'bear': NXID_COLORS['danger'], 'base': NXID_COLORS['primary'],
+                           'bull': NXID_COLORS['success']}
+        panels = [
+            ('mcap_usdt', 'Market Cap (M$)', 1e6, '$%{y:.2f}M'),
+            ('token_fiyati', 'Token Price ($)', 1, '$%{y:.6f}'),
+            ('staking_orani', 'Staking Ratio (%)', 0.01, '%{y:.1f}%'),
+        ]
+        fig = self._subplots(
+            rows=3, cols=1,
+            subplot_titles=[title for _, title, _, _ in panels],
+            vertical_spacing=0.08
+        )
+
+        for row, (name, title, scale, fmt) in enumerate(panels, start=1):
+            for scenario, mainnet_df in mainnet_by_scenario.items():
+                color = scenario_colors.get(scenario, NXID_COLORS['gray'])
+                fig.add_trace(
+                    self._scatter(mainnet_df['ay'], mainnet_df[name] / scale, name=scenario.upper(),
+                              line=dict(color=color, width=3), legendgroup=scenario, showlegend=(row == 1),
+                              hovertemplate=f'<b>%{{x:.1f}}. Ay</b><br>{scenario.upper()}: {fmt}<extra></extra>'),
+                    row=row, col=1
+                )
+            fig.update_yaxes(title_text=title, row=row, col=1)
+
+        fig.update_xaxes(title_text="Mainnet Ayı", row=3, col=1)
+
+        template_config = self.chart_template.copy()
+        template_config.update({
+            'title': dict(text='<b>Scenario Comparison - ' + ' / '.join(s.upper() for s in mainnet_by_scenario) + '</b>',
+                        x=0.5, font=dict(size=24, color=NXID_COLORS['primary'])),
+            'height': 1000,
+            'hovermode': 'x unified'
+        })
+
+        fig.update_layout(**template_config)
+        return self._webgl_if_dense(fig)
+
     def _create_enhanced_distribution_pie_chart_with_logo(self) -> go.Figure:
         """Token dağılımı - NXID logo ile enhanced"""
         labels = ['Presale Tahsisi', 'Market Staking Havuzu', 'Team', 'DAO Hazinesi', 
@@ -101,7 +470,7 @@ class EnhancedVisualizationManager:
             NXID_COLORS['gold'],         # Presale staking - altın
         ]
         
-        fig = go.Figure(data=[go.Pie(
+        fig = self._figure(data=[go.Pie(
             labels=labels,
             values=values,
             hole=0.45,  # Daha büyük delik logo için
@@ -170,7 +539,7 @@ class EnhancedVisualizationManager:
             NXID_COLORS['success'] if scenario == 'bull' else NXID_COLORS['primary']
         )
         
-        fig = make_subplots(
+        fig = self._subplots(
             rows=2, cols=1,
             subplot_titles=[f'Market Cap Evolution - {scenario.upper()} Scenario', 
                            'Market Cap Components and Maturity Progress'],
@@ -180,7 +549,7 @@ class EnhancedVisualizationManager:
         
         # === 1. MARKET CAP EVOLUTION ===
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['mcap_usdt']/1e6,
+            self._scatter(mainnet_df['ay'], mainnet_df['mcap_usdt']/1e6,
                       name=f'Market Cap - {scenario.upper()} (M$)', 
                       line=dict(color=scenario_color, width=5),
                       fill='tonexty', fillcolor=f"rgba{hex_to_rgb(scenario_color) + (0.2,)}",
@@ -191,7 +560,7 @@ class EnhancedVisualizationManager:
         # Starting McAp line
         starting_mcap_line = [self.config.starting_mcap_usdt / 1e6] * len(mainnet_df)
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=starting_mcap_line,
+            self._scatter(mainnet_df['ay'], starting_mcap_line,
                       mode='lines', name=f'Starting McAp: ${self.config.starting_mcap_usdt/1e6:.1f}M',
                       line=dict(color=NXID_COLORS['accent'], width=3, dash='dash'),
                       hovertemplate=f'<b>Starting McAp</b><br>${self.config.starting_mcap_usdt/1e6:.1f}M<extra></extra>'),
@@ -203,7 +572,7 @@ class EnhancedVisualizationManager:
             maturity_target = mainnet_df['maturity_target_mcap'].iloc[0] / 1e6
             target_line = [maturity_target] * len(mainnet_df)
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=target_line,
+                self._scatter(mainnet_df['ay'], target_line,
                           mode='lines', name=f'Maturity Target: ${maturity_target:.0f}M',
                           line=dict(color=NXID_COLORS['gold'], width=4, dash='dot'),
                           hovertemplate=f'<b>Maturity Target</b><br>${maturity_target:.0f}M<extra></extra>'),
@@ -214,7 +583,7 @@ class EnhancedVisualizationManager:
         if len(mainnet_df) > 30:
             mcap_growth_rate = ((mainnet_df['mcap_usdt'] / mainnet_df['mcap_usdt'].shift(30).fillna(mainnet_df['mcap_usdt'].iloc[0])) - 1) * 100
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mcap_growth_rate,
+                self._scatter(mainnet_df['ay'], mcap_growth_rate,
                           name='Monthly Growth Rate %', 
                           line=dict(color=NXID_COLORS['orange'], width=3),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Growth: %{y:.1f}%<extra></extra>'),
@@ -225,7 +594,7 @@ class EnhancedVisualizationManager:
         # Maturity progress
         if 'maturity_progress_pct' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['maturity_progress_pct'],
+                self._scatter(mainnet_df['ay'], mainnet_df['maturity_progress_pct'],
                           name='Maturity Progress %', 
                           line=dict(color=NXID_COLORS['success'], width=4),
                           fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['success']) + (0.3,)}",
@@ -236,7 +605,7 @@ class EnhancedVisualizationManager:
         # Maturity effect multiplier
         if 'maturity_effect' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['maturity_effect'],
+                self._scatter(mainnet_df['ay'], mainnet_df['maturity_effect'],
                           name='Maturity Effect Multiplier', 
                           line=dict(color=NXID_COLORS['purple'], width=3),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Effect: %{y:.2f}x<extra></extra>'),
@@ -272,7 +641,7 @@ class EnhancedVisualizationManager:
     
     def _create_circulating_supply_analysis_chart(self, mainnet_df: pd.DataFrame, vesting_df: pd.DataFrame) -> go.Figure:
         """YENİ: Circulating Supply Analysis Chart"""
-        fig = make_subplots(
+        fig = self._subplots(
             rows=2, cols=1,
             subplot_titles=['Circulating Supply Types Comparison', 
                            'Token Burn Impact and Supply Reduction'],
@@ -282,7 +651,7 @@ class EnhancedVisualizationManager:
         
         # === 1. CIRCULATING SUPPLY TYPES ===
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['gross_circulating_supply']/1e9,
+            self._scatter(mainnet_df['ay'], mainnet_df['gross_circulating_supply']/1e9,
                       name='Gross Circulating Supply (B)', 
                       line=dict(color=NXID_COLORS['primary'], width=4),
                       fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['primary']) + (0.2,)}",
@@ -291,7 +660,7 @@ class EnhancedVisualizationManager:
         )
         
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['effective_circulating_supply']/1e9,
+            self._scatter(mainnet_df['ay'], mainnet_df['effective_circulating_supply']/1e9,
                       name='Effective Circulating Supply (B)', 
                       line=dict(color=NXID_COLORS['success'], width=4),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Effective: %{y:.1f}B NXID<extra></extra>'),
@@ -301,7 +670,7 @@ class EnhancedVisualizationManager:
         # Staked tokens (removed from effective)
         if 'kumulatif_staked' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['kumulatif_staked']/1e9,
+                self._scatter(mainnet_df['ay'], mainnet_df['kumulatif_staked']/1e9,
                           name='Staked Tokens (B)', 
                           line=dict(color=NXID_COLORS['teal'], width=3, dash='dot'),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Staked: %{y:.1f}B NXID<extra></extra>'),
@@ -311,7 +680,7 @@ class EnhancedVisualizationManager:
         # Supply efficiency ratio
         supply_efficiency = (mainnet_df['effective_circulating_supply'] / mainnet_df['gross_circulating_supply'] * 100)
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=supply_efficiency,
+            self._scatter(mainnet_df['ay'], supply_efficiency,
                       name='Supply Efficiency %', 
                       line=dict(color=NXID_COLORS['orange'], width=3),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Efficiency: %{y:.1f}%<extra></extra>'),
@@ -320,7 +689,7 @@ class EnhancedVisualizationManager:
         
         # === 2. BURN IMPACT ===
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['toplam_burned']/1e6,
+            self._scatter(mainnet_df['ay'], mainnet_df['toplam_burned']/1e6,
                       name='Total Burned Tokens (M)', 
                       line=dict(color=NXID_COLORS['burn'], width=5),
                       fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['burn']) + (0.3,)}",
@@ -331,7 +700,7 @@ class EnhancedVisualizationManager:
         # Tax burned vs routine burned
         if 'kumulatif_tax_burned' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['kumulatif_tax_burned']/1e6,
+                self._scatter(mainnet_df['ay'], mainnet_df['kumulatif_tax_burned']/1e6,
                           name='Tax Burned (M)', 
                           line=dict(color=NXID_COLORS['tax'], width=3),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Tax Burn: %{y:.1f}M NXID<extra></extra>'),
@@ -339,7 +708,7 @@ class EnhancedVisualizationManager:
             )
         
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['kumulatif_rutin_burned']/1e6,
+            self._scatter(mainnet_df['ay'], mainnet_df['kumulatif_rutin_burned']/1e6,
                       name='Routine Burned (M)', 
                       line=dict(color=NXID_COLORS['orange'], width=3),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Routine Burn: %{y:.1f}M NXID<extra></extra>'),
@@ -348,7 +717,7 @@ class EnhancedVisualizationManager:
         
         # Burn percentage of total supply
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['burn_orani_yuzdesi'],
+            self._scatter(mainnet_df['ay'], mainnet_df['burn_orani_yuzdesi'],
                       name='Burn % of Total Supply', 
                       line=dict(color=NXID_COLORS['danger'], width=4),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Burned: %{y:.2f}% of supply<extra></extra>'),
@@ -378,7 +747,7 @@ class EnhancedVisualizationManager:
             NXID_COLORS['success'] if scenario == 'bull' else NXID_COLORS['primary']
         )
         
-        fig = make_subplots(
+        fig = self._subplots(
             rows=2, cols=1,
             subplot_titles=['Simplified Maturity Progress and Target Distance', 
                            'Maturity Boost/Damp Effect Over Time'],
@@ -389,7 +758,7 @@ class EnhancedVisualizationManager:
         # === 1. MATURITY PROGRESS ===
         if 'maturity_progress_pct' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['maturity_progress_pct'],
+                self._scatter(mainnet_df['ay'], mainnet_df['maturity_progress_pct'],
                           name='Maturity Progress %', 
                           line=dict(color=NXID_COLORS['success'], width=5),
                           fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['success']) + (0.3,)}",
@@ -411,7 +780,7 @@ class EnhancedVisualizationManager:
         if 'maturity_distance_ratio' in mainnet_df.columns:
             distance_pct = (mainnet_df['maturity_distance_ratio'] - 1.0) * 100
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=distance_pct,
+                self._scatter(mainnet_df['ay'], distance_pct,
                           name='Distance from Target %', 
                           line=dict(color=NXID_COLORS['orange'], width=3),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Distance: %{y:.1f}%<extra></extra>'),
@@ -431,7 +800,7 @@ class EnhancedVisualizationManager:
         # === 2. MATURITY EFFECT ===
         if 'maturity_effect' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['maturity_effect'],
+                self._scatter(mainnet_df['ay'], mainnet_df['maturity_effect'],
                           name='Maturity Effect Multiplier', 
                           line=dict(color=NXID_COLORS['purple'], width=5),
                           fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['purple']) + (0.2,)}",
@@ -468,7 +837,7 @@ class EnhancedVisualizationManager:
         # Current vs target McAp
         if 'maturity_target_mcap' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['mcap_usdt']/mainnet_df['maturity_target_mcap'],
+                self._scatter(mainnet_df['ay'], mainnet_df['mcap_usdt']/mainnet_df['maturity_target_mcap'],
                           name='Current/Target Ratio', 
                           line=dict(color=scenario_color, width=3),
                           hovertemplate=f'<b>%{{x:.1f}}. Ay</b><br>Ratio: %{{y:.2f}}<br>{scenario.upper()}<extra></extra>'),
@@ -494,7 +863,7 @@ class EnhancedVisualizationManager:
     
     def _create_enhanced_vesting_schedule_chart(self, vesting_df: pd.DataFrame) -> go.Figure:
         """Enhanced vesting programı - staking pools dahil"""
-        fig = make_subplots(
+        fig = self._subplots(
             rows=2, cols=1,
             subplot_titles=['Token Release Schedule (Including Staking Pools)', 
                            'Circulating Supply Growth'],
@@ -637,7 +1006,7 @@ class EnhancedVisualizationManager:
             NXID_COLORS['success'] if scenario == 'bull' else NXID_COLORS['primary']
         )
         
-        fig = make_subplots(
+        fig = self._subplots(
             rows=3, cols=1,
             subplot_titles=[f'Smooth Token Fiyat - {scenario.upper()} + Simplified Maturity', 
                            f'Enhanced Market Dynamics - 16 Çeyrek',
@@ -648,7 +1017,7 @@ class EnhancedVisualizationManager:
         
         # === 1. SMOOTH FİYAT ===
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['token_fiyati'],
+            self._scatter(mainnet_df['ay'], mainnet_df['token_fiyati'],
                       name=f'Smooth Token Fiyatı - {scenario.upper()}', 
                       line=dict(color=scenario_color, width=4),
                       fill='tonexty', fillcolor=f"rgba{hex_to_rgb(scenario_color) + (0.2,)}",
@@ -659,7 +1028,7 @@ class EnhancedVisualizationManager:
         # Moving average line
         if 'price_moving_average' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['price_moving_average'],
+                self._scatter(mainnet_df['ay'], mainnet_df['price_moving_average'],
                           name='Price Moving Average', 
                           line=dict(color=NXID_COLORS['accent'], width=2, dash='dot'),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>MA Fiyat: $%{y:.6f}<extra></extra>'),
@@ -668,7 +1037,7 @@ class EnhancedVisualizationManager:
         
         # Presale karşılaştırması
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['presale_fiyat_orani'],
+            self._scatter(mainnet_df['ay'], mainnet_df['presale_fiyat_orani'],
                       name='Presale Fiyat Oranı (x)', 
                       line=dict(color=NXID_COLORS['gold'], width=3),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Presale\'e Göre: %{y:.1f}x<extra></extra>'),
@@ -678,7 +1047,7 @@ class EnhancedVisualizationManager:
         # === 2. MARKET DYNAMICS ===
         # Temelli büyüme
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['temelli_buyume'],
+            self._scatter(mainnet_df['ay'], mainnet_df['temelli_buyume'],
                       name='Fundamental Growth', 
                       line=dict(color=NXID_COLORS['success'], width=3),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Fundamental: %{y:.2f}x<extra></extra>'),
@@ -687,7 +1056,7 @@ class EnhancedVisualizationManager:
         
         # Spekülatif büyüme
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['spekulatif_buyume'],
+            self._scatter(mainnet_df['ay'], mainnet_df['spekulatif_buyume'],
                       name='Speculative Growth', 
                       line=dict(color=NXID_COLORS['orange'], width=3),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Speculative: %{y:.2f}x<extra></extra>'),
@@ -697,7 +1066,7 @@ class EnhancedVisualizationManager:
         # Maturity effect
         if 'maturity_effect' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['maturity_effect'],
+                self._scatter(mainnet_df['ay'], mainnet_df['maturity_effect'],
                           name='Simplified Maturity Effect', 
                           line=dict(color=NXID_COLORS['purple'], width=4),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Maturity: %{y:.2f}x<extra></extra>'),
@@ -707,7 +1076,7 @@ class EnhancedVisualizationManager:
         # === 3. REDUCED VOLATILITY FACTORS ===
         # Çeyrek çarpanları
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['ceyrek_carpani'],
+            self._scatter(mainnet_df['ay'], mainnet_df['ceyrek_carpani'],
                       name='Çeyrek Çarpanı', 
                       line=dict(color=NXID_COLORS['teal'], width=3),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Çarpan: %{y:.2f}x<br>Çeyrek: %{customdata}<extra></extra>',
@@ -717,7 +1086,7 @@ class EnhancedVisualizationManager:
         
         # Reduced volatilite etkisi
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['volatilite_etkisi'],
+            self._scatter(mainnet_df['ay'], mainnet_df['volatilite_etkisi'],
                       name='Reduced Volatilite Etkisi', 
                       line=dict(color=NXID_COLORS['orange'], width=2),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Volatilite: %{y:.3f}<extra></extra>'),
@@ -727,7 +1096,7 @@ class EnhancedVisualizationManager:
         # Market beta
         if 'market_beta' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['market_beta'],
+                self._scatter(mainnet_df['ay'], mainnet_df['market_beta'],
                           name='Market Beta', 
                           line=dict(color=NXID_COLORS['pink'], width=2, dash='dot'),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Beta: %{y:.2f}<extra></extra>'),
@@ -751,11 +1120,11 @@ class EnhancedVisualizationManager:
         })
         
         fig.update_layout(**template_config)
-        return fig
+        return self._webgl_if_dense(fig)
     
     def _create_enhanced_mainnet_staking_chart(self, mainnet_df: pd.DataFrame) -> go.Figure:
         """Enhanced mainnet staking chart - smooth ile"""
-        fig = make_subplots(
+        fig = self._subplots(
             rows=2, cols=1,
             subplot_titles=['Smooth Price-Sensitive Staking Dynamics', 
                            'Enhanced Staking Rewards ve APY Evolution'],
@@ -765,7 +1134,7 @@ class EnhancedVisualizationManager:
         
         # === 1. SMOOTH STAKING DYNAMİCS ===
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['staking_orani']*100,
+            self._scatter(mainnet_df['ay'], mainnet_df['staking_orani']*100,
                       name='Smooth Staking Ratio %', 
                       line=dict(color=NXID_COLORS['teal'], width=4),
                       fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['teal']) + (0.3,)}",
@@ -776,7 +1145,7 @@ class EnhancedVisualizationManager:
         # Smooth staking moving average
         if 'staking_moving_average' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['staking_moving_average']*100,
+                self._scatter(mainnet_df['ay'], mainnet_df['staking_moving_average']*100,
                           name='Staking MA %', 
                           line=dict(color=NXID_COLORS['accent'], width=2, dash='dot'),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Staking MA: %{y:.1f}%<extra></extra>'),
@@ -785,7 +1154,7 @@ class EnhancedVisualizationManager:
         
         # Token fiyatı (smooth)
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['token_fiyati'],
+            self._scatter(mainnet_df['ay'], mainnet_df['token_fiyati'],
                       name='Smooth Token Price ($)', 
                       line=dict(color=NXID_COLORS['primary'], width=3),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>Fiyat: $%{y:.6f}<extra></extra>'),
@@ -795,7 +1164,7 @@ class EnhancedVisualizationManager:
         # Price velocity effect
         if 'velocity_effect' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['velocity_effect'],
+                self._scatter(mainnet_df['ay'], mainnet_df['velocity_effect'],
                           name='Price Velocity Effect', 
                           line=dict(color=NXID_COLORS['orange'], width=2),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Velocity Effect: %{y:.2f}x<extra></extra>'),
@@ -804,7 +1173,7 @@ class EnhancedVisualizationManager:
         
         # === 2. STAKING REWARDS ===
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['dagitilan_staking_odul']/1e9,
+            self._scatter(mainnet_df['ay'], mainnet_df['dagitilan_staking_odul']/1e9,
                       name='Distributed Staking Rewards (B)', 
                       line=dict(color=NXID_COLORS['success'], width=4),
                       fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['success']) + (0.3,)}",
@@ -814,7 +1183,7 @@ class EnhancedVisualizationManager:
         
         # Market APY (smooth)
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['guncel_market_apy'],
+            self._scatter(mainnet_df['ay'], mainnet_df['guncel_market_apy'],
                       name='Smooth Market APY %', 
                       line=dict(color=NXID_COLORS['gold'], width=3),
                       hovertemplate='<b>%{x:.1f}. Ay</b><br>APY: %{y:.1f}%<extra></extra>'),
@@ -824,7 +1193,7 @@ class EnhancedVisualizationManager:
         # Staked token amount
         if 'kumulatif_staked' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['kumulatif_staked']/1e9,
+                self._scatter(mainnet_df['ay'], mainnet_df['kumulatif_staked']/1e9,
                           name='Staked Tokens (B)', 
                           line=dict(color=NXID_COLORS['purple'], width=2, dash='dot'),
                           hovertemplate='<b>%{x:.1f}. Ay</b><br>Staked: %{y:.1f}B NXID<extra></extra>'),
@@ -846,11 +1215,11 @@ class EnhancedVisualizationManager:
         })
         
         fig.update_layout(**template_config)
-        return fig
+        return self._webgl_if_dense(fig)
     
     def _create_presale_basic_chart(self, presale_df: pd.DataFrame) -> go.Figure:
         """Presale temel analiz"""
-        fig = make_subplots(
+        fig = self._subplots(
             rows=1, cols=1,
             specs=[[{"secondary_y": True}]],
         )
@@ -888,7 +1257,7 @@ class EnhancedVisualizationManager:
     
     def _create_presale_usd_tokens_chart(self, presale_df: pd.DataFrame) -> go.Figure:
         """USD ve Token satış analizi"""
-        fig = make_subplots(
+        fig = self._subplots(
             rows=1, cols=1,
             specs=[[{"secondary_y": True}]],
         )
@@ -935,7 +1304,7 @@ class EnhancedVisualizationManager:
     
     def _create_presale_apy_staking_analysis(self, presale_df: pd.DataFrame) -> go.Figure:
         """APY + Staking analizi - Enhanced """
-        fig = make_subplots(
+        fig = self._subplots(
             rows=3, cols=1,
             subplot_titles=['Dynamic APY Performance', 
                            'Staking Pool Status',
@@ -1017,70 +1386,30 @@ class EnhancedVisualizationManager:
         fig.update_layout(**template_config)
         return fig
     
-    def _create_weekly_daily_interest_tracking(self, weekly_df: pd.DataFrame, presale_df: pd.DataFrame) -> go.Figure:
-        """Haftalık tracking - Enhanced """
-        import streamlit as st
-        
-        if 'show_all_weeks' not in st.session_state:
-            st.session_state.show_all_weeks = True
-        if 'single_week_mode' not in st.session_state:
-            st.session_state.single_week_mode = False
-        if 'selected_week' not in st.session_state:
-            st.session_state.selected_week = 1
-        
-        # Haftalık tracking logic
-        daily_tracking_data = []
-        
-        for _, week_row in weekly_df.iterrows():
-            week = int(week_row['hafta'])
-            week_start_day = (week - 1) * 7 + 1
-            investment_amount = week_row['yatirim_miktari_usdt']
-            week_price = week_row['hafta_fiyati']
-            week_apy = week_row['hafta_apy']
-            principal_tokens = investment_amount / week_price
-            
-            weekly_daily_data = {
-                'week': week,
-                'week_apy': week_apy,
-                'principal': principal_tokens,
-                'daily_interest': [],
-                'cumulative_interest': [],
-                'total_balance': [],
-                'interest_percentage': [],
-                'days': []
-            }
-            
-            cumulative_interest = 0
-            
-            for day_offset in range(week_start_day, len(presale_df) + 1):
-                if day_offset <= len(presale_df):
-                    day_apy = presale_df.iloc[day_offset-1]['guncel_apy']
-                    daily_rate = day_apy / 100 / 365
-                    daily_interest = principal_tokens * daily_rate
-                    cumulative_interest += daily_interest
-                    total_balance = principal_tokens + cumulative_interest
-                    interest_percentage = (cumulative_interest / principal_tokens * 100) if principal_tokens > 0 else 0
-                    
-                    weekly_daily_data['daily_interest'].append(daily_interest)
-                    weekly_daily_data['cumulative_interest'].append(cumulative_interest)
-                    weekly_daily_data['total_balance'].append(total_balance)
-                    weekly_daily_data['interest_percentage'].append(interest_percentage)
-                    weekly_daily_data['days'].append(day_offset)
-            
-            daily_tracking_data.append(weekly_daily_data)
-        
-        # Hafta seçimi ve chart oluşturma logic
-        if st.session_state.single_week_mode and st.session_state.selected_week:
-            weeks_to_show = [w for w in daily_tracking_data if w['week'] == st.session_state.selected_week]
-            title_suffix = f" - Only Week {st.session_state.selected_week} (APY: {weeks_to_show[0]['week_apy']:.1f}%)" if weeks_to_show else ""
-        elif st.session_state.show_all_weeks:
-            weeks_to_show = daily_tracking_data
-            title_suffix = f" - All {len(daily_tracking_data)} Weeks"
+    def _create_weekly_daily_interest_tracking(self, weekly_df: pd.DataFrame, presale_df: pd.DataFrame,
+                                               tracking: CohortInterestTracking = None, week_view: str = 'all',
+                                               selected_week: int = None) -> go.Figure:
+        """Haftalık tracking - Enhanced
+
+        week_view: WEEKLY_TRACKING_VIEWS anahtarı ('single' ise selected_week gösterilir).
+        """
+        # Haftalık tracking - kohort × gün matrisi model katmanından (bkz. cohorts.cohort_interest_tracking)
+        if tracking is None:
+            tracking = cohort_interest_tracking(presale_df, weekly_df, self.config)
+        single_week_mode = week_view == 'single' and selected_week is not None
+        
+        # Hafta seçimi sadece matris satırlarını dilimler
+        if single_week_mode:
+            rows = tracking.select(weeks=[selected_week])
+            title_suffix = f" - Only Week {selected_week} (APY: {tracking.week_apy[rows[0]]:.1f}%)" if len(rows) else ""
+        elif week_view == 'all':
+            rows = tracking.select()
+            title_suffix = f" - All {len(tracking.weeks)} Weeks"
         else:
-            weeks_to_show = daily_tracking_data[:9]
-            title_suffix = f" - First {min(9, len(daily_tracking_data))} Weeks"
+            rows = tracking.select(limit=9)
+            title_suffix = f" - First {min(9, len(tracking.weeks))} Weeks"
         
-        fig = make_subplots(
+        fig = self._subplots(
             rows=2, cols=2,
             subplot_titles=['Daily Interest Gain', 'Cumulative Interest Gain', 
                         'Total Balance', 'Interest Gain Percentage'],
@@ -1100,9 +1429,10 @@ class EnhancedVisualizationManager:
             '#FF9FF3', '#54A0FF', '#5F27CD', '#00D2D3', '#FF9F43', '#EE5A24'
         ]
         
-        for i, week_data in enumerate(weeks_to_show):
-            week = week_data['week']
-            week_apy = week_data['week_apy']
+        for i, row in enumerate(rows):
+            week = int(tracking.weeks[row])
+            week_apy = tracking.week_apy[row]
+            week_data = tracking.cohort(row)
             color_idx = (week - 1) % len(week_colors)
             color = week_colors[color_idx]
             
@@ -1115,7 +1445,7 @@ class EnhancedVisualizationManager:
                 y=week_data['daily_interest'],
                 mode='lines',
                 name=f'Week {week} (APY: {week_apy:.1f}%)',
-                line=dict(color=color, width=3 if st.session_state.single_week_mode else 2),
+                line=dict(color=color, width=3 if single_week_mode else 2),
                 hovertemplate=f'<b>Week {week} (APY: {week_apy:.1f}%)</b><br>Day: %{{x}}<br>Daily Interest: %{{y:,.0f}} NXID<extra></extra>',
                 showlegend=show_legend,
                 legendgroup=legend_group
@@ -1126,7 +1456,7 @@ class EnhancedVisualizationManager:
                 y=week_data['cumulative_interest'],
                 mode='lines',
                 name=f'Week {week} Cumulative',
-                line=dict(color=color, width=3 if st.session_state.single_week_mode else 2),
+                line=dict(color=color, width=3 if single_week_mode else 2),
                 hovertemplate=f'<b>Week {week} (APY: {week_apy:.1f}%)</b><br>Day: %{{x}}<br>Total Interest: %{{y:,.0f}} NXID<extra></extra>',
                 showlegend=False,
                 legendgroup=legend_group
@@ -1137,7 +1467,7 @@ class EnhancedVisualizationManager:
                 y=week_data['total_balance'],
                 mode='lines',
                 name=f'Week {week} Balance',
-                line=dict(color=color, width=3 if st.session_state.single_week_mode else 2),
+                line=dict(color=color, width=3 if single_week_mode else 2),
                 hovertemplate=f'<b>Week {week} (APY: {week_apy:.1f}%)</b><br>Day: %{{x}}<br>Total: %{{y:,.0f}} NXID<extra></extra>',
                 showlegend=False,
                 legendgroup=legend_group
@@ -1148,7 +1478,7 @@ class EnhancedVisualizationManager:
                 y=week_data['interest_percentage'],
                 mode='lines',
                 name=f'Week {week} %',
-                line=dict(color=color, width=3 if st.session_state.single_week_mode else 2),
+                line=dict(color=color, width=3 if single_week_mode else 2),
                 hovertemplate=f'<b>Week {week} (APY: {week_apy:.1f}%)</b><br>Day: %{{x}}<br>Interest: %{{y:.1f}}%<extra></extra>',
                 showlegend=False,
                 legendgroup=legend_group
@@ -1163,7 +1493,7 @@ class EnhancedVisualizationManager:
         
         template_config = self.chart_template.copy()
         
-        if st.session_state.single_week_mode:
+        if single_week_mode:
             legend_config = dict(
                 orientation="h",
                 yanchor="top",
@@ -1195,11 +1525,11 @@ class EnhancedVisualizationManager:
         
         fig.update_layout(**template_config)
         
-        return fig
+        return self._webgl_if_dense(fig)
     
     def _create_mainnet_tax_burn_chart(self, mainnet_df: pd.DataFrame) -> go.Figure:
         """Tax & burn chart - Enhanced """
-        fig = make_subplots(
+        fig = self._subplots(
             rows=2, cols=1,
             subplot_titles=['Tax Collection and Distribution', 
                            'Token Burn Analysis'],
@@ -1209,7 +1539,7 @@ class EnhancedVisualizationManager:
         
         if 'kumulatif_tax_toplam' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['kumulatif_tax_toplam']/1e6,
+                self._scatter(mainnet_df['ay'], mainnet_df['kumulatif_tax_toplam']/1e6,
                           name='Collected Tax (M)', 
                           line=dict(color=NXID_COLORS['tax'], width=5),
                           fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['tax']) + (0.2,)}",
@@ -1218,7 +1548,7 @@ class EnhancedVisualizationManager:
             )
             
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['kumulatif_tax_staking']/1e6,
+                self._scatter(mainnet_df['ay'], mainnet_df['kumulatif_tax_staking']/1e6,
                           name='Tax→Staking (M)', 
                           line=dict(color=NXID_COLORS['success'], width=4),
                           hovertemplate='<b>Month %{x:.1f}</b><br>To Staking: %{y:.1f}M NXID<extra></extra>'),
@@ -1226,7 +1556,7 @@ class EnhancedVisualizationManager:
             )
         
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['kumulatif_rutin_burned']/1e6,
+            self._scatter(mainnet_df['ay'], mainnet_df['kumulatif_rutin_burned']/1e6,
                       name='Routine Burn (M)', 
                       line=dict(color=NXID_COLORS['burn'], width=5),
                       fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['burn']) + (0.2,)}",
@@ -1236,7 +1566,7 @@ class EnhancedVisualizationManager:
         
         if 'kumulatif_tax_burned' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['kumulatif_tax_burned']/1e6,
+                self._scatter(mainnet_df['ay'], mainnet_df['kumulatif_tax_burned']/1e6,
                           name='Tax Burn (M)', 
                           line=dict(color=NXID_COLORS['orange'], width=4),
                           hovertemplate='<b>Month %{x:.1f}</b><br>Tax Burn: %{y:.1f}M NXID<extra></extra>'),
@@ -1244,7 +1574,7 @@ class EnhancedVisualizationManager:
             )
         
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['burn_orani_yuzdesi'],
+            self._scatter(mainnet_df['ay'], mainnet_df['burn_orani_yuzdesi'],
                       name='Total Burn %', 
                       line=dict(color=NXID_COLORS['danger'], width=4),
                       hovertemplate='<b>Month %{x:.1f}</b><br>Burned: %{y:.2f}%<extra></extra>'),
@@ -1274,7 +1604,7 @@ class EnhancedVisualizationManager:
             NXID_COLORS['success'] if scenario == 'bull' else NXID_COLORS['primary']
         )
         
-        fig = make_subplots(
+        fig = self._subplots(
             rows=2, cols=1,
             subplot_titles=[f'Market Cap Evrim Analizi - {scenario.upper()}', 
                         'Market Cap Büyüme Oranları ve Hedefler'],
@@ -1284,7 +1614,7 @@ class EnhancedVisualizationManager:
         
         # === 1. MARKET CAP EVRİMİ ===
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['mcap_usdt']/1e6,
+            self._scatter(mainnet_df['ay'], mainnet_df['mcap_usdt']/1e6,
                     name=f'Market Cap - {scenario.upper()} (M$)', 
                     line=dict(color=scenario_color, width=5),
                     fill='tonexty', fillcolor=f"rgba{hex_to_rgb(scenario_color) + (0.2,)}",
@@ -1295,7 +1625,7 @@ class EnhancedVisualizationManager:
         # Başlangıç McAp çizgisi
         starting_mcap_line = [self.config.starting_mcap_usdt / 1e6] * len(mainnet_df)
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=starting_mcap_line,
+            self._scatter(mainnet_df['ay'], starting_mcap_line,
                     mode='lines', name=f'Başlangıç McAp: ${self.config.starting_mcap_usdt/1e6:.1f}M',
                     line=dict(color=NXID_COLORS['accent'], width=3, dash='dash'),
                     hovertemplate=f'<b>Başlangıç McAp</b><br>${self.config.starting_mcap_usdt/1e6:.1f}M<extra></extra>'),
@@ -1307,7 +1637,7 @@ class EnhancedVisualizationManager:
             target_mcap = mainnet_df['maturity_target_mcap'].iloc[0] / 1e6
             target_line = [target_mcap] * len(mainnet_df)
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=target_line,
+                self._scatter(mainnet_df['ay'], target_line,
                         mode='lines', name=f'Hedef McAp: ${target_mcap:.0f}M',
                         line=dict(color=NXID_COLORS['gold'], width=4, dash='dot'),
                         hovertemplate=f'<b>Hedef McAp</b><br>${target_mcap:.0f}M<extra></extra>'),
@@ -1318,7 +1648,7 @@ class EnhancedVisualizationManager:
         if len(mainnet_df) > 30:
             mcap_growth_rate = ((mainnet_df['mcap_usdt'] / mainnet_df['mcap_usdt'].shift(30).fillna(mainnet_df['mcap_usdt'].iloc[0])) - 1) * 100
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mcap_growth_rate,
+                self._scatter(mainnet_df['ay'], mcap_growth_rate,
                         name='Aylık Büyüme Oranı %', 
                         line=dict(color=NXID_COLORS['orange'], width=3),
                         hovertemplate='<b>%{x:.1f}. Ay</b><br>Büyüme: %{y:.1f}%<extra></extra>'),
@@ -1329,7 +1659,7 @@ class EnhancedVisualizationManager:
         # Kümülatif büyüme
         cumulative_growth = ((mainnet_df['mcap_usdt'] / mainnet_df['mcap_usdt'].iloc[0]) - 1) * 100
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=cumulative_growth,
+            self._scatter(mainnet_df['ay'], cumulative_growth,
                     name='Kümülatif Büyüme %', 
                     line=dict(color=NXID_COLORS['success'], width=4),
                     fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['success']) + (0.3,)}",
@@ -1340,7 +1670,7 @@ class EnhancedVisualizationManager:
         # Hedef ilerleme
         if 'maturity_progress_pct' in mainnet_df.columns:
             fig.add_trace(
-                go.Scatter(x=mainnet_df['ay'], y=mainnet_df['maturity_progress_pct'],
+                self._scatter(mainnet_df['ay'], mainnet_df['maturity_progress_pct'],
                         name='Hedef İlerleme %', 
                         line=dict(color=NXID_COLORS['purple'], width=3),
                         hovertemplate='<b>%{x:.1f}. Ay</b><br>Hedef: %{y:.1f}%<extra></extra>'),
@@ -1379,7 +1709,7 @@ class EnhancedVisualizationManager:
             NXID_COLORS['success'] if scenario == 'bull' else NXID_COLORS['primary']
         )
         
-        fig = make_subplots(
+        fig = self._subplots(
             rows=2, cols=1,
             subplot_titles=['Toplam Arz vs Market Cap Analizi', 
                         'Token Fiyatı ve Arz Etkileşimi'],
@@ -1390,7 +1720,7 @@ class EnhancedVisualizationManager:
         # === 1. SUPPLY VS MCAP ===
         # Market Cap
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['mcap_usdt']/1e6,
+            self._scatter(mainnet_df['ay'], mainnet_df['mcap_usdt']/1e6,
                     name=f'Market Cap (M$) - {scenario.upper()}', 
                     line=dict(color=scenario_color, width=5),
                     fill='tonexty', fillcolor=f"rgba{hex_to_rgb(scenario_color) + (0.2,)}",
@@ -1401,7 +1731,7 @@ class EnhancedVisualizationManager:
         # Etkili Toplam Arz
         effective_total_supply = mainnet_df['etkili_toplam_arz'] / 1e9
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=effective_total_supply,
+            self._scatter(mainnet_df['ay'], effective_total_supply,
                     name='Etkili Toplam Arz (B)', 
                     line=dict(color=NXID_COLORS['purple'], width=4),
                     hovertemplate='<b>%{x:.1f}. Ay</b><br>Etkili Arz: %{y:.1f}B NXID<extra></extra>'),
@@ -1411,7 +1741,7 @@ class EnhancedVisualizationManager:
         # Başlangıç toplam arz çizgisi
         initial_supply_line = [self.config.total_supply / 1e9] * len(mainnet_df)
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=initial_supply_line,
+            self._scatter(mainnet_df['ay'], initial_supply_line,
                     mode='lines', name=f'Başlangıç Toplam Arz: {self.config.total_supply/1e9:.0f}B',
                     line=dict(color=NXID_COLORS['accent'], width=2, dash='dash'),
                     hovertemplate=f'<b>Başlangıç Arz</b><br>{self.config.total_supply/1e9:.0f}B NXID<extra></extra>'),
@@ -1421,7 +1751,7 @@ class EnhancedVisualizationManager:
         # === 2. TOKEN FİYAT ANALİZİ ===
         # Token fiyatı
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['token_fiyati'],
+            self._scatter(mainnet_df['ay'], mainnet_df['token_fiyati'],
                     name='Token Fiyatı ($)', 
                     line=dict(color=NXID_COLORS['gold'], width=5),
                     fill='tonexty', fillcolor=f"rgba{hex_to_rgb(NXID_COLORS['gold']) + (0.2,)}",
@@ -1431,7 +1761,7 @@ class EnhancedVisualizationManager:
         
         # Etkili dolaşımdaki arz
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['effective_circulating_supply']/1e9,
+            self._scatter(mainnet_df['ay'], mainnet_df['effective_circulating_supply']/1e9,
                     name='Etkili Dolaşım Arzı (B)', 
                     line=dict(color=NXID_COLORS['teal'], width=4),
                     hovertemplate='<b>%{x:.1f}. Ay</b><br>Etkili Dolaşım: %{y:.1f}B NXID<extra></extra>'),
@@ -1440,7 +1770,7 @@ class EnhancedVisualizationManager:
         
         # Gross dolaşımdaki arz
         fig.add_trace(
-            go.Scatter(x=mainnet_df['ay'], y=mainnet_df['gross_circulating_supply']/1e9,
+            self._scatter(mainnet_df['ay'], mainnet_df['gross_circulating_supply']/1e9,
                     name='Brüt Dolaşım Arzı (B)', 
                     line=dict(color=NXID_COLORS['primary'], width=3, dash='dot'),
                     hovertemplate='<b>%{x:.1f}. Ay</b><br>Brüt Dolaşım: %{y:.1f}B NXID<extra></extra>'),